@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from gbkviz.align_coord import TSV_COLUMNS, AlignCoord
+
+# Process-wide LRU cache of genome fasta file digests, keyed by file stat
+_FILE_DIGEST_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_FILE_DIGEST_CACHE_MAX_NUM = 1024
+_FILE_DIGEST_CACHE_LOCK = threading.Lock()
+
+# Temporary files older than TTL[s] are regarded as left by died processes
+_TMP_FILE_TTL = 3600
+
+
+class AlignCache:
+    """Persistent Content-Addressed Genome Alignment Cache Class
+
+    Parsed alignment coords of each genome pair are stored as TSV file named by
+    hash of genome fasta contents and alignment options. TSV file starts with
+    sequence type line, followed by align coords TSV with column names header.
+    Least recently used cache files are evicted when total cache size exceeds
+    max size.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size: int = 500 * 1024 * 1024,
+    ):
+        """AlignCache constructor
+
+        Args:
+            cache_dir (Union[str, Path]): Cache directory
+            max_size (int, optional): Max total cache file size (Default: 500MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, seqtype: str = "nucleotide") -> Optional[List[AlignCoord]]:
+        """Get cached align coords
+
+        Args:
+            key (str): Cache key
+            seqtype (str, optional): Sequence type ('nucleotide' or 'protein')
+
+        Returns:
+            Optional[List[AlignCoord]]: Align coords (None if not cached or cached
+                in other sequence type or format)
+        """
+        cache_file = self._cache_file(key)
+        try:
+            # Update last access time for LRU eviction
+            os.utime(cache_file)
+            with open(cache_file) as f:
+                if f.readline() != _seqtype_line(seqtype):
+                    return None
+                return AlignCoord.parse_tsv_stream(f, str(cache_file))
+        except FileNotFoundError:
+            return None
+
+    def set(
+        self, key: str, align_coords: List[AlignCoord], seqtype: str = "nucleotide"
+    ) -> None:
+        """Set align coords to cache
+
+        Args:
+            key (str): Cache key
+            align_coords (List[AlignCoord]): Align coords
+            seqtype (str, optional): Sequence type ('nucleotide' or 'protein')
+        """
+        # Write to temporary file & rename for concurrent access from processes
+        fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(_seqtype_line(seqtype))
+            f.write("\t".join(TSV_COLUMNS) + "\n")
+            for ac in align_coords:
+                f.write(ac.as_tsv_format + "\n")
+        os.replace(tmp_file, self._cache_file(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Evict least recently used cache files until size is within max size
+
+        Stale temporary files left by processes died before rename are also removed.
+        """
+        stale_time = time.time() - _TMP_FILE_TTL
+        for tmp_file in self.cache_dir.glob("*.tmp"):
+            try:
+                if tmp_file.stat().st_mtime < stale_time:
+                    tmp_file.unlink()
+            except FileNotFoundError:
+                continue
+
+        cache_files = []
+        for cache_file in self.cache_dir.glob("*.tsv"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            cache_files.append((stat.st_mtime, stat.st_size, cache_file))
+
+        total_size = sum(size for _, size, _ in cache_files)
+        for _, size, cache_file in sorted(cache_files):
+            if total_size <= self.max_size:
+                break
+            try:
+                cache_file.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def _cache_file(self, key: str) -> Path:
+        """Cache file path of key"""
+        return self.cache_dir / f"{key}.tsv"
+
+    @staticmethod
+    def make_key(
+        fa_file1: Union[str, Path],
+        fa_file2: Union[str, Path],
+        seqtype: str,
+        maptype: str,
+    ) -> str:
+        """Make cache key from genome fasta contents and alignment options
+
+        Args:
+            fa_file1 (Union[str, Path]): Genome fasta file 1
+            fa_file2 (Union[str, Path]): Genome fasta file 2
+            seqtype (str): Sequence type ('nucleotide' or 'protein')
+            maptype (str): Mapping type ('one-to-one' or 'many-to-many')
+
+        Returns:
+            str: Cache key (SHA-256 hex digest)
+        """
+        sha256 = hashlib.sha256()
+        for fa_file in (fa_file1, fa_file2):
+            sha256.update(_get_file_digest(fa_file).encode() + b"\n")
+        sha256.update(f"{seqtype.lower()}\n{maptype.lower()}".encode())
+        return sha256.hexdigest()
+
+
+def _seqtype_line(seqtype: str) -> str:
+    """Sequence type line of cache file"""
+    return f"#seqtype\t{seqtype.lower()}\n"
+
+
+def _get_file_digest(file: Union[str, Path]) -> str:
+    """Get SHA-256 hex digest of file contents
+
+    Digest is memoized by file path, modification time & size, so unchanged
+    files are not read again on every rerun.
+
+    Args:
+        file (Union[str, Path]): Target file
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    stat = os.stat(file)
+    stat_key = (str(Path(file).resolve()), stat.st_mtime_ns, stat.st_size)
+    with _FILE_DIGEST_CACHE_LOCK:
+        if stat_key in _FILE_DIGEST_CACHE:
+            _FILE_DIGEST_CACHE.move_to_end(stat_key)
+            return _FILE_DIGEST_CACHE[stat_key]
+
+    sha256 = hashlib.sha256()
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    digest = sha256.hexdigest()
+
+    with _FILE_DIGEST_CACHE_LOCK:
+        _FILE_DIGEST_CACHE[stat_key] = digest
+        _FILE_DIGEST_CACHE.move_to_end(stat_key)
+        while len(_FILE_DIGEST_CACHE) > _FILE_DIGEST_CACHE_MAX_NUM:
+            _FILE_DIGEST_CACHE.popitem(last=False)
+    return digest
@@ -3,11 +3,27 @@ from __future__ import annotations
 import csv
 from dataclasses import astuple, dataclass
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from Bio.Graphics.GenomeDiagram import CrossLink, Track
 from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color, HexColor
+
+from gbkviz.genbank import Genbank
+
+# Column names of alignment coordinates TSV format
+TSV_COLUMNS = (
+    "REF_START",
+    "REF_END",
+    "QUERY_START",
+    "QUERY_END",
+    "REF_LENGTH",
+    "QUERY_LENGTH",
+    "IDENTITY",
+    "REF_NAME",
+    "QUERY_NAME",
+)
 
 
 @dataclass
@@ -58,11 +74,7 @@ class AlignCoord:
             cross_link_color = HexColor(normal_color)
 
         # Get gradient color from alignment sequence identity[%]
-        upper_limit = 100
-        lower_limit = 20 if self.identity > 20 else self.identity
-        gradient_cross_link_color = colors.linearlyInterpolatedColor(
-            colors.white, cross_link_color, lower_limit, upper_limit, self.identity
-        )
+        gradient_cross_link_color = _get_gradient_color(cross_link_color, self.identity)
 
         name2track = {track.name: track for track in tracks}
         return CrossLink(
@@ -105,6 +117,130 @@ class AlignCoord:
             self.query_name,
         )
 
+    def flip(
+        self,
+        ref_seq_length: Optional[int] = None,
+        query_seq_length: Optional[int] = None,
+    ) -> AlignCoord:
+        """Flip start-end position to the reverse complement strand
+
+        Args:
+            ref_seq_length (Optional[int], optional): Reference genome length.
+                If None, reference position is not flipped.
+            query_seq_length (Optional[int], optional): Query genome length.
+                If None, query position is not flipped.
+
+        Returns:
+            AlignCoord: Flipped AlignCoord
+        """
+        ref_start, ref_end = self.ref_start, self.ref_end
+        if ref_seq_length is not None:
+            ref_start = ref_seq_length - ref_start + 1
+            ref_end = ref_seq_length - ref_end + 1
+        query_start, query_end = self.query_start, self.query_end
+        if query_seq_length is not None:
+            query_start = query_seq_length - query_start + 1
+            query_end = query_seq_length - query_end + 1
+        return AlignCoord(
+            ref_start,
+            ref_end,
+            query_start,
+            query_end,
+            self.ref_length,
+            self.query_length,
+            self.identity,
+            self.ref_name,
+            self.query_name,
+        )
+
+    def clip(
+        self,
+        ref_min: int,
+        ref_max: int,
+        query_min: int,
+        query_max: int,
+    ) -> Optional[AlignCoord]:
+        """Clip start-end position to reference & query min-max range
+
+        Alignment is regarded as linear mapping between reference and query,
+        so the other side of clipped position is linearly interpolated.
+
+        Args:
+            ref_min (int): Reference min range
+            ref_max (int): Reference max range
+            query_min (int): Query min range
+            query_max (int): Query max range
+
+        Returns:
+            Optional[AlignCoord]: Clipped AlignCoord (None if out of range)
+        """
+        # Get ratio interval of alignment within both reference & query range
+        lower_ratio, upper_ratio = 0.0, 1.0
+        for start, end, min_range, max_range in (
+            (self.ref_start, self.ref_end, ref_min, ref_max),
+            (self.query_start, self.query_end, query_min, query_max),
+        ):
+            if start == end:
+                if not min_range <= start <= max_range:
+                    return None
+                continue
+            ratio1 = (min_range - start) / (end - start)
+            ratio2 = (max_range - start) / (end - start)
+            lower_ratio = max(lower_ratio, min(ratio1, ratio2))
+            upper_ratio = min(upper_ratio, max(ratio1, ratio2))
+        if lower_ratio > upper_ratio:
+            return None
+
+        def interpolate(
+            start: int, end: int, ratio: float, lower: int, upper: int
+        ) -> int:
+            return min(max(round(start + (end - start) * ratio), lower), upper)
+
+        ref_start = interpolate(
+            self.ref_start, self.ref_end, lower_ratio, ref_min, ref_max
+        )
+        ref_end = interpolate(
+            self.ref_start, self.ref_end, upper_ratio, ref_min, ref_max
+        )
+        query_start = interpolate(
+            self.query_start, self.query_end, lower_ratio, query_min, query_max
+        )
+        query_end = interpolate(
+            self.query_start, self.query_end, upper_ratio, query_min, query_max
+        )
+        return AlignCoord(
+            ref_start,
+            ref_end,
+            query_start,
+            query_end,
+            abs(ref_end - ref_start) + 1,
+            abs(query_end - query_start) + 1,
+            self.identity,
+            self.ref_name,
+            self.query_name,
+        )
+
+    @staticmethod
+    def slice_range(
+        align_coords: List[AlignCoord],
+        gbk_list: List[Genbank],
+    ) -> List[AlignCoord]:
+        """Slice full genome align coords to min-max range of each genbank
+
+        Align coords of full-length forward strand genomes are flipped if genbank is
+        reversed, clipped to genbank min-max range, and converted to 1-based range
+        position. So range & reverse changes need not realign genomes.
+
+        Args:
+            align_coords (List[AlignCoord]): Full genome AlignCoord list
+            gbk_list (List[Genbank]): Genbank list (name = align coord genome name)
+
+        Returns:
+            List[AlignCoord]: Range AlignCoord list
+        """
+        table = AlignCoordTable.from_align_coords(align_coords)
+        return table.slice_range(gbk_list).to_align_coords()
+
     @staticmethod
     def parse(
         coords_tsv_file: Union[str, Path],
@@ -119,39 +255,170 @@ class AlignCoord:
         Returns:
             List[AlignCoord]: Align coords
         """
-        align_coords = []
         with open(coords_tsv_file) as f:
-            reader = csv.reader(f, delimiter="\t")
-            for row in reader:
-                # Check read file contents & extract required row values
-                if seqtype == "nucleotide":
-                    if len(row) != 9:
-                        raise ValueError(
-                            f"Invalid nucmer coords file '{coords_tsv_file}'!!"
-                        )
-                elif seqtype == "protein":
-                    if len(row) != 13:
-                        raise ValueError(
-                            f"Invalid promer coords file '{coords_tsv_file}'!!"
-                        )
-                    row = row[0:7] + row[11:13]
+            return AlignCoord.parse_stream(f, seqtype, str(coords_tsv_file))
+
+    @staticmethod
+    def parse_stream(
+        coords_tsv_stream: Iterable[str],
+        seqtype: str,
+        name: str = "<stream>",
+    ) -> List[AlignCoord]:
+        """Parse MUMmer(nucmer|promer) output coords result stream
+
+        Args:
+            coords_tsv_stream (Iterable[str]): MUMmer align coords lines
+                (e.g. file object, show-coords stdout)
+            seqtype (str): Sequence type ('nucleotide' or 'protein')
+            name (str, optional): Stream name for error message
+
+        Returns:
+            List[AlignCoord]: Align coords
+        """
+        align_coords = []
+        reader = csv.reader(coords_tsv_stream, delimiter="\t")
+        for row in reader:
+            # Check read contents & extract required row values
+            if seqtype == "nucleotide":
+                if len(row) != 9:
+                    raise ValueError(f"Invalid nucmer coords file '{name}'!!")
+            elif seqtype == "protein":
+                if len(row) != 13:
+                    raise ValueError(f"Invalid promer coords file '{name}'!!")
+                row = row[0:7] + row[11:13]
+            else:
+                raise ValueError(f"Invalid seqtype '{seqtype}'!!")
+
+            # Convert to correct value type
+            typed_row = []
+            for idx, val in enumerate(row):
+                if 0 <= idx <= 5:
+                    typed_row.append(int(val))
+                elif idx == 6:
+                    typed_row.append(float(val))
                 else:
-                    raise ValueError(f"Invalid seqtype '{seqtype}'!!")
+                    typed_row.append(str(val))
+
+            align_coords.append(AlignCoord(*typed_row))
+
+        return align_coords
 
-                # Convert to correct value type
-                typed_row = []
-                for idx, val in enumerate(row):
-                    if 0 <= idx <= 5:
-                        typed_row.append(int(val))
-                    elif idx == 6:
-                        typed_row.append(float(val))
-                    else:
-                        typed_row.append(str(val))
+    @staticmethod
+    def parse_tsv_stream(
+        tsv_stream: Iterable[str],
+        name: str = "<stream>",
+    ) -> List[AlignCoord]:
+        """Parse align coords TSV format stream with column names header line
 
-                align_coords.append(AlignCoord(*typed_row))
+        TSV format is same as `AlignCoordTable.to_tsv(header=True)` output,
+        so identity is already computed regardless of sequence type.
+
+        Args:
+            tsv_stream (Iterable[str]): Align coords TSV lines (e.g. file object)
+            name (str, optional): Stream name for error message
 
+        Returns:
+            List[AlignCoord]: Align coords
+        """
+        reader = csv.reader(tsv_stream, delimiter="\t")
+        if tuple(next(reader, ())) != TSV_COLUMNS:
+            raise ValueError(f"Invalid align coords TSV file header '{name}'!!")
+        align_coords = []
+        for row in reader:
+            if len(row) != len(TSV_COLUMNS):
+                raise ValueError(f"Invalid align coords TSV file '{name}'!!")
+            positions = [int(val) for val in row[0:6]]
+            align_coords.append(AlignCoord(*positions, float(row[6]), *row[7:9]))
         return align_coords
 
+    @staticmethod
+    def parse_delta(delta_file: Union[str, Path]) -> List[AlignCoord]:
+        """Parse MUMmer(nucmer|promer) output delta file
+
+        Args:
+            delta_file (Union[str, Path]): MUMmer delta file
+
+        Returns:
+            List[AlignCoord]: Align coords
+        """
+        with open(delta_file) as f:
+            return AlignCoord.parse_delta_stream(f, str(delta_file))
+
+    @staticmethod
+    def parse_delta_stream(
+        delta_stream: Iterable[str],
+        name: str = "<stream>",
+    ) -> List[AlignCoord]:
+        """Parse MUMmer(nucmer|promer) output delta stream
+
+        Align coords are same as `show-coords -H -T` output. Identity is calculated
+        from error count in the same way as show-coords, as below.
+
+        identity = (total - errors) / total * 100
+        total = alignment reference length (/3 if promer) + deletion count
+
+        Args:
+            delta_stream (Iterable[str]): MUMmer delta lines
+                (e.g. file object, delta-filter stdout)
+            name (str, optional): Stream name for error message
+
+        Returns:
+            List[AlignCoord]: Align coords (sorted by reference name & coords)
+        """
+        lines = iter(delta_stream)
+        # 1st line: Input fasta file paths, 2nd line: 'NUCMER' or 'PROMER'
+        next(lines, None)
+        program = next(lines, "").strip()
+        if program not in ("NUCMER", "PROMER"):
+            raise ValueError(f"Invalid MUMmer delta file '{name}'!!")
+
+        align_coords: List[AlignCoord] = []
+        ref_name, query_name = "", ""
+        align_values: List[int] = []
+        total = 0
+        for line in lines:
+            if line.startswith(">"):
+                # Sequence header: '>ref_name query_name ref_length query_length'
+                ref_name, query_name = line[1:].split()[0:2]
+                continue
+            values = line.split()
+            if len(values) == 7:
+                # Alignment header: 'sR eR sQ eQ errors sim_errors stop_codons'
+                align_values = [int(v) for v in values[0:5]]
+                ref_start, ref_end = align_values[0], align_values[1]
+                total = abs(ref_end - ref_start) + 1
+                if program == "PROMER":
+                    total //= 3
+            elif len(values) == 1 and len(align_values) > 0:
+                delta = int(values[0])
+                if delta < 0:
+                    total += 1
+                elif delta == 0:
+                    # End of alignment
+                    ref_start, ref_end, query_start, query_end, errors = align_values
+                    identity = (total - errors) / total * 100
+                    align_coords.append(
+                        AlignCoord(
+                            ref_start,
+                            ref_end,
+                            query_start,
+                            query_end,
+                            abs(ref_end - ref_start) + 1,
+                            abs(query_end - query_start) + 1,
+                            float(f"{identity:.2f}"),
+                            ref_name,
+                            query_name,
+                        )
+                    )
+                    align_values = []
+            elif line.strip() != "":
+                raise ValueError(f"Invalid MUMmer delta file '{name}'!!")
+
+        return sorted(
+            align_coords,
+            key=lambda ac: (ac.ref_name, min(ac.ref_start, ac.ref_end)),
+        )
+
     @staticmethod
     def filter(
         align_coords: List[AlignCoord],
@@ -174,3 +441,602 @@ class AlignCoord:
             if (rlen >= min_length and qlen >= min_length) and ident >= min_identity:
                 filtered_align_coords.append(AlignCoord(*astuple(ac)))
         return filtered_align_coords
+
+
+class AlignCoordTable:
+    """Vectorized Alignment Coordinates Table Class
+
+    Each AlignCoord is stored as one row of numpy columns (struct of arrays).
+    Reference & query genome names are interned into string pool and stored as codes.
+    """
+
+    def __init__(
+        self,
+        ref_starts: np.ndarray,
+        ref_ends: np.ndarray,
+        query_starts: np.ndarray,
+        query_ends: np.ndarray,
+        ref_lengths: np.ndarray,
+        query_lengths: np.ndarray,
+        identities: np.ndarray,
+        ref_name_codes: np.ndarray,
+        query_name_codes: np.ndarray,
+        name_pool: List[str],
+    ):
+        """AlignCoordTable constructor
+
+        Args:
+            ref_starts (np.ndarray): Reference start positions
+            ref_ends (np.ndarray): Reference end positions
+            query_starts (np.ndarray): Query start positions
+            query_ends (np.ndarray): Query end positions
+            ref_lengths (np.ndarray): Reference alignment lengths
+            query_lengths (np.ndarray): Query alignment lengths
+            identities (np.ndarray): Alignment identities[%]
+            ref_name_codes (np.ndarray): Reference name codes of `name_pool`
+            query_name_codes (np.ndarray): Query name codes of `name_pool`
+            name_pool (List[str]): Genome name string pool
+        """
+        self.ref_starts = ref_starts
+        self.ref_ends = ref_ends
+        self.query_starts = query_starts
+        self.query_ends = query_ends
+        self.ref_lengths = ref_lengths
+        self.query_lengths = query_lengths
+        self.identities = identities
+        self.ref_name_codes = ref_name_codes
+        self.query_name_codes = query_name_codes
+        self.name_pool = name_pool
+
+    def __len__(self) -> int:
+        return len(self.ref_starts)
+
+    @property
+    def ref_names(self) -> List[str]:
+        """Reference names of each row"""
+        return [self.name_pool[code] for code in self.ref_name_codes.tolist()]
+
+    @property
+    def query_names(self) -> List[str]:
+        """Query names of each row"""
+        return [self.name_pool[code] for code in self.query_name_codes.tolist()]
+
+    @property
+    def is_inverted(self) -> np.ndarray:
+        """Inverted alignment or not of each row"""
+        ref_diffs = self.ref_ends - self.ref_starts
+        query_diffs = self.query_ends - self.query_starts
+        return ref_diffs * query_diffs < 0
+
+    def take(self, rows: Union[Sequence[int], np.ndarray]) -> AlignCoordTable:
+        """Take rows of table
+
+        Args:
+            rows (Union[Sequence[int], np.ndarray]): Target rows or boolean mask
+
+        Returns:
+            AlignCoordTable: Align coord table of target rows (name pool is shared)
+        """
+        rows = np.asarray(rows)
+        return AlignCoordTable(
+            self.ref_starts[rows],
+            self.ref_ends[rows],
+            self.query_starts[rows],
+            self.query_ends[rows],
+            self.ref_lengths[rows],
+            self.query_lengths[rows],
+            self.identities[rows],
+            self.ref_name_codes[rows],
+            self.query_name_codes[rows],
+            self.name_pool,
+        )
+
+    def filter(
+        self,
+        min_length: int = 0,
+        min_identity: float = 0.0,
+    ) -> AlignCoordTable:
+        """Filter align coord table with Length & Identity
+
+        Args:
+            min_length (int, optional): Min length to filter
+            min_identity (float, optional): Min identity to filter
+
+        Returns:
+            AlignCoordTable: Filtered align coord table
+        """
+        mask = (
+            (self.ref_lengths >= min_length)
+            & (self.query_lengths >= min_length)
+            & (self.identities >= min_identity)
+        )
+        return self.take(mask)
+
+    def add_offset(self, name2offset: Dict[str, int]) -> AlignCoordTable:
+        """Add offset of each genome to start-end position
+
+        Args:
+            name2offset (Dict[str, int]): Genome name & offset dict
+                (Genome not in dict is not offset)
+
+        Returns:
+            AlignCoordTable: Align coord table with offset
+        """
+        offsets = np.array(
+            [name2offset.get(name, 0) for name in self.name_pool], dtype=np.int64
+        )
+        ref_offsets = offsets[self.ref_name_codes]
+        query_offsets = offsets[self.query_name_codes]
+        return AlignCoordTable(
+            self.ref_starts + ref_offsets,
+            self.ref_ends + ref_offsets,
+            self.query_starts + query_offsets,
+            self.query_ends + query_offsets,
+            self.ref_lengths,
+            self.query_lengths,
+            self.identities,
+            self.ref_name_codes,
+            self.query_name_codes,
+            self.name_pool,
+        )
+
+    def slice_range(self, gbk_list: List[Genbank]) -> AlignCoordTable:
+        """Slice full genome align coord table to min-max range of each genbank
+
+        Vectorized version of `AlignCoord.slice_range()`. Rows of full-length
+        forward strand genomes are flipped if genbank is reversed, clipped to
+        genbank min-max range (the other side of clipped position is linearly
+        interpolated), and converted to 1-based range position.
+
+        Args:
+            gbk_list (List[Genbank]): Genbank list (name = align coord genome name)
+
+        Returns:
+            AlignCoordTable: Range align coord table
+        """
+        name2gbk = {gbk.name: gbk for gbk in gbk_list}
+        pool_gbks = [name2gbk[name] for name in self.name_pool]
+        full_lengths = np.array([g.full_length for g in pool_gbks], dtype=np.int64)
+        reverses = np.array([g.reverse for g in pool_gbks], dtype=bool)
+        min_ranges = np.array([g.min_range for g in pool_gbks], dtype=np.int64)
+        max_ranges = np.array([g.max_range for g in pool_gbks], dtype=np.int64)
+
+        # Flip start-end position of reversed genomes
+        sides = []
+        for starts, ends, codes in (
+            (self.ref_starts, self.ref_ends, self.ref_name_codes),
+            (self.query_starts, self.query_ends, self.query_name_codes),
+        ):
+            flip_lengths = np.where(reverses[codes], full_lengths[codes] + 1, 0)
+            signs = np.where(reverses[codes], -1, 1)
+            starts = flip_lengths + signs * starts
+            ends = flip_lengths + signs * ends
+            sides.append((starts, ends, min_ranges[codes], max_ranges[codes]))
+
+        # Get ratio interval of alignment within both reference & query range
+        lower_ratios = np.zeros(len(self), dtype=np.float64)
+        upper_ratios = np.ones(len(self), dtype=np.float64)
+        in_range = np.ones(len(self), dtype=bool)
+        for starts, ends, side_mins, side_maxs in sides:
+            is_point = starts == ends
+            in_range &= ~is_point | ((side_mins <= starts) & (starts <= side_maxs))
+            diffs = np.where(is_point, 1, ends - starts)
+            ratios1 = (side_mins - starts) / diffs
+            ratios2 = (side_maxs - starts) / diffs
+            lower_ratios = np.where(
+                is_point,
+                lower_ratios,
+                np.maximum(lower_ratios, np.minimum(ratios1, ratios2)),
+            )
+            upper_ratios = np.where(
+                is_point,
+                upper_ratios,
+                np.minimum(upper_ratios, np.maximum(ratios1, ratios2)),
+            )
+        keep = in_range & (lower_ratios <= upper_ratios)
+
+        # Clip to range by interpolation & convert to 1-based range position
+        positions = []
+        for starts, ends, side_mins, side_maxs in sides:
+            for ratios in (lower_ratios, upper_ratios):
+                clipped = np.round(starts + (ends - starts) * ratios).astype(np.int64)
+                clipped = np.minimum(np.maximum(clipped, side_mins), side_maxs)
+                positions.append((clipped + 1 - side_mins)[keep])
+        ref_starts, ref_ends, query_starts, query_ends = positions
+        return AlignCoordTable(
+            ref_starts,
+            ref_ends,
+            query_starts,
+            query_ends,
+            np.abs(ref_ends - ref_starts) + 1,
+            np.abs(query_ends - query_starts) + 1,
+            self.identities[keep],
+            self.ref_name_codes[keep],
+            self.query_name_codes[keep],
+            self.name_pool,
+        )
+
+    def simplify(
+        self,
+        min_width: float,
+        max_gap: float = 0,
+        max_identity_diff: float = 5.0,
+        max_num: Optional[int] = None,
+    ) -> Tuple[AlignCoordTable, int, int]:
+        """Simplify dense alignments for cross link drawing
+
+        Each step runs only while alignment count exceeds `max_num`.
+
+        1. Collinear adjacent alignments of same genome pair & direction with
+           similar identity to previous alignment are merged into one alignment
+           (identity is length weighted mean).
+        2. Alignments narrower than `min_width` on both reference & query are dropped.
+        3. If alignment count exceeds `max_num`, shorter alignments are dropped.
+
+        Args:
+            min_width (float): Min width to be drawn (e.g. bp length of one pixel)
+            max_gap (float, optional): Max gap & diagonal shift to be merged
+            max_identity_diff (float, optional): Max identity difference to be merged
+            max_num (Optional[int], optional): Max alignment count (None = no limit)
+
+        Returns:
+            Tuple[AlignCoordTable, int, int]: Simplified table, merged count,
+                dropped count
+        """
+        if max_num is not None and len(self) <= max_num:
+            return self, 0, 0
+
+        table = self._merge_collinear(max_gap, max_identity_diff)
+        merged_num = len(self) - len(table)
+        if max_num is not None and len(table) <= max_num:
+            return table, merged_num, 0
+
+        # Drop narrow alignments & cap alignment count by keeping longer alignments
+        ref_widths = np.abs(table.ref_ends - table.ref_starts) + 1
+        query_widths = np.abs(table.query_ends - table.query_starts) + 1
+        widths = np.maximum(ref_widths, query_widths)
+        keep_rows = np.flatnonzero(widths >= min_width)
+        if max_num is not None and len(keep_rows) > max_num:
+            longer_order = np.argsort(-widths[keep_rows], kind="stable")
+            keep_rows = keep_rows[longer_order[:max_num]]
+        dropped_num = len(table) - len(keep_rows)
+
+        # Keep original drawing order of alignments
+        return table.take(np.sort(keep_rows)), merged_num, dropped_num
+
+    def _merge_collinear(
+        self,
+        max_gap: float,
+        max_identity_diff: float,
+    ) -> AlignCoordTable:
+        """Merge collinear adjacent alignments (Step 1 of `simplify()`)
+
+        Alignments are sorted by genome pair, direction & reference position,
+        and each alignment is compared with previous one to find block starts.
+        Blocks are then reduced in bulk (groupby of sorted rows).
+
+        Args:
+            max_gap (float): Max gap & diagonal shift to be merged
+            max_identity_diff (float): Max identity difference to be merged
+
+        Returns:
+            AlignCoordTable: Merged table (in original drawing order)
+        """
+        ref_mins = np.minimum(self.ref_starts, self.ref_ends)
+        ref_maxs = np.maximum(self.ref_starts, self.ref_ends)
+        query_mins = np.minimum(self.query_starts, self.query_ends)
+        query_maxs = np.maximum(self.query_starts, self.query_ends)
+        is_inverted = self.is_inverted
+
+        # Sort in reference position order of each genome pair & direction group
+        order = np.lexsort(
+            (ref_mins, is_inverted, self.query_name_codes, self.ref_name_codes)
+        )
+        ref_codes, query_codes = (
+            self.ref_name_codes[order],
+            self.query_name_codes[order],
+        )
+        inverted = is_inverted[order]
+        rmins, rmaxs = ref_mins[order], ref_maxs[order]
+        qmins, qmaxs = query_mins[order], query_maxs[order]
+        identities = self.identities[order]
+        lengths = rmaxs - rmins + 1
+
+        # Find block starts by comparing with previous alignment in same group
+        is_group_start = np.ones(len(order), dtype=bool)
+        is_group_start[1:] = (
+            (ref_codes[1:] != ref_codes[:-1])
+            | (query_codes[1:] != query_codes[:-1])
+            | (inverted[1:] != inverted[:-1])
+        )
+        # Max reference end of previous alignments in same group
+        group_idx = np.cumsum(is_group_start) - 1
+        group_offsets = group_idx * (int(rmaxs.max(initial=0)) + 1)
+        prev_rmaxs = np.maximum.accumulate(rmaxs + group_offsets) - group_offsets
+        ref_gaps = rmins[1:] - prev_rmaxs[:-1]
+        query_gaps = np.where(
+            inverted[1:], qmins[:-1] - qmaxs[1:], qmins[1:] - qmaxs[:-1]
+        )
+        is_block_start = is_group_start.copy()
+        is_block_start[1:] |= (
+            (ref_gaps > max_gap)
+            | (query_gaps > max_gap)
+            | (np.abs(ref_gaps - query_gaps) > max_gap)
+            | (np.abs(identities[1:] - identities[:-1]) > max_identity_diff)
+        )
+
+        # Reduce each block (Single alignment block keeps original values)
+        block_idx = np.flatnonzero(is_block_start)
+        block_rows = order[block_idx]
+        if len(block_idx) == 0:
+            return self
+        is_single = np.diff(np.append(block_idx, len(order))) == 1
+        block_ref_mins = rmins[block_idx]
+        block_ref_maxs = np.maximum.reduceat(rmaxs, block_idx)
+        block_query_mins = np.minimum.reduceat(qmins, block_idx)
+        block_query_maxs = np.maximum.reduceat(qmaxs, block_idx)
+        block_identities = np.round(
+            np.add.reduceat(identities * lengths, block_idx)
+            / np.add.reduceat(lengths, block_idx),
+            2,
+        )
+        block_inverted = inverted[block_idx]
+
+        table = self.take(block_rows)
+        ref_starts = np.where(is_single, table.ref_starts, block_ref_mins)
+        ref_ends = np.where(is_single, table.ref_ends, block_ref_maxs)
+        query_starts = np.where(
+            is_single,
+            table.query_starts,
+            np.where(block_inverted, block_query_maxs, block_query_mins),
+        )
+        query_ends = np.where(
+            is_single,
+            table.query_ends,
+            np.where(block_inverted, block_query_mins, block_query_maxs),
+        )
+        table = AlignCoordTable(
+            ref_starts,
+            ref_ends,
+            query_starts,
+            query_ends,
+            np.where(is_single, table.ref_lengths, block_ref_maxs - ref_starts + 1),
+            np.where(
+                is_single, table.query_lengths, block_query_maxs - block_query_mins + 1
+            ),
+            np.where(is_single, table.identities, block_identities),
+            table.ref_name_codes,
+            table.query_name_codes,
+            self.name_pool,
+        )
+        # Keep original drawing order of alignments
+        return table.take(np.argsort(block_rows, kind="stable"))
+
+    def get_cross_links(
+        self,
+        tracks: List[Track],
+        normal_color: str = "#0000FF",  # Blue
+        inverted_color: str = "#FF0000",  # Red
+    ) -> List[CrossLink]:
+        """Get cross link objects of all rows in one pass
+
+        Cross links are same as `AlignCoord.get_cross_link()` of each row.
+        Tracks are resolved once, and gradient colors are shared among rows
+        with same identity quantized to 0.01[%] (show-coords output precision).
+
+        Args:
+            tracks (List[Track]): GenomeDiagram Track list
+            normal_color (str): Normal cross link hexcolor (Default='#0000FF'[Blue])
+            inverted_color (str): Inverted cross link hexcolor (Default='#FF0000'[Red])
+
+        Returns:
+            List[CrossLink]: Cross link objects
+        """
+        # Resolve track of each genome name code once
+        name2track = {track.name: track for track in tracks}
+        used_codes = np.unique(
+            np.concatenate([self.ref_name_codes, self.query_name_codes])
+        )
+        code2track = {
+            code: name2track[self.name_pool[code]] for code in used_codes.tolist()
+        }
+
+        # Get cross link start-end of reference and query
+        is_inverted = self.is_inverted
+        ref_starts = np.minimum(self.ref_starts, self.ref_ends)
+        ref_ends = np.maximum(self.ref_starts, self.ref_ends)
+        query_starts = np.minimum(self.query_starts, self.query_ends)
+        query_ends = np.maximum(self.query_starts, self.query_ends)
+
+        # GenomeDiagram cannot draw cross link color correctly in condition below
+        # To resolve this drawing error, add 1 bp length to ref_start
+        ref_starts = ref_starts + (
+            (self.ref_lengths == self.query_lengths) & is_inverted
+        )
+
+        # Get gradient color lookup table of quantized identity & inverted pairs
+        identity_keys = np.round(self.identities * 100).astype(np.int64)
+        color_keys = identity_keys * 2 + is_inverted
+        unique_color_keys, color_idxs = np.unique(color_keys, return_inverse=True)
+        base_colors = (HexColor(normal_color), HexColor(inverted_color))
+        color_lut = [
+            _get_gradient_color(base_colors[key % 2], (key // 2) / 100)
+            for key in unique_color_keys.tolist()
+        ]
+
+        cross_links = []
+        for rs, re, qs, qe, rc, qc, inverted, color_idx in zip(
+            ref_starts.tolist(),
+            ref_ends.tolist(),
+            query_starts.tolist(),
+            query_ends.tolist(),
+            self.ref_name_codes.tolist(),
+            self.query_name_codes.tolist(),
+            is_inverted.tolist(),
+            color_idxs.tolist(),
+        ):
+            color = color_lut[color_idx]
+            cross_links.append(
+                CrossLink(
+                    featureA=(code2track[rc], rs, re),
+                    featureB=(code2track[qc], qs, qe),
+                    color=color,
+                    border=color,
+                    flip=inverted,
+                )
+            )
+        return cross_links
+
+    def to_tsv(self, header: bool = False) -> str:
+        """Convert to TSV format text (same as `AlignCoord.as_tsv_format` lines)
+
+        Every line including header line is terminated by newline.
+
+        Args:
+            header (bool, optional): Add column names header line or not
+
+        Returns:
+            str: TSV format text
+        """
+        columns = [
+            map(str, column.tolist())
+            for column in (
+                self.ref_starts,
+                self.ref_ends,
+                self.query_starts,
+                self.query_ends,
+                self.ref_lengths,
+                self.query_lengths,
+                self.identities,
+            )
+        ]
+        columns.extend([self.ref_names, self.query_names])
+        lines = ["\t".join(row) + "\n" for row in zip(*columns)]
+        if header:
+            lines.insert(0, "\t".join(TSV_COLUMNS) + "\n")
+        return "".join(lines)
+
+    def to_align_coords(self) -> List[AlignCoord]:
+        """Convert to AlignCoord list
+
+        Returns:
+            List[AlignCoord]: AlignCoord list
+        """
+        return [
+            AlignCoord(*row)
+            for row in zip(
+                self.ref_starts.tolist(),
+                self.ref_ends.tolist(),
+                self.query_starts.tolist(),
+                self.query_ends.tolist(),
+                self.ref_lengths.tolist(),
+                self.query_lengths.tolist(),
+                self.identities.tolist(),
+                self.ref_names,
+                self.query_names,
+            )
+        ]
+
+    @staticmethod
+    def concat(tables: List[AlignCoordTable]) -> AlignCoordTable:
+        """Concatenate align coord tables (name codes are remapped to merged pool)
+
+        Args:
+            tables (List[AlignCoordTable]): Align coord tables
+
+        Returns:
+            AlignCoordTable: Concatenated align coord table
+        """
+        name2code: Dict[str, int] = {}
+        ref_name_codes, query_name_codes = [], []
+        for table in tables:
+            code_map = np.array(
+                [
+                    name2code.setdefault(name, len(name2code))
+                    for name in table.name_pool
+                ],
+                dtype=np.int32,
+            ).reshape(-1)
+            ref_name_codes.append(code_map[table.ref_name_codes])
+            query_name_codes.append(code_map[table.query_name_codes])
+
+        def concat_column(column_name: str, dtype: type) -> np.ndarray:
+            columns = [getattr(table, column_name) for table in tables]
+            return np.concatenate([np.array([], dtype=dtype)] + columns)
+
+        return AlignCoordTable(
+            ref_starts=concat_column("ref_starts", np.int64),
+            ref_ends=concat_column("ref_ends", np.int64),
+            query_starts=concat_column("query_starts", np.int64),
+            query_ends=concat_column("query_ends", np.int64),
+            ref_lengths=concat_column("ref_lengths", np.int64),
+            query_lengths=concat_column("query_lengths", np.int64),
+            identities=concat_column("identities", np.float64),
+            ref_name_codes=np.concatenate(
+                [np.array([], dtype=np.int32)] + ref_name_codes
+            ),
+            query_name_codes=np.concatenate(
+                [np.array([], dtype=np.int32)] + query_name_codes
+            ),
+            name_pool=list(name2code.keys()),
+        )
+
+    @staticmethod
+    def from_align_coords(align_coords: List[AlignCoord]) -> AlignCoordTable:
+        """Build align coord table from AlignCoord list
+
+        Args:
+            align_coords (List[AlignCoord]): AlignCoord list
+
+        Returns:
+            AlignCoordTable: Align coord table
+        """
+        name2code: Dict[str, int] = {}
+        positions: List[Tuple[int, ...]] = []
+        identities: List[float] = []
+        ref_name_codes, query_name_codes = [], []
+        for ac in align_coords:
+            positions.append(
+                (
+                    ac.ref_start,
+                    ac.ref_end,
+                    ac.query_start,
+                    ac.query_end,
+                    ac.ref_length,
+                    ac.query_length,
+                )
+            )
+            identities.append(ac.identity)
+            ref_name_codes.append(name2code.setdefault(ac.ref_name, len(name2code)))
+            query_name_codes.append(name2code.setdefault(ac.query_name, len(name2code)))
+
+        position_array = np.array(positions, dtype=np.int64).reshape(-1, 6)
+        return AlignCoordTable(
+            ref_starts=position_array[:, 0].copy(),
+            ref_ends=position_array[:, 1].copy(),
+            query_starts=position_array[:, 2].copy(),
+            query_ends=position_array[:, 3].copy(),
+            ref_lengths=position_array[:, 4].copy(),
+            query_lengths=position_array[:, 5].copy(),
+            identities=np.array(identities, dtype=np.float64),
+            ref_name_codes=np.array(ref_name_codes, dtype=np.int32),
+            query_name_codes=np.array(query_name_codes, dtype=np.int32),
+            name_pool=list(name2code.keys()),
+        )
+
+
+def _get_gradient_color(color: Color, identity: float) -> Color:
+    """Get gradient color from white to `color` by alignment identity[%]
+
+    Args:
+        color (Color): Color of 100[%] identity
+        identity (float): Alignment identity[%]
+
+    Returns:
+        Color: Gradient color (white if identity <= 20[%])
+    """
+    upper_limit = 100
+    lower_limit = 20 if identity > 20 else identity
+    return colors.linearlyInterpolatedColor(
+        colors.white, color, lower_limit, upper_limit, identity
+    )
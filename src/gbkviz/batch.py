@@ -0,0 +1,289 @@
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from gbkviz.__version__ import __version__
+from gbkviz.align_coord import AlignCoordTable
+from gbkviz.draw_genbank_fig import DrawGenbankFig
+from gbkviz.genbank import Genbank
+from gbkviz.genome_align import GenomeAlign, set_max_job_num
+
+# Batch options other than DrawGenbankFig parameters & their default values
+BATCH_OPTIONS: Dict[str, Any] = {
+    "formats": ["png"],
+    "seqtype": None,  # 'nucleotide' or 'protein' (None: No genome comparison)
+    "maptype": "one-to-one",
+    "min_length": 0,
+    "min_identity": 0,
+}
+# DrawGenbankFig parameters specified in batch options
+DRAW_OPTIONS: List[str] = [
+    name
+    for name in inspect.signature(DrawGenbankFig).parameters
+    if name not in ("gbk_list", "align_coords")
+]
+GENBANK_KEYS = ("file", "name", "record_name", "min_range", "max_range", "reverse")
+
+
+@dataclass
+class BatchPanel:
+    """Batch Rendering Panel DataClass
+
+    One panel is one figure of genbank tracks (and comparison TSV file if genome
+    comparison is enabled), rendered to `{outdir}/{name}.{format}` files.
+    """
+
+    name: str
+    genbanks: List[Dict[str, Any]]
+    options: Dict[str, Any]
+    outdir: Path
+
+    @property
+    def outfiles(self) -> List[Path]:
+        """Output files"""
+        outfiles = [self.outdir / f"{self.name}.{f}" for f in self.options["formats"]]
+        if self.options["seqtype"] is not None:
+            outfiles.append(self.outdir / f"{self.name}.tsv")
+        return outfiles
+
+    @property
+    def stamp_file(self) -> Path:
+        """Stamp file of fingerprint written after all outputs are rendered"""
+        return self.outdir / f"{self.name}.sha256"
+
+    def make_fingerprint(self) -> str:
+        """Make fingerprint of genbank file contents, panel settings & version
+
+        Returns:
+            str: Fingerprint (SHA-256 hex digest)
+        """
+        sha256 = hashlib.sha256()
+        for genbank in self.genbanks:
+            with open(genbank["file"], "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha256.update(chunk)
+        settings = dict(asdict(self), outdir=None, version=__version__)
+        sha256.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return sha256.hexdigest()
+
+    def is_up_to_date(self) -> bool:
+        """Check all outputs exist & are rendered with current inputs"""
+        if not self.stamp_file.exists():
+            return False
+        if not all(outfile.exists() for outfile in self.outfiles):
+            return False
+        return self.stamp_file.read_text() == self.make_fingerprint()
+
+    def render(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        """Render figures & comparison TSV file of panel
+
+        Args:
+            cache_dir (Optional[Union[str, Path]], optional): Alignment cache
+                directory shared among panels (None: No alignment cache)
+        """
+        gbk_list = [
+            Genbank(
+                genbank["file"],
+                name=genbank["name"],
+                min_range=genbank["min_range"],
+                max_range=genbank["max_range"],
+                reverse=genbank["reverse"],
+                record_name=genbank["record_name"],
+                compact=True,
+            )
+            for genbank in self.genbanks
+        ]
+        self.outdir.mkdir(parents=True, exist_ok=True)
+
+        # Genome alignment (Cached results are reused if already aligned)
+        align_coord_table = AlignCoordTable.from_align_coords([])
+        if self.options["seqtype"] is not None and len(gbk_list) >= 2:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                genome_fasta_files: List[Path] = []
+                for gbk in gbk_list:
+                    # Make full-length forward strand genome fasta file
+                    genome_fasta_file = Path(tmpdir) / f"{gbk.name}.fa"
+                    gbk.write_genome_fasta(
+                        genome_fasta_file, range=False, reverse=False
+                    )
+                    genome_fasta_files.append(genome_fasta_file)
+                align_coord_table = GenomeAlign(
+                    genome_fasta_files,
+                    tmpdir,
+                    self.options["seqtype"],
+                    self.options["maptype"],
+                    cache_dir,
+                ).run_table()
+            # Slice full genome align coords to min-max range & reverse option
+            align_coord_table = align_coord_table.slice_range(gbk_list)
+            align_coord_table = align_coord_table.filter(
+                self.options["min_length"], self.options["min_identity"]
+            )
+        if self.options["seqtype"] is not None:
+            tsv_file = self.outdir / f"{self.name}.tsv"
+            tsv_file.write_text(align_coord_table.to_tsv(header=True))
+
+        draw_options = {k: v for k, v in self.options.items() if k in DRAW_OPTIONS}
+        dgf = DrawGenbankFig(gbk_list, align_coord_table, **draw_options)
+        for format in self.options["formats"]:
+            dgf.write_figure(self.outdir / f"{self.name}.{format}")
+
+        # Stamp is written last, so interrupted panel is rendered again next time
+        self.stamp_file.write_text(self.make_fingerprint())
+
+
+def load_manifest(
+    manifest_file: Union[str, Path],
+    outdir: Optional[Union[str, Path]] = None,
+) -> List[BatchPanel]:
+    """Load batch manifest JSON file
+
+    Manifest format is as below. Panel `options` override common `options`.
+    Relative genbank file & output directory paths are resolved from manifest
+    file directory. Genbank entry can be file path string only.
+
+        {
+            "outdir": "output",
+            "options": {"formats": ["png", "svg"], "seqtype": "nucleotide"},
+            "panels": [
+                {
+                    "name": "panel1",
+                    "genbanks": [
+                        "genome1.gbk",
+                        {"file": "genome2.gbk", "min_range": 1, "reverse": true}
+                    ],
+                    "options": {"show_label": true}
+                }
+            ]
+        }
+
+    Args:
+        manifest_file (Union[str, Path]): Manifest JSON file
+        outdir (Optional[Union[str, Path]], optional): Output directory
+            (Default: `outdir` in manifest or manifest file directory)
+
+    Returns:
+        List[BatchPanel]: Batch panels
+    """
+    manifest_file = Path(manifest_file)
+    with open(manifest_file) as f:
+        manifest: Dict[str, Any] = json.load(f)
+    base_dir = manifest_file.parent
+    if outdir is None:
+        outdir = base_dir / manifest.get("outdir", ".")
+    common_options = manifest.get("options", {})
+
+    panels: List[BatchPanel] = []
+    for panel in manifest.get("panels", []):
+        name = panel.get("name")
+        if not name or name in [p.name for p in panels]:
+            raise ValueError(f"Panel name '{name}' is empty or duplicated!!")
+        options = {**BATCH_OPTIONS, **common_options, **panel.get("options", {})}
+        for key in options:
+            if key not in BATCH_OPTIONS and key not in DRAW_OPTIONS:
+                raise ValueError(f"Invalid option '{key}' in panel '{name}'!!")
+        options["formats"] = [format.lower() for format in options["formats"]]
+
+        genbanks: List[Dict[str, Any]] = []
+        for genbank in panel.get("genbanks", []):
+            if isinstance(genbank, str):
+                genbank = {"file": genbank}
+            for key in genbank:
+                if key not in GENBANK_KEYS:
+                    raise ValueError(f"Invalid genbank key '{key}' in panel '{name}'!!")
+            gbk_file = base_dir / genbank["file"]
+            record_name = genbank.get("record_name")
+            default_name = gbk_file.stem
+            if record_name is not None:
+                default_name = f"{default_name}_{record_name}"
+            genbanks.append(
+                {
+                    "file": str(gbk_file),
+                    "name": genbank.get("name", default_name),
+                    "record_name": record_name,
+                    "min_range": genbank.get("min_range"),
+                    "max_range": genbank.get("max_range"),
+                    "reverse": genbank.get("reverse", False),
+                }
+            )
+        if len(genbanks) == 0:
+            raise ValueError(f"No genbank file is specified in panel '{name}'!!")
+        panels.append(BatchPanel(name, genbanks, options, Path(outdir)))
+    return panels
+
+
+def run_batch(
+    panels: List[BatchPanel],
+    cache_dir: Optional[Union[str, Path]] = None,
+    process_num: Optional[int] = None,
+    force: bool = False,
+) -> Iterator[Tuple[BatchPanel, str]]:
+    """Render batch panels concurrently in process pool
+
+    Panels whose outputs are already up to date are skipped.
+    CPU count is split between panel processes and MUMmer jobs of each process,
+    so that total MUMmer jobs do not exceed CPU count.
+
+    Args:
+        panels (List[BatchPanel]): Batch panels
+        cache_dir (Optional[Union[str, Path]], optional): Alignment cache
+            directory shared among panels (None: No alignment cache)
+        process_num (Optional[int], optional): Number of processes
+            (Default: CPU count)
+        force (bool, optional): Render panels even if outputs are up to date
+
+    Yields:
+        Tuple[BatchPanel, str]: Panel & result status ('rendered'|'skipped'|
+            'failed (error message)') in order of completion
+    """
+    if any(p.options["seqtype"] is not None for p in panels):
+        if not GenomeAlign.check_requirements():
+            raise ValueError("MUMmer is required for genome comparison!!")
+
+    render_panels: List[BatchPanel] = []
+    for panel in panels:
+        if not force and panel.is_up_to_date():
+            yield panel, "skipped"
+        else:
+            render_panels.append(panel)
+    if len(render_panels) == 0:
+        return
+
+    cpu_num = os.cpu_count() or 1
+    process_num = cpu_num if process_num is None else process_num
+    process_num = min(process_num, len(render_panels))
+    max_job_num = max(1, cpu_num // process_num)
+    with ProcessPoolExecutor(
+        max_workers=process_num,
+        initializer=set_max_job_num,
+        initargs=(max_job_num,),
+    ) as executor:
+        future2panel = {
+            executor.submit(_render_panel, panel, cache_dir): panel
+            for panel in render_panels
+        }
+        for future in as_completed(future2panel):
+            yield future2panel[future], future.result()
+
+
+def _render_panel(panel: BatchPanel, cache_dir: Optional[Union[str, Path]]) -> str:
+    """Render batch panel (Worker process function)
+
+    Args:
+        panel (BatchPanel): Batch panel
+        cache_dir (Optional[Union[str, Path]]): Alignment cache directory
+
+    Returns:
+        str: Result status ('rendered' or 'failed (error message)')
+    """
+    try:
+        panel.render(cache_dir)
+    except Exception as e:
+        return f"failed ({type(e).__name__}: {e})"
+    return "rendered"
@@ -1,16 +1,52 @@
-from collections import defaultdict
+import hashlib
+import json
+import re
+import warnings
+from concurrent.futures import Future
 from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import Bio
+import numpy as np
 from Bio.Graphics import GenomeDiagram
 from Bio.Graphics.GenomeDiagram import FeatureSet
 from Bio.SeqFeature import FeatureLocation, SeqFeature
 from reportlab.lib import colors
+from reportlab.graphics.shapes import Drawing
 from reportlab.lib.units import cm
 
-from gbkviz.align_coord import AlignCoord
+from gbkviz.align_coord import AlignCoord, AlignCoordTable
+from gbkviz.feature_table import FeatureTable
+from gbkviz.figure_cache import FigureCache
 from gbkviz.genbank import Genbank
+from gbkviz.worker_pool import get_max_worker_num, get_worker_pool
+
+try:
+    # Private Biopython module used only for parallel track drawing
+    from Bio.Graphics.GenomeDiagram._LinearDrawer import LinearDrawer
+except ImportError:  # pragma: no cover
+    LinearDrawer = None
+
+# Process-wide rendered figure cache shared by all DrawGenbankFig instances
+_FIGURE_CACHE = FigureCache()
+
+# Feature row to be drawn (start, end, strand, type, label, merged or not)
+FeatureRow = Tuple[int, int, int, str, str, bool]
+
+# Biopython versions (min <= version < max) tested for parallel track drawing,
+# which depends on private LinearDrawer methods
+PARALLEL_DRAW_BIOPYTHON_VERSIONS = ((1, 79), (1, 82))
+
+# Drawing element groups of each track after cross links (from back to front)
+_TRACK_ELEMENT_GROUPS = (
+    "greytrack_bgs",
+    "feature_elements",
+    "scale_axes",
+    "scale_labels",
+    "feature_labels",
+    "greytrack_labels",
+)
 
 
 class DrawGenbankFig:
@@ -19,7 +55,7 @@ class DrawGenbankFig:
     def __init__(
         self,
         gbk_list: List[Genbank],
-        align_coords: List[AlignCoord] = [],
+        align_coords: Union[List[AlignCoord], AlignCoordTable] = [],
         show_label: bool = False,
         show_scale: bool = True,
         show_ticks: bool = False,
@@ -43,12 +79,15 @@ class DrawGenbankFig:
             "misc_feature": "#E80FC6",
         },
         max_feature: int = 1000,
+        max_cross_link: int = 5000,
+        track_workers: int = 1,
     ):
         """DrawGenbankFig constructor
 
         Args:
             gbk_list (List[Genbank]): Genbank class objects
-            align_coords (List[AlignCoord], optional): AlignCoord class objects
+            align_coords (Union[List[AlignCoord], AlignCoordTable], optional):
+                AlignCoord class objects or AlignCoordTable
             show_label (bool, optional): Show label or not
             show_scale (bool, optional): Show scale or not
             show_ticks (bool, optional): Show ticks or not
@@ -67,9 +106,17 @@ class DrawGenbankFig:
             target_feature_types (List[str], optional): Target feature types
             feature2color (Dict[str, str], optional): Feature colors dictionary
             max_feature (int, optional): Max feature number to be drawn
+            max_cross_link (int, optional): Max cross link number to be drawn
+            track_workers (int, optional): If > 1, tracks & cross links split into
+                `track_workers` chunks are drawn in process-wide worker pool
+                (Default: 1[serial]). It is capped by max worker number of the
+                pool. Tracks are drawn serially if Biopython version is not
+                tested for parallel drawing.
         """
         self.gbk_list: List[Genbank] = gbk_list
-        self.align_coords: List[AlignCoord] = align_coords
+        if not isinstance(align_coords, AlignCoordTable):
+            align_coords = AlignCoordTable.from_align_coords(align_coords)
+        self.align_coord_table: AlignCoordTable = align_coords
         self.show_label: bool = show_label
         self.show_scale: bool = show_scale
         self.show_ticks: bool = show_ticks
@@ -88,26 +135,60 @@ class DrawGenbankFig:
         self.target_feature_types: List[str] = target_feature_types
         self.feature2color: Dict[str, str] = feature2color
         self.max_feature: int = max_feature
+        self.max_cross_link: int = max_cross_link
+        self.track_workers: int = track_workers
+
+        # Fingerprint of genome contents & all draw parameters for figure cache
+        self.fingerprint: str = self._make_fingerprint()
+
+        # Precompute per-track range features & statistics once per render
+        self._range_tables: List[FeatureTable] = [
+            gbk.extract_range_table(self.target_feature_types) for gbk in self.gbk_list
+        ]
+        self._max_range_length: int = max(gbk.range_length for gbk in self.gbk_list)
 
         if self.fig_align_type == "center":
-            self.align_coords = self._add_align_coords_offset()
+            self.align_coord_table = self._add_align_coords_offset()
             # Center alignment figure cannot display scaleticks properly
             self.show_ticks = False
 
-        self.gd = self._setup_genome_diagram()
+        # Cross links are merged & dropped in pixel resolution if there are too many
+        self.merged_cross_link_num: int = 0
+        self.dropped_cross_link_num: int = 0
+        if len(self.align_coord_table) > self.max_cross_link:
+            table, merged_num, dropped_num = self.align_coord_table.simplify(
+                min_width=self._pixel_length,
+                max_gap=self._pixel_length,
+                max_num=self.max_cross_link,
+            )
+            self.align_coord_table = table
+            self.merged_cross_link_num = merged_num
+            self.dropped_cross_link_num = dropped_num
+
+        self._gd: Optional[GenomeDiagram.Diagram] = None
+        self._feature_rows_list: Optional[List[List[FeatureRow]]] = None
+
+    @property
+    def gd(self) -> GenomeDiagram.Diagram:
+        """Genome diagram (Set up lazily only when required)"""
+        if self._gd is None:
+            self._gd = self._setup_genome_diagram()
+        return self._gd
 
     @property
     def max_range_length(self) -> int:
         """Max range length"""
-        return max(gbk.range_length for gbk in self.gbk_list)
+        return self._max_range_length
 
     @property
     def max_range_feature(self) -> int:
         """Max feature count"""
-        return max(
-            len(gbk.extract_range_features(self.target_feature_types))
-            for gbk in self.gbk_list
-        )
+        return max(len(range_table) for range_table in self._range_tables)
+
+    @property
+    def align_coords(self) -> List[AlignCoord]:
+        """Align coords to be drawn"""
+        return self.align_coord_table.to_align_coords()
 
     @property
     def draw_pagesize(self) -> Tuple[float, float]:
@@ -116,9 +197,18 @@ class DrawGenbankFig:
         height = self.fig_track_height * len(self.gbk_list) * cm
         return (width, height)
 
+    @property
+    def _pixel_length(self) -> float:
+        """Genome length (bp) of one pixel (= one point) of figure width"""
+        return self.max_range_length / (self.fig_width * cm)
+
     def get_figure(self, format: str) -> Union[str, bytes]:
         """Get genome diagram figure
 
+        Figure is rendered lazily from the drawing shared among formats, and cached
+        in process-wide figure cache by draw parameters fingerprint & format.
+        So figure of same draw parameters is returned without rendering.
+
         Args:
             format (str): Figure format ('jpg'|'png'|'pdf'|'svg')
 
@@ -126,12 +216,125 @@ class DrawGenbankFig:
             Union[str, bytes]: Figure string or bytes
         """
         format = format.lower()
-        if format == "svg":
-            handle = StringIO()
-            self.gd.write(handle, format)
-            return handle.getvalue()
-        else:
-            return self.gd.write_to_string(format)
+        cache_key = f"{self.fingerprint}.{format}"
+        figure = _FIGURE_CACHE.get(cache_key)
+        if figure is None:
+            figure = _render_figure(self.gd, format)
+            _FIGURE_CACHE.set(cache_key, figure)
+        return figure
+
+    def get_tile_regions(
+        self,
+        tile_length: int,
+        max_tile_num: int = 32,
+    ) -> List[Tuple[int, int]]:
+        """Get figure tile regions on fixed genome grid
+
+        Tiles are split at multiples of tile length on genome position of first
+        (reference) genome track, so tile grid does not move when range is panned.
+        If tile number exceeds max tile number, tile length is doubled until
+        tile number is within max tile number.
+
+        Args:
+            tile_length (int): Tile length (bp)
+            max_tile_num (int, optional): Max tile number
+
+        Returns:
+            List[Tuple[int, int]]: Tile start-end figure positions
+        """
+        if tile_length <= 0:
+            raise ValueError(f"Invalid tile length '{tile_length}'!!")
+        while self.max_range_length / tile_length + 1 > max_tile_num:
+            tile_length *= 2
+        ref_gbk = self.gbk_list[0]
+        grid_offset = self._get_track_offset(ref_gbk) - ref_gbk.min_range + 1
+        tile_start = (-grid_offset // tile_length) * tile_length + grid_offset
+        tile_regions: List[Tuple[int, int]] = []
+        while tile_start < self.max_range_length:
+            tile_end = min(tile_start + tile_length, self.max_range_length)
+            tile_regions.append((max(tile_start, 0), tile_end))
+            tile_start += tile_length
+        return tile_regions
+
+    def get_tile_figure(self, start: int, end: int, format: str) -> Union[str, bytes]:
+        """Get genome diagram figure tile of start-end region
+
+        Tile is drawn in same scale as whole figure, with features & cross links
+        in tile only. Tile is cached in process-wide figure cache by tile contents,
+        so same tile contents after range change (e.g. panning) are not rendered.
+
+        Args:
+            start (int): Tile start position
+            end (int): Tile end position
+            format (str): Figure format ('jpg'|'png'|'pdf'|'svg')
+
+        Returns:
+            Union[str, bytes]: Figure tile string or bytes
+        """
+        format = format.lower()
+        tile_params = self._get_tile_params(start, end)
+        cache_key = _make_tile_key(tile_params, format)
+        figure = _FIGURE_CACHE.get(cache_key)
+        if figure is None:
+            figure = _render_tile(*tile_params, format)
+            _FIGURE_CACHE.set(cache_key, figure)
+        return figure
+
+    def iter_tile_figures(
+        self,
+        tile_length: int,
+        format: str = "png",
+        max_workers: Optional[int] = None,
+        max_tile_num: int = 32,
+    ) -> Iterator[Tuple[int, int, Union[str, bytes]]]:
+        """Render genome diagram figure tiles on fixed genome grid in parallel
+
+        Tiles not cached are rendered in process-wide worker pool.
+        Tiles are yielded in genome axis order as soon as rendered.
+
+        Args:
+            tile_length (int): Tile length (bp)
+            format (str, optional): Figure format ('jpg'|'png'|'pdf'|'svg')
+            max_workers (Optional[int], optional): Max number of tiles rendered
+                concurrently (Default: Max worker number of process-wide worker
+                pool, 1: Render in this process)
+            max_tile_num (int, optional): Max tile number
+
+        Yields:
+            Tuple[int, int, Union[str, bytes]]: Tile start, end, figure
+        """
+        format = format.lower()
+        tile_regions = self.get_tile_regions(tile_length, max_tile_num)
+        if max_workers == 1:
+            for start, end in tile_regions:
+                yield start, end, self.get_tile_figure(start, end, format)
+            return
+
+        if max_workers is None:
+            max_workers = get_max_worker_num()
+        tile_params_list = [self._get_tile_params(*r) for r in tile_regions]
+        cache_keys = [_make_tile_key(p, format) for p in tile_params_list]
+        futures: List[Optional["Future[Union[str, bytes]]"]] = []
+        for idx, ((start, end), cache_key) in enumerate(zip(tile_regions, cache_keys)):
+            # Keep at most max workers tiles rendering ahead of yielded tile
+            while len(futures) < min(idx + max_workers, len(tile_regions)):
+                submit_idx = len(futures)
+                if _FIGURE_CACHE.get(cache_keys[submit_idx]) is None:
+                    futures.append(
+                        get_worker_pool().submit(
+                            _render_tile, *tile_params_list[submit_idx], format
+                        )
+                    )
+                else:
+                    futures.append(None)
+            future = futures[idx]
+            if future is not None:
+                _FIGURE_CACHE.set(cache_key, future.result())
+            figure = _FIGURE_CACHE.get(cache_key)
+            if figure is None:
+                # Evicted from cache before yield
+                figure = self.get_tile_figure(start, end, format)
+            yield start, end, figure
 
     def write_figure(self, outfile: Union[str, Path]) -> None:
         """Write genome diagram figure
@@ -141,7 +344,50 @@ class DrawGenbankFig:
         """
         outfile = Path(outfile)
         format = outfile.suffix.replace(".", "")
-        self.gd.write(str(outfile), format)
+        figure = self.get_figure(format)
+        if isinstance(figure, str):
+            outfile.write_text(figure)
+        else:
+            outfile.write_bytes(figure)
+
+    def _make_fingerprint(self) -> str:
+        """Make stable fingerprint of genome contents & all draw parameters
+
+        Returns:
+            str: Fingerprint (SHA-256 hex digest)
+        """
+        sha256 = hashlib.sha256()
+        for gbk in self.gbk_list:
+            gbk_params = [
+                gbk.content_hash,
+                gbk.name,
+                gbk.min_range,
+                gbk.max_range,
+                gbk.reverse,
+            ]
+            sha256.update(json.dumps(gbk_params).encode())
+        table = self.align_coord_table
+        for column in (
+            table.ref_starts,
+            table.ref_ends,
+            table.query_starts,
+            table.query_ends,
+            table.ref_lengths,
+            table.query_lengths,
+            table.identities,
+            table.ref_name_codes,
+            table.query_name_codes,
+        ):
+            sha256.update(column.tobytes())
+        sha256.update(repr(table.name_pool).encode())
+        # All draw parameters other than genbank list & align coords
+        params = {
+            k: v
+            for k, v in vars(self).items()
+            if k not in ("gbk_list", "align_coord_table", "track_workers")
+        }
+        sha256.update(json.dumps(params, sort_keys=True).encode())
+        return sha256.hexdigest()
 
     def _get_track_offset(self, gbk: Genbank) -> int:
         """Get track offset for figure alignment
@@ -157,129 +403,600 @@ class DrawGenbankFig:
         else:
             return 0
 
-    def _add_align_coords_offset(self) -> List[AlignCoord]:
+    def _add_align_coords_offset(self) -> AlignCoordTable:
         """Add offset to align coords for figure center alignment
 
         Returns:
-            List[AlignCoord]: Align coords with offset
+            AlignCoordTable: Align coord table with offset
         """
-        name2offset: Dict[str, int] = defaultdict(int)
+        name2offset: Dict[str, int] = {}
         for gbk in self.gbk_list:
-            adjusted_pos = self._get_track_offset(gbk)
-            name2offset[gbk.name] = adjusted_pos
-
-        offset_align_coords = []
-        for ac in self.align_coords:
-            offset_align_coords.append(
-                ac.add_offset(name2offset[ac.ref_name], name2offset[ac.query_name])
-            )
-        return offset_align_coords
+            name2offset[gbk.name] = self._get_track_offset(gbk)
+        return self.align_coord_table.add_offset(name2offset)
 
     def _setup_genome_diagram(self) -> GenomeDiagram.Diagram:
-        # Create GenomeDiagram.Diagram object
-        gd = GenomeDiagram.Diagram("Genbank Genome Diagram")
+        """Set up genome diagram drawing
 
-        for gbk in self.gbk_list:
-            offset = self._get_track_offset(gbk)
-            # Add track of one genbank
-            gd_feature_set: FeatureSet = gd.new_track(
-                track_level=0,
-                name=gbk.name,
-                greytrack=False,  # Disable greytrack
-                greytrack_labels=0,
-                greytrack_fontcolor=colors.black,
-                start=offset,
-                end=gbk.range_length + offset,
-                scale=self.show_scale,
-                scale_fontsize=self.scaleticks_fsize,
-                scale_fontangle=0,
-                scale_format="SInt",
-                scale_color=colors.black,
-                scale_ticks=self.show_ticks,
-                scale_smallticks=0.4,
-                scale_smalltick_interval=self.scaleticks_interval,
-                scale_smalltick_labels=True,
-                scale_largeticks=0.4,
-                scale_largetick_interval=9999999999,  # Set large value to disable
-                scale_largetick_labels=False,
-                axis_labels=True,
-            ).new_set()
-
-            range_features = gbk.extract_range_features(self.target_feature_types)
-            max_range_feature = self.max_range_feature
-
-            for feature in range_features:
-                start = feature.location.parts[0].start
-                end = feature.location.parts[-1].end
-                if isinstance(start, int) and isinstance(end, int):
-                    # Exclude CDS that straddle start postion
-                    if start > end:
-                        continue
-                    # Filtering feature to be drawn
-                    feature_length = end - start + 1
-                    if (
-                        max_range_feature > self.max_feature
-                        and feature_length < self.max_range_length / 2000
-                    ):
-                        continue
-                    # Make location fixed feature
-                    start = (start - gbk.min_range + 1) + offset
-                    end = (end - gbk.min_range + 1) + offset
-                    feature = SeqFeature(
-                        location=FeatureLocation(start, end, feature.strand),
-                        type=feature.type,
-                        qualifiers=feature.qualifiers,
-                    )
+        If `track_workers` > 1 (capped by max worker number of process-wide worker
+        pool), tracks & cross links are drawn in worker processes and composited
+        into one drawing in the same order as serial drawing.
 
-                    # Get draw feature 'label_name', 'feature_color', 'label_angle'
-                    target_label_types = ("gene", "protein_id", "locus_tag", "product")
-                    if self.label_type in target_label_types:
-                        label_name = feature.qualifiers.get(self.label_type, [""])[0]
-                        color = self.feature2color[feature.type]
-                    else:
-                        error_msg = f"Invalid label type `{self.label_type}` detected!!"
-                        raise ValueError(error_msg)
-
-                    # Define label angle by strand
-                    if feature.strand == -1:
-                        label_angle = 180 - self.label_angle
-                    else:
-                        label_angle = self.label_angle
-
-                    # Add feature to genbank track
-                    gd_feature_set.add_feature(
-                        feature=feature,
-                        color=color,
-                        name=label_name,
-                        label=self.show_label,
-                        label_size=self.label_fsize,
-                        label_angle=label_angle,
-                        label_position="middle",  # "start", "middle", "end"
-                        sigil=self.feature_symbol,  # "BOX", "ARROW", "OCTO", "BIGARROW"
-                        arrowhead_length=0.5,  # Default: 0.5
-                        arrowshaft_height=0.3,
-                    )
+        Returns:
+            GenomeDiagram.Diagram: Genome diagram
+        """
+        track_params_list = [self._get_track_params(gbk) for gbk in self.gbk_list]
+        feature_rows_list = self._get_feature_rows_list()
+        feature_params = self._get_feature_params()
+        draw_params = self._get_draw_params(0, self.max_range_length)
+        track_workers = min(self.track_workers, get_max_worker_num())
+        if track_workers > 1:
+            if _is_parallel_draw_supported():
+                return self._setup_genome_diagram_parallel(
+                    track_params_list,
+                    feature_rows_list,
+                    feature_params,
+                    draw_params,
+                    track_workers,
+                )
+            warnings.warn(
+                f"Parallel track drawing is not supported in Biopython "
+                f"{Bio.__version__}, so tracks are drawn serially."
+            )
 
+        gd = _new_genome_diagram(track_params_list, feature_rows_list, feature_params)
         # Get cross links
-        cross_links = []
-        for align_coord in self.align_coords:
-            cross_link = align_coord.get_cross_link(
-                tracks=gd.get_tracks(),
-                normal_color=self.cross_link_color,
-                inverted_color=self.inverted_cross_link_color,
+        cross_links = self.align_coord_table.get_cross_links(
+            tracks=gd.get_tracks(),
+            normal_color=self.cross_link_color,
+            inverted_color=self.inverted_cross_link_color,
+        )
+        gd.draw(format="linear", cross_track_links=cross_links, **draw_params)
+        return gd
+
+    def _setup_genome_diagram_parallel(
+        self,
+        track_params_list: List[Dict[str, Any]],
+        feature_rows_list: List[List[FeatureRow]],
+        feature_params: Dict[str, Any],
+        draw_params: Dict[str, Any],
+        track_workers: int,
+    ) -> GenomeDiagram.Diagram:
+        """Set up genome diagram drawing with tracks drawn in worker processes
+
+        Each track and each chunk of cross links is drawn in process-wide worker
+        pool, and drawing elements are composited in the same order as
+        `gd.draw()`.
+
+        Args:
+            track_params_list (List[Dict[str, Any]]): Track parameters list
+            feature_rows_list (List[List[FeatureRow]]): Feature rows of each track
+            feature_params (Dict[str, Any]): Feature parameters
+            draw_params (Dict[str, Any]): Draw parameters
+            track_workers (int): Number of cross link chunks
+
+        Returns:
+            GenomeDiagram.Diagram: Genome diagram
+        """
+        table = self.align_coord_table
+        link_chunks = [
+            table.take(rows)
+            for rows in np.array_split(np.arange(len(table)), track_workers)
+            if len(rows) > 0
+        ]
+        link_colors = (self.cross_link_color, self.inverted_cross_link_color)
+        executor = get_worker_pool()
+        track_futures = [
+            executor.submit(
+                _draw_track_elements,
+                track_params_list,
+                idx,
+                feature_rows,
+                feature_params,
+                draw_params,
+            )
+            for idx, feature_rows in enumerate(feature_rows_list)
+        ]
+        link_futures = [
+            executor.submit(
+                _draw_cross_link_elements,
+                track_params_list,
+                link_chunk,
+                link_colors,
+                draw_params,
+            )
+            for link_chunk in link_chunks
+        ]
+        # Tracks are drawn from lowest track level as same as `gd.draw()`
+        level2track_elements = dict(f.result() for f in track_futures)
+        track_elements = [level2track_elements[k] for k in sorted(level2track_elements)]
+        cross_link_elements = [e for f in link_futures for e in f.result()]
+
+        # Composite drawing elements from back to front
+        empty_feature_rows_list: List[List[FeatureRow]] = [
+            [] for _ in track_params_list
+        ]
+        gd = _new_genome_diagram(track_params_list, empty_feature_rows_list, {})
+        drawer = _get_linear_drawer(gd, draw_params)
+        gd.drawing = Drawing(drawer.pagesize[0], drawer.pagesize[1])
+        element_lists = [e["greytrack_bgs"] for e in track_elements]
+        element_lists += cross_link_elements
+        for group in _TRACK_ELEMENT_GROUPS[1:]:
+            element_lists += [e[group] for e in track_elements]
+        for element_list in element_lists:
+            for element in element_list:
+                gd.drawing.add(element)
+        return gd
+
+    def _get_track_params(self, gbk: Genbank) -> Dict[str, Any]:
+        """Get track parameters of genbank
+
+        Args:
+            gbk (Genbank): Genbank object
+
+        Returns:
+            Dict[str, Any]: Track parameters of `gd.new_track()`
+        """
+        offset = self._get_track_offset(gbk)
+        return dict(
+            name=gbk.name,
+            greytrack=False,  # Disable greytrack
+            greytrack_labels=0,
+            greytrack_fontcolor=colors.black,
+            start=offset,
+            end=gbk.range_length + offset,
+            scale=self.show_scale,
+            scale_fontsize=self.scaleticks_fsize,
+            scale_fontangle=0,
+            scale_format="SInt",
+            scale_color=colors.black,
+            scale_ticks=self.show_ticks,
+            scale_smallticks=0.4,
+            scale_smalltick_interval=self.scaleticks_interval,
+            scale_smalltick_labels=True,
+            scale_largeticks=0.4,
+            scale_largetick_interval=9999999999,  # Set large value to disable
+            scale_largetick_labels=False,
+            axis_labels=True,
+        )
+
+    def _get_feature_rows_list(self) -> List[List[FeatureRow]]:
+        """Get feature rows to be drawn of each track (Made once per render)
+
+        Returns:
+            List[List[FeatureRow]]: Feature rows of each track
+        """
+        if self._feature_rows_list is not None:
+            return self._feature_rows_list
+        # Features are aggregated into pixel width blocks if there are too many
+        lod_bin_size: Optional[float] = None
+        if self.max_range_feature > self.max_feature:
+            lod_bin_size = self._pixel_length
+
+        feature_rows_list: List[List[FeatureRow]] = []
+        for gbk, range_table in zip(self.gbk_list, self._range_tables):
+            # Exclude features that straddle start postion
+            range_table = range_table.take(
+                np.flatnonzero(range_table.starts <= range_table.ends)
+            )
+            if lod_bin_size is not None:
+                range_table = range_table.aggregate(lod_bin_size)
+
+            # Convert to location in figure
+            offset = self._get_track_offset(gbk) - gbk.min_range + 1
+            feature_rows = zip(
+                (range_table.starts + offset).tolist(),
+                (range_table.ends + offset).tolist(),
+                range_table.strands.tolist(),
+                range_table.types,
+                range_table.get_labels(self.label_type),
+                (range_table.ids == -1).tolist(),
             )
-            cross_links.append(cross_link)
+            feature_rows_list.append(list(feature_rows))
+        self._feature_rows_list = feature_rows_list
+        return feature_rows_list
 
-        # Set figure draw settings
-        gd.draw(
-            format="linear",
-            orientation="landscape",
-            pagesize=self.draw_pagesize,
+    def _get_feature_params(self) -> Dict[str, Any]:
+        """Get feature parameters
+
+        Returns:
+            Dict[str, Any]: Feature parameters of `_add_features()`
+        """
+        return dict(
+            feature2color=self.feature2color,
+            feature_symbol=self.feature_symbol,
+            show_label=self.show_label,
+            label_fsize=self.label_fsize,
+            label_angle=self.label_angle,
+        )
+
+    def _get_draw_params(self, draw_start: int, draw_end: int) -> Dict[str, Any]:
+        """Get draw parameters of start-end region
+
+        Args:
+            draw_start (int): Draw start position
+            draw_end (int): Draw end position
+
+        Returns:
+            Dict[str, Any]: Draw parameters of `gd.draw()`
+        """
+        # Set figure draw settings (Page width is proportional to region length)
+        width, height = self.draw_pagesize
+        pagesize = (width * ((draw_end - draw_start) / self.max_range_length), height)
+        # Landscape orientation swaps page width & height if width < height
+        is_whole_region = (draw_start, draw_end) == (0, self.max_range_length)
+        if is_whole_region or pagesize[0] >= pagesize[1]:
+            orientation = "landscape"
+        else:
+            orientation = "portrait"
+        return dict(
+            orientation=orientation,
+            pagesize=pagesize,
             fragments=1,
-            start=0,
-            end=self.max_range_length,
+            start=draw_start,
+            end=draw_end,
             tracklines=False,
             track_size=self.fig_track_size,
-            cross_track_links=cross_links,
         )
-        return gd
+
+    def _get_tile_params(
+        self, start: int, end: int
+    ) -> Tuple[
+        List[Dict[str, Any]],
+        List[List[FeatureRow]],
+        Dict[str, Any],
+        AlignCoordTable,
+        Tuple[str, str],
+        Dict[str, Any],
+    ]:
+        """Get parameters to render figure tile of start-end region
+
+        Only features & cross links overlapping tile are included, and positions
+        are converted to tile local positions (Figure positions are kept if ticks
+        are shown, because tick labels depend on figure position).
+
+        Args:
+            start (int): Tile start position
+            end (int): Tile end position
+
+        Returns:
+            Tuple[...]: Track parameters list, feature rows of each track,
+                feature parameters, cross link table, cross link colors,
+                draw parameters of `_render_tile()`
+        """
+        shift = 0 if self.show_ticks else start
+        track_params_list = []
+        for gbk in self.gbk_list:
+            track_params = self._get_track_params(gbk)
+            track_start = min(max(track_params["start"], start), end)
+            track_end = min(max(track_params["end"], start), end)
+            track_params.update(start=track_start - shift, end=track_end - shift)
+            if track_start == track_end:
+                # Track out of tile
+                track_params.update(scale=False)
+            track_params_list.append(track_params)
+
+        feature_rows_list = [
+            [
+                (row_start - shift, row_end - shift, *row_values)
+                for row_start, row_end, *row_values in feature_rows
+                if row_start <= end and row_end >= start
+            ]
+            for feature_rows in self._get_feature_rows_list()
+        ]
+
+        table = self.align_coord_table
+        in_tile = np.ones(len(table), dtype=bool)
+        for starts, ends in (
+            (table.ref_starts, table.ref_ends),
+            (table.query_starts, table.query_ends),
+        ):
+            in_tile &= (np.minimum(starts, ends) <= end) & (
+                np.maximum(starts, ends) >= start
+            )
+        table = table.take(in_tile).add_offset(
+            {name: -shift for name in table.name_pool}
+        )
+        link_colors = (self.cross_link_color, self.inverted_cross_link_color)
+
+        draw_params = self._get_draw_params(start, end)
+        draw_params.update(start=start - shift, end=end - shift)
+        return (
+            track_params_list,
+            feature_rows_list,
+            self._get_feature_params(),
+            table,
+            link_colors,
+            draw_params,
+        )
+
+
+def _new_genome_diagram(
+    track_params_list: List[Dict[str, Any]],
+    feature_rows_list: List[List[FeatureRow]],
+    feature_params: Dict[str, Any],
+) -> GenomeDiagram.Diagram:
+    """Create genome diagram with tracks & features (Not drawn yet)
+
+    Args:
+        track_params_list (List[Dict[str, Any]]): Track parameters list
+        feature_rows_list (List[List[FeatureRow]]): Feature rows of each track
+        feature_params (Dict[str, Any]): Feature parameters
+
+    Returns:
+        GenomeDiagram.Diagram: Genome diagram
+    """
+    # Create GenomeDiagram.Diagram object
+    gd = GenomeDiagram.Diagram("Genbank Genome Diagram")
+    for track_params, feature_rows in zip(track_params_list, feature_rows_list):
+        # Add track of one genbank
+        gd_feature_set: FeatureSet = gd.new_track(
+            track_level=0, **track_params
+        ).new_set()
+        if len(feature_rows) > 0:
+            _add_features(gd_feature_set, feature_rows, **feature_params)
+    return gd
+
+
+def _add_features(
+    gd_feature_set: FeatureSet,
+    feature_rows: List[FeatureRow],
+    feature2color: Dict[str, str],
+    feature_symbol: str,
+    show_label: bool,
+    label_fsize: int,
+    label_angle: int,
+) -> None:
+    """Add features to genbank track feature set
+
+    Args:
+        gd_feature_set (FeatureSet): Feature set of genbank track
+        feature_rows (List[FeatureRow]): Feature rows
+        feature2color (Dict[str, str]): Feature colors dictionary
+        feature_symbol (str): Feature symbol
+        show_label (bool): Show label or not
+        label_fsize (int): Label font size
+        label_angle (int): Label angle
+    """
+    for start, end, strand, feature_type, label_name, merged in feature_rows:
+        # Make location fixed feature
+        feature = SeqFeature(
+            location=FeatureLocation(start, end, strand or None),
+            type=feature_type,
+        )
+
+        # Define feature color & label angle by strand
+        color = feature2color[feature_type]
+        if feature.strand == -1:
+            feature_label_angle = 180 - label_angle
+        else:
+            feature_label_angle = label_angle
+        # Merged features block is drawn as box
+        sigil = "BOX" if merged else feature_symbol
+
+        # Add feature to genbank track
+        gd_feature_set.add_feature(
+            feature=feature,
+            color=color,
+            name=label_name,
+            label=show_label,
+            label_size=label_fsize,
+            label_angle=feature_label_angle,
+            label_position="middle",  # "start", "middle", "end"
+            sigil=sigil,  # "BOX", "ARROW", "OCTO", "BIGARROW"
+            arrowhead_length=0.5,  # Default: 0.5
+            arrowshaft_height=0.3,
+        )
+
+
+def _get_linear_drawer(
+    gd: GenomeDiagram.Diagram,
+    draw_params: Dict[str, Any],
+) -> LinearDrawer:
+    """Get linear drawer whose page & track layout is set up as `gd.draw()`
+
+    Args:
+        gd (GenomeDiagram.Diagram): Genome diagram
+        draw_params (Dict[str, Any]): Draw parameters
+
+    Returns:
+        LinearDrawer: Linear drawer
+    """
+    drawer = LinearDrawer(
+        gd,
+        x=gd.x,
+        y=gd.y,
+        xl=gd.xl,
+        xr=gd.xr,
+        yt=gd.yt,
+        yb=gd.yb,
+        fragment_size=gd.fragment_size,
+        **draw_params,
+    )
+    drawer.drawn_tracks = gd.get_drawn_levels()
+    drawer.init_fragments()
+    drawer.set_track_heights()
+    return drawer
+
+
+def _draw_track_elements(
+    track_params_list: List[Dict[str, Any]],
+    track_idx: int,
+    feature_rows: List[FeatureRow],
+    feature_params: Dict[str, Any],
+    draw_params: Dict[str, Any],
+) -> Tuple[int, Dict[str, List[Any]]]:
+    """Draw elements of one track (Worker process function)
+
+    All tracks are added to diagram to lay out tracks in the same way as whole
+    diagram, but features are added to target track only.
+
+    Args:
+        track_params_list (List[Dict[str, Any]]): Track parameters list
+        track_idx (int): Target track index of `track_params_list`
+        feature_rows (List[FeatureRow]): Feature rows of target track
+        feature_params (Dict[str, Any]): Feature parameters
+        draw_params (Dict[str, Any]): Draw parameters
+
+    Returns:
+        Tuple[int, Dict[str, List[Any]]]: Track level & drawing element groups
+    """
+    feature_rows_list: List[List[FeatureRow]] = [[] for _ in track_params_list]
+    feature_rows_list[track_idx] = feature_rows
+    gd = _new_genome_diagram(track_params_list, feature_rows_list, feature_params)
+    drawer = _get_linear_drawer(gd, draw_params)
+    track_name = track_params_list[track_idx]["name"]
+    track_level = [k for k, t in gd.tracks.items() if t.name == track_name][0]
+    track = gd[track_level]
+
+    drawer.current_track_level = track_level
+    greytrack_bgs, greytrack_labels = drawer.draw_greytrack(track)
+    feature_elements, feature_labels = drawer.draw_track(track)
+    scale_axes, scale_labels = drawer.draw_scale(track) if track.scale else ([], [])
+    return track_level, dict(
+        greytrack_bgs=greytrack_bgs,
+        feature_elements=feature_elements,
+        scale_axes=scale_axes,
+        scale_labels=scale_labels,
+        feature_labels=feature_labels,
+        greytrack_labels=greytrack_labels,
+    )
+
+
+def _draw_cross_link_elements(
+    track_params_list: List[Dict[str, Any]],
+    align_coord_table: AlignCoordTable,
+    link_colors: Tuple[str, str],
+    draw_params: Dict[str, Any],
+) -> List[List[Any]]:
+    """Draw elements of cross links (Worker process function)
+
+    Args:
+        track_params_list (List[Dict[str, Any]]): Track parameters list
+        align_coord_table (AlignCoordTable): Align coord table to be drawn
+        link_colors (Tuple[str, str]): Normal & inverted cross link colors
+        draw_params (Dict[str, Any]): Draw parameters
+
+    Returns:
+        List[List[Any]]: Drawing elements of each cross link in table order
+    """
+    empty_feature_rows_list: List[List[FeatureRow]] = [[] for _ in track_params_list]
+    gd = _new_genome_diagram(track_params_list, empty_feature_rows_list, {})
+    drawer = _get_linear_drawer(gd, draw_params)
+    cross_links = align_coord_table.get_cross_links(gd.get_tracks(), *link_colors)
+    cross_link_elements = []
+    for cross_link in cross_links:
+        elements = drawer.draw_cross_link(cross_link)
+        if elements:
+            cross_link_elements.append(elements)
+    return cross_link_elements
+
+
+def _is_parallel_draw_supported() -> bool:
+    """Check private LinearDrawer API of parallel track drawing is supported
+
+    Returns:
+        bool: Check result
+    """
+    if LinearDrawer is None:
+        return False
+    version = tuple(int(v) for v in re.findall(r"\d+", Bio.__version__)[0:2])
+    min_version, max_version = PARALLEL_DRAW_BIOPYTHON_VERSIONS
+    if not min_version <= version < max_version:
+        return False
+    required_methods = (
+        "init_fragments",
+        "set_track_heights",
+        "draw_greytrack",
+        "draw_track",
+        "draw_scale",
+        "draw_cross_link",
+    )
+    return all(hasattr(LinearDrawer, method) for method in required_methods)
+
+
+def _render_figure(gd: GenomeDiagram.Diagram, format: str) -> Union[str, bytes]:
+    """Render genome diagram drawing to figure
+
+    Args:
+        gd (GenomeDiagram.Diagram): Genome diagram
+        format (str): Figure format ('jpg'|'png'|'pdf'|'svg')
+
+    Returns:
+        Union[str, bytes]: Figure string or bytes
+    """
+    if format == "svg":
+        handle = StringIO()
+        gd.write(handle, format)
+        return handle.getvalue()
+    else:
+        return gd.write_to_string(format)
+
+
+def _render_tile(
+    track_params_list: List[Dict[str, Any]],
+    feature_rows_list: List[List[FeatureRow]],
+    feature_params: Dict[str, Any],
+    align_coord_table: AlignCoordTable,
+    link_colors: Tuple[str, str],
+    draw_params: Dict[str, Any],
+    format: str,
+) -> Union[str, bytes]:
+    """Render figure tile (Worker process function)
+
+    Args:
+        track_params_list (List[Dict[str, Any]]): Track parameters list
+        feature_rows_list (List[List[FeatureRow]]): Feature rows of each track
+        feature_params (Dict[str, Any]): Feature parameters
+        align_coord_table (AlignCoordTable): Align coord table to be drawn
+        link_colors (Tuple[str, str]): Normal & inverted cross link colors
+        draw_params (Dict[str, Any]): Draw parameters
+        format (str): Figure format ('jpg'|'png'|'pdf'|'svg')
+
+    Returns:
+        Union[str, bytes]: Figure tile string or bytes
+    """
+    gd = _new_genome_diagram(track_params_list, feature_rows_list, feature_params)
+    cross_links = align_coord_table.get_cross_links(gd.get_tracks(), *link_colors)
+    gd.draw(format="linear", cross_track_links=cross_links, **draw_params)
+    return _render_figure(gd, format)
+
+
+def _make_tile_key(tile_params: Tuple[Any, ...], format: str) -> str:
+    """Make figure cache key of tile from tile contents
+
+    Args:
+        tile_params (Tuple[Any, ...]): Parameters of `_render_tile()`
+        format (str): Figure format ('jpg'|'png'|'pdf'|'svg')
+
+    Returns:
+        str: Tile figure cache key
+    """
+    (
+        track_params_list,
+        feature_rows_list,
+        feature_params,
+        table,
+        link_colors,
+        draw_params,
+    ) = tile_params
+    sha256 = hashlib.sha256()
+    params = [
+        track_params_list,
+        feature_rows_list,
+        feature_params,
+        link_colors,
+        draw_params,
+    ]
+    sha256.update(json.dumps(params, sort_keys=True, default=repr).encode())
+    for column in (
+        table.ref_starts,
+        table.ref_ends,
+        table.query_starts,
+        table.query_ends,
+        table.ref_lengths,
+        table.query_lengths,
+        table.identities,
+    ):
+        sha256.update(column.tobytes())
+    sha256.update(json.dumps([table.ref_names, table.query_names]).encode())
+    return f"tile.{sha256.hexdigest()}.{format}"
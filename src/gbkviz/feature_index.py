@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class FeatureIndex:
+    """Feature Interval Index Class
+
+    Feature start & end positions are kept as sorted arrays for each feature type,
+    so that range query costs O(log n + k) instead of scanning all features.
+    """
+
+    def __init__(
+        self,
+        types: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+        ids: Optional[Sequence[int]] = None,
+    ):
+        """FeatureIndex constructor
+
+        Args:
+            types (Sequence[str]): Feature types
+            starts (Sequence[int]): Feature start positions
+            ends (Sequence[int]): Feature end positions
+            ids (Optional[Sequence[int]], optional): Feature ids returned by query.
+                If None, 0-based order of input features is used as id.
+        """
+        if ids is None:
+            ids = range(len(types))
+        if not len(types) == len(starts) == len(ends) == len(ids):
+            raise ValueError("Feature types, starts, ends, ids length mismatch!!")
+
+        type2rows: Dict[str, List[int]] = defaultdict(list)
+        for row, feature_type in enumerate(types):
+            type2rows[feature_type].append(row)
+
+        all_starts = np.asarray(starts, dtype=np.int64)
+        all_ends = np.asarray(ends, dtype=np.int64)
+        all_ids = np.asarray(ids, dtype=np.int64)
+        self._type2index: Dict[str, Tuple[np.ndarray, ...]] = {}
+        for feature_type, rows in type2rows.items():
+            type_starts, type_ends = all_starts[rows], all_ends[rows]
+            type_ids = all_ids[rows]
+            start_order = np.argsort(type_starts, kind="stable")
+            end_order = np.argsort(type_ends, kind="stable")
+            self._type2index[feature_type] = (
+                type_starts[start_order],
+                type_ids[start_order],
+                type_ends[end_order],
+                type_ids[end_order],
+            )
+
+    @property
+    def types(self) -> List[str]:
+        """Indexed feature types"""
+        return list(self._type2index.keys())
+
+    @property
+    def type2arrays(self) -> Dict[str, Tuple[np.ndarray, ...]]:
+        """Feature type & sorted index arrays (starts, start ids, ends, end ids)"""
+        return dict(self._type2index)
+
+    @staticmethod
+    def from_arrays(type2arrays: Dict[str, Tuple[np.ndarray, ...]]) -> FeatureIndex:
+        """Restore feature index from sorted index arrays without sorting again
+
+        Args:
+            type2arrays (Dict[str, Tuple[np.ndarray, ...]]): Feature type & sorted
+                index arrays (Same as `type2arrays` property)
+
+        Returns:
+            FeatureIndex: Feature index
+        """
+        feature_index = FeatureIndex([], [], [])
+        feature_index._type2index = dict(type2arrays)
+        return feature_index
+
+    def query(
+        self,
+        feature_types: Sequence[str],
+        min_range: int,
+        max_range: int,
+    ) -> List[int]:
+        """Query ids of features whose start or end is in range
+
+        Args:
+            feature_types (Sequence[str]): Feature types to query
+            min_range (int): Min range
+            max_range (int): Max range
+
+        Returns:
+            List[int]: Sorted feature ids in range
+        """
+        hit_ids_list = []
+        for feature_type in set(feature_types):
+            if feature_type not in self._type2index:
+                continue
+            sorted_starts, start_ids, sorted_ends, end_ids = self._type2index[
+                feature_type
+            ]
+            start_lo = np.searchsorted(sorted_starts, min_range, side="left")
+            start_hi = np.searchsorted(sorted_starts, max_range, side="right")
+            end_lo = np.searchsorted(sorted_ends, min_range, side="left")
+            end_hi = np.searchsorted(sorted_ends, max_range, side="right")
+            hit_ids_list.append(start_ids[start_lo:start_hi])
+            hit_ids_list.append(end_ids[end_lo:end_hi])
+
+        if len(hit_ids_list) == 0:
+            return []
+        return np.unique(np.concatenate(hit_ids_list)).tolist()
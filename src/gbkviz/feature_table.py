@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from Bio.SeqFeature import CompoundLocation, FeatureLocation, SeqFeature
+
+from gbkviz.feature_index import FeatureIndex
+
+LABEL_TYPES = ("gene", "protein_id", "locus_tag", "product")
+
+
+class FeatureTable:
+    """Compact Columnar Feature Table Class
+
+    Each feature is stored as one row of numpy columns. Feature types and label
+    qualifier values are interned into string pools and stored as codes.
+    Only start-end of first & last location parts are kept for each feature.
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        first_ends: np.ndarray,
+        last_starts: np.ndarray,
+        strands: np.ndarray,
+        part_nums: np.ndarray,
+        type_codes: np.ndarray,
+        label_codes: Dict[str, np.ndarray],
+        ids: np.ndarray,
+        type_pool: List[str],
+        label_pool: List[str],
+    ):
+        """FeatureTable constructor
+
+        Args:
+            starts (np.ndarray): Start positions of first location part
+            ends (np.ndarray): End positions of last location part
+            first_ends (np.ndarray): End positions of first location part
+            last_starts (np.ndarray): Start positions of last location part
+            strands (np.ndarray): Strands (1, -1 or 0[unknown])
+            part_nums (np.ndarray): Location part numbers
+            type_codes (np.ndarray): Feature type codes of `type_pool`
+            label_codes (Dict[str, np.ndarray]): Label type & label codes of
+                `label_pool` dict
+            ids (np.ndarray): Source feature ids (index of SeqFeature list)
+            type_pool (List[str]): Feature type string pool
+            label_pool (List[str]): Label string pool
+        """
+        self.starts = starts
+        self.ends = ends
+        self.first_ends = first_ends
+        self.last_starts = last_starts
+        self.strands = strands
+        self.part_nums = part_nums
+        self.type_codes = type_codes
+        self.label_codes = label_codes
+        self.ids = ids
+        self.type_pool = type_pool
+        self.label_pool = label_pool
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory size of columns & string pools"""
+        columns = [self.starts, self.ends, self.first_ends, self.last_starts]
+        columns += [self.strands, self.part_nums, self.type_codes, self.ids]
+        columns += list(self.label_codes.values())
+        pools = self.type_pool + self.label_pool
+        return sum(c.nbytes for c in columns) + sum(len(s) for s in pools)
+
+    @property
+    def types(self) -> List[str]:
+        """Feature types of each row"""
+        return [self.type_pool[code] for code in self.type_codes.tolist()]
+
+    def get_labels(self, label_type: str) -> List[str]:
+        """Get label qualifier values of each row
+
+        Args:
+            label_type (str): Label type ('gene'|'protein_id'|'locus_tag'|'product')
+
+        Returns:
+            List[str]: Label qualifier values ('' if not exists)
+        """
+        if label_type not in self.label_codes:
+            raise ValueError(f"Invalid label type `{label_type}` detected!!")
+        return [self.label_pool[code] for code in self.label_codes[label_type].tolist()]
+
+    def build_index(self) -> FeatureIndex:
+        """Build feature index (id = row of table)
+
+        Returns:
+            FeatureIndex: Feature index
+        """
+        return FeatureIndex(self.types, self.starts, self.ends)
+
+    def take(self, rows: Sequence[int]) -> FeatureTable:
+        """Take rows of table
+
+        Args:
+            rows (Sequence[int]): Target rows
+
+        Returns:
+            FeatureTable: Feature table of target rows (string pools are shared)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        return FeatureTable(
+            self.starts[rows],
+            self.ends[rows],
+            self.first_ends[rows],
+            self.last_starts[rows],
+            self.strands[rows],
+            self.part_nums[rows],
+            self.type_codes[rows],
+            {k: v[rows] for k, v in self.label_codes.items()},
+            self.ids[rows],
+            self.type_pool,
+            self.label_pool,
+        )
+
+    def flip(self, length: int) -> FeatureTable:
+        """Flip feature locations to the reverse complement strand
+
+        Row order is sorted in the same way as `SeqRecord.reverse_complement()`.
+
+        Args:
+            length (int): Parent sequence length
+
+        Returns:
+            FeatureTable: Flipped feature table
+        """
+        flipped_location_starts = length - np.maximum(self.first_ends, self.ends)
+        order = np.argsort(flipped_location_starts, kind="stable")
+        return FeatureTable(
+            length - self.first_ends[order],
+            length - self.last_starts[order],
+            length - self.starts[order],
+            length - self.ends[order],
+            -self.strands[order],
+            self.part_nums[order],
+            self.type_codes[order],
+            {k: v[order] for k, v in self.label_codes.items()},
+            self.ids[order],
+            self.type_pool,
+            self.label_pool,
+        )
+
+    def aggregate(self, bin_size: float) -> FeatureTable:
+        """Aggregate features into merged blocks for level-of-detail drawing
+
+        Features are binned into `bin_size` width buckets for each feature type and
+        strand, and features in the same or adjacent buckets are merged into one
+        block. So the number of rows is bounded by the number of buckets.
+        Labels are kept only for blocks of a single feature.
+
+        Args:
+            bin_size (float): Bucket width (e.g. bp length of one pixel)
+
+        Returns:
+            FeatureTable: Aggregated feature table
+        """
+        group_keys = self.type_codes.astype(np.int64) * 3 + (self.strands + 1)
+        block_rows_list, block_ends_list, block_sizes_list = [], [], []
+        for group_key in np.unique(group_keys):
+            group_rows = np.flatnonzero(group_keys == group_key)
+            group_rows = group_rows[np.argsort(self.starts[group_rows], kind="stable")]
+            starts, ends = self.starts[group_rows], self.ends[group_rows]
+            # Start new block if start bucket is apart from previous blocks end bucket
+            prev_end_buckets = np.maximum.accumulate(ends)[:-1] // bin_size
+            is_block_start = np.ones(len(group_rows), dtype=bool)
+            is_block_start[1:] = starts[1:] // bin_size > prev_end_buckets + 1
+            block_idx = np.flatnonzero(is_block_start)
+            block_rows_list.append(group_rows[block_idx])
+            block_ends_list.append(np.maximum.reduceat(ends, block_idx))
+            block_sizes_list.append(np.diff(np.append(block_idx, len(group_rows))))
+
+        if len(block_rows_list) == 0:
+            return self
+        block_rows = np.concatenate(block_rows_list)
+        block_ends = np.concatenate(block_ends_list)
+        is_single = np.concatenate(block_sizes_list) == 1
+        table = self.take(block_rows)
+        return FeatureTable(
+            starts=table.starts,
+            ends=np.where(is_single, table.ends, block_ends),
+            first_ends=np.where(is_single, table.first_ends, block_ends),
+            last_starts=np.where(is_single, table.last_starts, table.starts),
+            strands=table.strands,
+            part_nums=np.where(is_single, table.part_nums, 1),
+            type_codes=table.type_codes,
+            label_codes={
+                k: np.where(is_single, v, 0) for k, v in table.label_codes.items()
+            },
+            ids=np.where(is_single, table.ids, -1),
+            type_pool=self.type_pool,
+            label_pool=self.label_pool,
+        )
+
+    def to_features(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        qualifiers: Optional[FeatureQualifiers] = None,
+    ) -> List[SeqFeature]:
+        """Convert rows to SeqFeature list
+
+        Multi-part location is restored with its first & last parts only.
+        If source feature qualifiers are not set, only label qualifiers are restored.
+
+        Args:
+            rows (Optional[Sequence[int]], optional): Target rows (Default: all rows)
+            qualifiers (Optional[FeatureQualifiers], optional): All qualifiers of
+                source features (Aggregated blocks get label qualifiers only)
+
+        Returns:
+            List[SeqFeature]: SeqFeature list
+        """
+        table = self if rows is None else self.take(rows)
+        ids = table.ids.tolist()
+        starts, ends = table.starts.tolist(), table.ends.tolist()
+        first_ends, last_starts = table.first_ends.tolist(), table.last_starts.tolist()
+        strands, part_nums = table.strands.tolist(), table.part_nums.tolist()
+        types = table.types
+        label_type2labels = {k: table.get_labels(k) for k in table.label_codes.keys()}
+
+        features = []
+        for row in range(len(table)):
+            strand = None if strands[row] == 0 else strands[row]
+            if part_nums[row] == 1:
+                location = FeatureLocation(starts[row], ends[row], strand)
+            else:
+                location = CompoundLocation(
+                    [
+                        FeatureLocation(starts[row], first_ends[row], strand),
+                        FeatureLocation(last_starts[row], ends[row], strand),
+                    ]
+                )
+            if qualifiers is not None and ids[row] >= 0:
+                row_qualifiers = qualifiers.get(ids[row])
+            else:
+                row_qualifiers = {}
+                for label_type, labels in label_type2labels.items():
+                    if labels[row] != "":
+                        row_qualifiers[label_type] = [labels[row]]
+            features.append(SeqFeature(location, types[row], qualifiers=row_qualifiers))
+        return features
+
+    @staticmethod
+    def from_features(
+        features: List[SeqFeature],
+        label_types: Sequence[str] = LABEL_TYPES,
+    ) -> FeatureTable:
+        """Build feature table from SeqFeature list
+
+        Features with fuzzy (non-integer) location part positions are excluded.
+
+        Args:
+            features (List[SeqFeature]): SeqFeature list
+            label_types (Sequence[str], optional): Label qualifier types to store
+
+        Returns:
+            FeatureTable: Feature table
+        """
+        type2code: Dict[str, int] = {}
+        label2code: Dict[str, int] = {"": 0}
+        positions: List[List[int]] = []
+        strands, part_nums, type_codes, ids = [], [], [], []
+        label_codes: Dict[str, List[int]] = {
+            label_type: [] for label_type in label_types
+        }
+        for idx, feature in enumerate(features):
+            parts = feature.location.parts
+            position = [parts[0].start, parts[-1].end, parts[0].end, parts[-1].start]
+            if not all(isinstance(p, int) for p in position):
+                continue
+            positions.append([int(p) for p in position])
+            strands.append(feature.location.strand or 0)
+            part_nums.append(len(parts))
+            type_codes.append(type2code.setdefault(feature.type, len(type2code)))
+            for label_type in label_types:
+                label = feature.qualifiers.get(label_type, [""])[0]
+                label_codes[label_type].append(
+                    label2code.setdefault(label, len(label2code))
+                )
+            ids.append(idx)
+
+        position_array = np.array(positions, dtype=np.int64).reshape(-1, 4)
+        return FeatureTable(
+            starts=position_array[:, 0].copy(),
+            ends=position_array[:, 1].copy(),
+            first_ends=position_array[:, 2].copy(),
+            last_starts=position_array[:, 3].copy(),
+            strands=np.array(strands, dtype=np.int8),
+            part_nums=np.array(part_nums, dtype=np.int32),
+            type_codes=np.array(type_codes, dtype=np.int16),
+            label_codes={
+                k: np.array(v, dtype=np.int32) for k, v in label_codes.items()
+            },
+            ids=np.array(ids, dtype=np.int64),
+            type_pool=list(type2code.keys()),
+            label_pool=list(label2code.keys()),
+        )
+
+
+class FeatureQualifiers:
+    """Compact Feature Qualifiers Class
+
+    Qualifiers of each source feature are stored as JSON bytes in one shared
+    buffer, and decoded only when features are restored.
+    """
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        """FeatureQualifiers constructor
+
+        Args:
+            buffer (np.ndarray): uint8 buffer of concatenated JSON qualifiers
+            offsets (np.ndarray): Start offsets of each source feature id qualifiers
+                in buffer (Last item is buffer end)
+        """
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Memory size of buffer & offsets"""
+        return self.buffer.nbytes + self.offsets.nbytes
+
+    def get(self, feature_id: int) -> Dict[str, List[str]]:
+        """Get qualifiers of source feature
+
+        Args:
+            feature_id (int): Source feature id (index of SeqFeature list)
+
+        Returns:
+            Dict[str, List[str]]: Qualifiers
+        """
+        start, end = self.offsets[feature_id], self.offsets[feature_id + 1]
+        return json.loads(self.buffer[start:end].tobytes())
+
+    @staticmethod
+    def from_features(features: List[SeqFeature]) -> FeatureQualifiers:
+        """Build feature qualifiers from SeqFeature list
+
+        Args:
+            features (List[SeqFeature]): SeqFeature list
+
+        Returns:
+            FeatureQualifiers: Feature qualifiers
+        """
+        qualifiers_bytes = [json.dumps(f.qualifiers).encode() for f in features]
+        offsets = np.zeros(len(features) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in qualifiers_bytes])
+        buffer = np.frombuffer(b"".join(qualifiers_bytes), dtype=np.uint8)
+        return FeatureQualifiers(buffer, offsets)
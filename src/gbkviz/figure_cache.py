@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+
+class FigureCache:
+    """In-Memory LRU Rendered Figure Cache Class
+
+    Rendered figure string or bytes are cached by key (e.g. draw parameter
+    fingerprint & figure format). Least recently used figures are evicted
+    when total figure size exceeds max size.
+    """
+
+    def __init__(self, max_size: int = 256 * 1024 * 1024):
+        """FigureCache constructor
+
+        Args:
+            max_size (int, optional): Max total figure size (Default: 256MB)
+        """
+        self.max_size = max_size
+        self._key2figure: OrderedDict[str, Union[str, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._key2figure)
+
+    @property
+    def size(self) -> int:
+        """Total cached figure size"""
+        return self._size
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        """Get cached figure
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Union[str, bytes]]: Figure string or bytes (None if not cached)
+        """
+        with self._lock:
+            figure = self._key2figure.get(key)
+            if figure is not None:
+                self._key2figure.move_to_end(key)
+            return figure
+
+    def set(self, key: str, figure: Union[str, bytes]) -> None:
+        """Set figure to cache
+
+        Figure larger than max size is not cached.
+
+        Args:
+            key (str): Cache key
+            figure (Union[str, bytes]): Figure string or bytes
+        """
+        with self._lock:
+            if key in self._key2figure:
+                self._size -= len(self._key2figure.pop(key))
+            if len(figure) > self.max_size:
+                return
+            self._key2figure[key] = figure
+            self._size += len(figure)
+            # Evict least recently used figures
+            while self._size > self.max_size:
+                _, evicted_figure = self._key2figure.popitem(last=False)
+                self._size -= len(evicted_figure)
+
+    def clear(self) -> None:
+        """Clear all cached figures"""
+        with self._lock:
+            self._key2figure.clear()
+            self._size = 0
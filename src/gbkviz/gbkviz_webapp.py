@@ -1,5 +1,6 @@
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
@@ -7,7 +8,7 @@ from streamlit.uploaded_file_manager import UploadedFile
 
 from gbkviz import util
 from gbkviz.__version__ import __version__
-from gbkviz.align_coord import AlignCoord
+from gbkviz.align_coord import AlignCoordTable
 from gbkviz.draw_genbank_fig import DrawGenbankFig
 from gbkviz.genbank import Genbank
 from gbkviz.genome_align import GenomeAlign
@@ -36,15 +37,15 @@ st.sidebar.markdown(repo_hyperlink + f" v{__version__}")
 # Load example files or Upload files
 if st.sidebar.checkbox(label="Load example genbank files", value=False):
     genbank_dir = Path(__file__).parent / "genbank"
-    gbk_files = sorted(list(genbank_dir.glob("*.gbk")))
-    upload_files = util.load_files(gbk_files)
+    # Example files are read directly from local files
+    upload_files: Optional[List[Union[UploadedFile, Path]]]
+    upload_files = sorted(list(genbank_dir.glob("*.gbk")))
 else:
     with st.sidebar.expander(label="Toggle Genbank Upload Box", expanded=True):
         # Genbank files upload widgets
-        upload_files: Optional[List[UploadedFile]]
         upload_files = st.file_uploader(
-            label="Upload genbank files (*.gb|*.gbk|*.gbff)",
-            type=["gb", "gbk", "gbff"],
+            label="Upload genbank files (*.gb|*.gbk|*.gbff, or gzip compressed *.gz)",
+            type=["gb", "gbk", "gbff", "gz"],
             accept_multiple_files=True,
             help=(
                 "Genomes are displayed on each track in the order of file upload.  \n"
@@ -140,6 +141,18 @@ if upload_files:
         help=":warning: ScaleTicks is not displayed if 'Align Type' = 'Center'.",
     )
 
+    # Tile render length widget
+    tile_sint = st.sidebar.selectbox(
+        label="Tile Render Length",
+        options=["None"] + list(sint2int.keys()),
+        index=0,
+        help="Figure is split into fixed length tiles along the genome axis,  \n"
+        "and each tile is shown as soon as it is rendered.  \n"
+        "This is useful for very wide figure of large genomes.  \n"
+        "Tile length is increased if there are too many tiles (more than 32).",
+    )
+    tile_length = sint2int.get(tile_sint)
+
     # Target feature types widget
     target_feature_types = st.sidebar.multiselect(
         label="Target Feature Types",
@@ -177,7 +190,8 @@ if upload_files:
             index=0,
             help="[MUMmer](https://github.com/mummer4/mummer) "
             "is used as genome comparison tool.  \n"
-            "User specified min-max genomic regions are compared.",
+            "Full-length genomes are compared once, and comparison results  \n"
+            "within user specified min-max genomic regions are drawn.",
         )
 
         # Genome comparison filter parameters
@@ -217,6 +231,7 @@ if upload_files:
 
     gbk_info_placeholder: DeltaGenerator = st.empty()
     warning_placeholder: DeltaGenerator = st.empty()
+    cross_link_warning_placeholder: DeltaGenerator = st.empty()
     dl_btn_cols: List[DeltaGenerator] = st.columns([3, 3, 5])
     dl_png_btn_placeholder: DeltaGenerator = dl_btn_cols[0].empty()
     dl_svg_btn_placeholder: DeltaGenerator = dl_btn_cols[1].empty()
@@ -229,10 +244,36 @@ if upload_files:
 
         st.markdown("**Display Genome Min-Max Range & Reverse Option**")
 
-        range_cols: List[DeltaGenerator] = st.columns([3, 3, 1])
-
+        # Target record selectbox widget for multi-record genbank file
+        gbk_containers: List[DeltaGenerator] = []
+        target_record_names: List[Optional[str]] = []
         for upload_gbk_file in upload_files:
-            gbk = util.read_upload_gbk_file(upload_gbk_file)
+            gbk_container = st.container()
+            record_name: Optional[str] = None
+            record_names = util.get_upload_gbk_record_names(upload_gbk_file)
+            if len(record_names) >= 2:
+                record_name = gbk_container.selectbox(
+                    label=f"{upload_gbk_file.name} (Records={len(record_names):,})",
+                    options=record_names,
+                    index=0,
+                    key=upload_gbk_file.name,
+                )
+            gbk_containers.append(gbk_container)
+            target_record_names.append(record_name)
+
+        # Parse genbank files not parsed yet in parallel with progress bar
+        parse_progress_placeholder: DeltaGenerator = st.empty()
+
+        def update_parse_progress(done_num: int, total_num: int) -> None:
+            parse_progress_placeholder.progress(done_num / total_num)
+
+        read_gbk_list = util.read_upload_gbk_files(
+            upload_files, target_record_names, update_parse_progress
+        )
+        parse_progress_placeholder.empty()
+
+        for gbk_container, gbk in zip(gbk_containers, read_gbk_list):
+            range_cols: List[DeltaGenerator] = gbk_container.columns([3, 3, 1])
 
             # Min-Max range input widget
             range_label = f"{gbk.name} (Max={gbk.full_length:,} bp)"
@@ -262,7 +303,7 @@ if upload_files:
             )
 
             if min_range > max_range:
-                st.error("'Max Range' must be larger than 'Min Range'")
+                gbk_container.error("'Max Range' must be larger than 'Min Range'")
                 st.stop()
 
             gbk.min_range = min_range
@@ -278,53 +319,48 @@ if upload_files:
             f"Track{cnt:02d}: "
             f"{gbk.name} ({gbk.min_range:,} - {gbk.max_range:,} bp), "
             f"Length={gbk.range_length:,} bp, "
-            f"CDS={len(gbk.extract_range_features()):,}  \n"
+            f"CDS={gbk.count_range_features():,}  \n"
         )
     gbk_info_placeholder.markdown(all_gbk_info)
 
-    # Show too many CDS warning
-    MAX_FEATURE = 1000
-    max_feature_count = max(
-        [len(gbk.extract_range_features(target_feature_types)) for gbk in gbk_list]
-    )
-    if max_feature_count > MAX_FEATURE:
-        warning_msg = (
-            f"Because there are too many features to be drawn (more than {MAX_FEATURE})"
-            ",  \nthe number of features to be drawn is limited to only long sequence."
-        )
-        warning_placeholder.warning(warning_msg)
-
     # Genome alignment
-    align_coords: List[AlignCoord] = []
+    align_coord_table = AlignCoordTable.from_align_coords([])
     gbkviz_tmpdir = Path.home() / ".gbkviz"
     gbkviz_tmpdir.mkdir(exist_ok=True)
+    align_cache_dir = gbkviz_tmpdir / "align_cache"
     if genome_comparison is not None:
         genome_fasta_files: List[Path] = []
         gbkviz_session_tmpdir = util.make_session_dir(gbkviz_tmpdir)
         for gbk in gbk_list:
-            # Make genome fasta file
-            suffix = "_reverse.fa" if gbk.reverse else ".fa"
-            filename = f"{gbk.name}_{gbk.min_range}-{gbk.max_range}{suffix}"
-            genome_fasta_file = gbkviz_session_tmpdir / filename
+            # Make full-length forward strand genome fasta file
+            genome_fasta_file = gbkviz_session_tmpdir / f"{gbk.name}.fa"
             if not genome_fasta_file.exists():
-                gbk.write_genome_fasta(genome_fasta_file, range=True)
+                gbk.write_genome_fasta(genome_fasta_file, range=False, reverse=False)
             genome_fasta_files.append(genome_fasta_file)
-        # Run MUMmer genome alignment
+        # Run MUMmer genome alignment (Cached results are reused if already aligned)
         seqtype, maptype = genome_comparison.split(" ")
+        # MUMmer temporary files are written to local temporary directory
         genome_align = GenomeAlign(
-            genome_fasta_files, gbkviz_session_tmpdir, seqtype, maptype
+            genome_fasta_files,
+            tempfile.gettempdir(),
+            seqtype,
+            maptype,
+            align_cache_dir,
         )
-        align_coords = genome_align.run()
-        align_coords = AlignCoord.filter(align_coords, min_length, min_identity)
+        # Slice full genome align coords to min-max range & reverse option
+        align_coord_table = genome_align.run_table().slice_range(gbk_list)
+        align_coord_table = align_coord_table.filter(min_length, min_identity)
 
     # Remove old genome comparison result directory
     for session_dir in gbkviz_tmpdir.iterdir():
-        util.remove_olddir(session_dir)
+        if session_dir not in (align_cache_dir, util.GENOME_CACHE_DIR):
+            util.remove_olddir(session_dir)
 
     # Create visualization and comparison figure
+    MAX_FEATURE, MAX_CROSS_LINK = 1000, 5000
     dgf = DrawGenbankFig(
         gbk_list=gbk_list,
-        align_coords=align_coords,
+        align_coords=align_coord_table,
         show_label=show_label,
         show_scale=show_scale,
         show_ticks=show_ticks,
@@ -343,33 +379,66 @@ if upload_files:
         target_feature_types=target_feature_types,
         feature2color=feature2color,
         max_feature=MAX_FEATURE,
+        max_cross_link=MAX_CROSS_LINK,
     )
 
+    # Show too many CDS warning
+    if dgf.max_range_feature > MAX_FEATURE:
+        warning_msg = (
+            f"Because there are too many features to be drawn (more than {MAX_FEATURE})"
+            ",  \nadjacent features on each strand are merged into blocks to be drawn."
+        )
+        warning_placeholder.warning(warning_msg)
+
+    # Show too many cross links warning
+    if dgf.merged_cross_link_num > 0 or dgf.dropped_cross_link_num > 0:
+        warning_msg = (
+            "Because there are too many comparison results to be drawn "
+            f"(more than {MAX_CROSS_LINK}),  \n"
+            f"{dgf.merged_cross_link_num:,} results are merged into adjacent results "
+            f"and {dgf.dropped_cross_link_num:,} short results are not drawn."
+        )
+        cross_link_warning_placeholder.warning(warning_msg)
+
     # Show figure
-    png_bytes = dgf.get_figure("png")
-    fig_placeholder.image(png_bytes, use_column_width="never")
-
-    # Download figure button widget
-    dl_png_btn_placeholder.download_button(
-        label="Download PNG Figure",
-        data=png_bytes,
-        file_name="gbkviz_figure.png",
-    )
-    dl_svg_btn_placeholder.download_button(
-        label="Download SVG Figure",
-        data=dgf.get_figure("svg"),
-        file_name="gbkviz_figure.svg",
-    )
+    if tile_length is None:
+        png_bytes = dgf.get_figure("png")
+        fig_placeholder.image(png_bytes, use_column_width="never")
+        # Download figure button widget
+        dl_png_btn_placeholder.download_button(
+            label="Download PNG Figure",
+            data=png_bytes,
+            file_name="gbkviz_figure.png",
+        )
+    else:
+        # Show figure tiles progressively as soon as rendered
+        fig_tile_container: DeltaGenerator = fig_placeholder.container()
+        for start, end, tile_png_bytes in dgf.iter_tile_figures(tile_length, "png"):
+            fig_tile_container.image(
+                tile_png_bytes,
+                caption=f"{start:,} - {end:,} bp",
+                use_column_width="never",
+            )
+        # Whole PNG figure is created only when requested
+        if dl_png_btn_placeholder.button(label="Create PNG Figure"):
+            dl_png_btn_placeholder.download_button(
+                label="Download PNG Figure",
+                data=dgf.get_figure("png"),
+                file_name="gbkviz_figure.png",
+            )
+    # SVG figure is created only when requested
+    if dl_svg_btn_placeholder.button(label="Create SVG Figure"):
+        dl_svg_btn_placeholder.download_button(
+            label="Download SVG Figure",
+            data=dgf.get_figure("svg"),
+            file_name="gbkviz_figure.svg",
+        )
 
     # Download align coords button widget
-    if align_coords:
-        header = (
-            "REF_START\tREF_END\tQUERY_START\tQUERY_END\tREF_LENGTH\t"
-            + "QUERY_LENGTH\tIDENTITY\tREF_NAME\tQUERY_NAME\n"
-        )
+    if len(align_coord_table) > 0:
         dl_align_coords_btn_placeholder.download_button(
             label="Download Comparison Result",
-            data=header + "\n".join([ac.as_tsv_format for ac in align_coords]),
+            data=align_coord_table.to_tsv(header=True),
             file_name="gbkviz_comparison.tsv",
         )
 else:
@@ -1,42 +1,137 @@
-from io import StringIO
+from __future__ import annotations
+
+import copy
+import gzip
+import hashlib
+import io
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
+import numpy as np
 from Bio import SeqIO
+from Bio.Seq import Seq, SequenceDataAbstractBaseClass
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqRecord import SeqRecord
 
+from gbkviz.feature_index import FeatureIndex
+from gbkviz.feature_table import FeatureQualifiers, FeatureTable
+
+# Magic bytes of binary pre-parsed genbank file
+BINARY_MAGIC = b"GBKVIZ02"
+# Magic bytes of gzip compressed file
+GZIP_MAGIC = b"\x1f\x8b"
+# Bases of 2-bit codes in packed genome sequence
+PACKED_BASES = b"ACGT"
+
 
 class Genbank:
     """Genbank Class"""
 
     def __init__(
         self,
-        gbk_file: Union[str, StringIO, Path],
+        gbk_file: Union[str, Path, TextIO, BinaryIO, SeqRecord],
         name: str = "",
         min_range: Optional[int] = None,
         max_range: Optional[int] = None,
         reverse: bool = False,
+        record_name: Optional[str] = None,
+        compact: bool = False,
     ):
         """Genbank constructor
 
         Args:
-            gbk_file (Union[str, StringIO, Path]): Genbank file
+            gbk_file (Union[str, Path, TextIO, BinaryIO, SeqRecord]): Genbank file,
+                file handle (gzip compressed file is also available) or record
             name (str, optional): Name
             min_range (Optional[int], optional): Min range
             max_range (Optional[int], optional): Max range
             reverse (bool, optional): Reverse or not
+            record_name (Optional[str], optional): Target record (LOCUS) name in
+                multi-record genbank file. If None, first record is read.
+            compact (bool, optional): If True, keep features only as compact feature
+                table & qualifiers and release SeqFeature objects to reduce memory
+                usage. Features are restored from table with all qualifiers, but
+                multi-part location is restored with its first & last parts only.
         """
-        self._record: SeqRecord = list(SeqIO.parse(gbk_file, "genbank"))[0]
+        if isinstance(gbk_file, SeqRecord):
+            record = gbk_file
+        else:
+            record = self._read_record(gbk_file, record_name)
         self.name: str = name
         self.min_range: int = 1 if min_range is None else min_range
-        self.max_range: int = len(self._record.seq) if max_range is None else max_range
+        self.max_range: int = len(record.seq) if max_range is None else max_range
         self.reverse: bool = reverse
+        self.compact: bool = compact
+        feature_table = FeatureTable.from_features(record.features)
+        qualifiers = None
+        if compact:
+            qualifiers = FeatureQualifiers.from_features(record.features)
+            record = copy.copy(record)
+            record.features = []
+        self._data = _GenbankData(
+            record, feature_table, feature_table.build_index(), qualifiers=qualifiers
+        )
+
+    def view(
+        self,
+        name: Optional[str] = None,
+        min_range: Optional[int] = None,
+        max_range: Optional[int] = None,
+        reverse: Optional[bool] = None,
+    ) -> Genbank:
+        """Get lightweight view of genbank
+
+        View shares parsed record, feature table & lazily computed reverse strand
+        data with this genbank, and has its own name, min-max range & reverse.
+
+        Args:
+            name (Optional[str], optional): Name (Default: same as this genbank)
+            min_range (Optional[int], optional): Min range (Default: 1)
+            max_range (Optional[int], optional): Max range (Default: full length)
+            reverse (Optional[bool], optional): Reverse or not (Default: False)
+
+        Returns:
+            Genbank: Genbank view
+        """
+        gbk_view = copy.copy(self)
+        gbk_view.name = self.name if name is None else name
+        gbk_view.min_range = 1 if min_range is None else min_range
+        gbk_view.max_range = self.full_length if max_range is None else max_range
+        gbk_view.reverse = False if reverse is None else reverse
+        return gbk_view
 
     @property
     def full_length(self) -> int:
         """Whole genome sequence length"""
-        return len(self.record.seq)
+        return len(self._record.seq)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory size of genome sequence, feature table & qualifiers"""
+        nbytes = self.full_length + self._data.feature_table.nbytes
+        if self._data.qualifiers is not None:
+            nbytes += self._data.qualifiers.nbytes
+        return nbytes
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of genome sequence & features (Computed only once)"""
+        data = self._data
+        if data.content_hash is None:
+            sha256 = hashlib.sha256(bytes(data.record.seq))
+            table = data.feature_table
+            columns = [table.starts, table.ends, table.first_ends, table.last_starts]
+            columns += [table.strands, table.part_nums, table.type_codes, table.ids]
+            columns += list(table.label_codes.values())
+            for column in columns:
+                sha256.update(column.tobytes())
+            pools = (table.type_pool, table.label_pool, list(table.label_codes.keys()))
+            sha256.update(repr(pools).encode())
+            data.content_hash = sha256.hexdigest()
+        return data.content_hash
 
     @property
     def range_length(self) -> int:
@@ -47,10 +142,36 @@ class Genbank:
     def record(self) -> SeqRecord:
         """Genbank record"""
         if self.reverse is True:
-            return self._record.reverse_complement()
+            if self._data.reverse_record is None:
+                self._data.reverse_record = self._record.reverse_complement(
+                    features=self._features
+                )
+            return self._data.reverse_record
         else:
             return self._record
 
+    @property
+    def _record(self) -> SeqRecord:
+        """Forward strand genbank record"""
+        return self._data.record
+
+    @property
+    def _features(self) -> List[SeqFeature]:
+        """All features of current strand record"""
+        if self.compact is True:
+            return self._table.to_features(qualifiers=self._data.qualifiers)
+        if self.reverse is False:
+            return self._record.features
+        if self._data.reverse_features is None:
+            # Flip feature locations directly instead of reverse complement
+            # whole record, then sort in the same way as reverse_complement()
+            reverse_features = [
+                f._flip(self.full_length) for f in self._record.features
+            ]
+            reverse_features.sort(key=lambda f: f.location.start)
+            self._data.reverse_features = reverse_features
+        return self._data.reverse_features
+
     def extract_all_features(
         self,
         feature_types: List[str] = ["CDS"],
@@ -63,7 +184,7 @@ class Genbank:
         Returns:
             List[SeqFeature]: All features
         """
-        return [f for f in self.record.features if f.type in feature_types]
+        return [f for f in self._features if f.type in feature_types]
 
     def extract_range_features(
         self,
@@ -77,32 +198,571 @@ class Genbank:
         Returns:
             List[SeqFeature]: Features in range
         """
-        range_features = []
-        for feature in self.extract_all_features(feature_types):
-            start, end = feature.location.parts[0].start, feature.location.parts[-1].end
-            if isinstance(start, int) and isinstance(end, int):
-                if (
-                    self.min_range <= start <= self.max_range
-                    or self.min_range <= end <= self.max_range
-                ):
-                    range_features.append(feature)
-
-        return range_features
+        rows = self._index.query(feature_types, self.min_range, self.max_range)
+        if self.compact is True:
+            return self._table.to_features(rows, self._data.qualifiers)
+        features = self._record.features
+        range_ids = self._table.ids[rows].tolist()
+        if self.reverse is True:
+            return [features[i]._flip(self.full_length) for i in range_ids]
+        else:
+            return [features[i] for i in range_ids]
+
+    def extract_range_table(
+        self,
+        feature_types: List[str] = ["CDS"],
+    ) -> FeatureTable:
+        """Extract features in range as compact feature table
+
+        Args:
+            feature_types (List[str]): Feature types to extract
+
+        Returns:
+            FeatureTable: Feature table in range
+        """
+        rows = self._index.query(feature_types, self.min_range, self.max_range)
+        return self._table.take(rows)
+
+    def count_range_features(
+        self,
+        feature_types: List[str] = ["CDS"],
+    ) -> int:
+        """Count features in range
+
+        Args:
+            feature_types (List[str]): Feature types to count
+
+        Returns:
+            int: Feature count in range
+        """
+        return len(self._index.query(feature_types, self.min_range, self.max_range))
+
+    @property
+    def _table(self) -> FeatureTable:
+        """Feature table of current strand record"""
+        data = self._data
+        if self.reverse is False:
+            return data.feature_table
+        if data.reverse_feature_table is None:
+            data.reverse_feature_table = data.feature_table.flip(self.full_length)
+        return data.reverse_feature_table
+
+    @property
+    def _index(self) -> FeatureIndex:
+        """Feature index of current strand record"""
+        if self.reverse is False:
+            return self._data.feature_index
+        if self._data.reverse_feature_index is None:
+            self._data.reverse_feature_index = self._table.build_index()
+        return self._data.reverse_feature_index
 
     def write_genome_fasta(
         self,
         outfile: Union[str, Path],
         range: bool = False,
+        reverse: Optional[bool] = None,
+        chunk_size: int = 1024 * 1024,
     ) -> None:
         """Write genome fasta file
 
+        Sequence is written in fixed size chunks sliced from sequence buffer
+        (reverse complemented chunk by chunk from region end if reverse),
+        so whole sequence string of region is never built.
+        Sequence lines are wrapped at 60 columns in the same way as SeqIO.
+
         Args:
             outfile (Union[str, Path]): Output genome fasta file
             range (bool): Write range genome or full genome
+            reverse (Optional[bool]): Write reverse complement genome or not.
+                If None, `reverse` property is used.
+            chunk_size (int, optional): Sequence chunk size to be written at once
+                (Rounded down to multiple of line width)
         """
-        if range:
-            write_seq = self.record.seq[self.min_range - 1 : self.max_range]
+        reverse = self.reverse if reverse is None else reverse
+        seq = self._record.seq
+        if range and reverse:
+            # Forward strand region of reverse strand range
+            start = self.full_length - self.max_range
+            end = self.full_length - self.min_range + 1
+        elif range:
+            start, end = self.min_range - 1, self.max_range
         else:
-            write_seq = self.record.seq
-        with open(outfile, "w") as f:
-            f.write(f">{self.name}\n{write_seq}\n")
+            start, end = 0, self.full_length
+        # Chunks start at line start, so each chunk is wrapped independently
+        line_width = 60
+        chunk_size = max(chunk_size // line_width, 1) * line_width
+        with open(outfile, "wb") as f:
+            f.write(f">{self.name}\n".encode())
+            for chunk_start, chunk_end in _iter_chunks(start, end, chunk_size, reverse):
+                chunk = seq[chunk_start:chunk_end]
+                if reverse:
+                    chunk = chunk.reverse_complement()
+                f.write(_wrap_lines(bytes(chunk), line_width))
+
+    def write_binary(self, outfile: Union[str, Path]) -> None:
+        """Write binary pre-parsed genbank file to be loaded by `load_binary()`
+
+        Genome sequence is packed into 2-bit bases with lowercase & non-ACGT runs.
+        Packed sequence, feature table columns, all feature qualifiers & sorted
+        feature index arrays are written as raw arrays after JSON header of
+        record info, content hash & string pools.
+
+        Args:
+            outfile (Union[str, Path]): Output binary file
+        """
+        data = self._data
+        table = data.feature_table
+        qualifiers = data.qualifiers
+        if qualifiers is None:
+            qualifiers = FeatureQualifiers.from_features(data.record.features)
+        arrays = _pack_seq(bytes(data.record.seq))
+        arrays.update(
+            {
+                "starts": table.starts,
+                "ends": table.ends,
+                "first_ends": table.first_ends,
+                "last_starts": table.last_starts,
+                "strands": table.strands,
+                "part_nums": table.part_nums,
+                "type_codes": table.type_codes,
+                "ids": table.ids,
+                "qualifier_buffer": qualifiers.buffer,
+                "qualifier_offsets": qualifiers.offsets,
+            }
+        )
+        for label_type, label_codes in table.label_codes.items():
+            arrays[f"label_codes.{label_type}"] = label_codes
+        index_types = []
+        for idx, (feature_type, index_arrays) in enumerate(
+            data.feature_index.type2arrays.items()
+        ):
+            index_types.append(feature_type)
+            for array_idx, index_array in enumerate(index_arrays):
+                arrays[f"index.{idx}.{array_idx}"] = index_array
+
+        # Arrays are aligned to 8 bytes for memory-mapped view of any dtype
+        array_infos, offset = {}, 0
+        for key, array in arrays.items():
+            array_infos[key] = (array.dtype.str, len(array), offset)
+            offset += -(-array.nbytes // 8) * 8
+        header = {
+            "id": data.record.id,
+            "name": data.record.name,
+            "description": data.record.description,
+            "seq_length": len(data.record.seq),
+            "content_hash": self.content_hash,
+            "type_pool": table.type_pool,
+            "label_pool": table.label_pool,
+            "label_types": list(table.label_codes.keys()),
+            "index_types": index_types,
+            "arrays": array_infos,
+        }
+        header_bytes = json.dumps(header).encode()
+        data_start = _get_binary_data_start(len(header_bytes))
+        with open(outfile, "wb") as f:
+            f.write(BINARY_MAGIC + len(header_bytes).to_bytes(8, "little"))
+            f.write(header_bytes)
+            for key, array in arrays.items():
+                f.seek(data_start + array_infos[key][2])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + offset)
+
+    @staticmethod
+    def load_binary(
+        binary_file: Union[str, Path],
+        name: str = "",
+        min_range: Optional[int] = None,
+        max_range: Optional[int] = None,
+        reverse: bool = False,
+    ) -> Genbank:
+        """Load binary pre-parsed genbank file written by `write_binary()`
+
+        Packed genome sequence, feature table columns, qualifiers & feature index
+        arrays are memory-mapped, so loading costs almost nothing regardless of
+        genome size. Sequence is unpacked only for sliced region when accessed.
+        Loaded genbank is compact (Features are restored from feature table).
+
+        Args:
+            binary_file (Union[str, Path]): Binary pre-parsed genbank file
+            name (str, optional): Name
+            min_range (Optional[int], optional): Min range
+            max_range (Optional[int], optional): Max range
+            reverse (bool, optional): Reverse or not
+
+        Returns:
+            Genbank: Genbank object
+        """
+        with open(binary_file, "rb") as f:
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"Invalid binary genbank file '{binary_file}'!!")
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        data_start = _get_binary_data_start(header_size)
+        buffer = np.memmap(binary_file, dtype=np.uint8, mode="r")
+        arrays: Dict[str, np.ndarray] = {}
+        for key, (dtype, length, offset) in header["arrays"].items():
+            start = data_start + offset
+            end = start + length * np.dtype(dtype).itemsize
+            arrays[key] = buffer[start:end].view(dtype)
+
+        record = SeqRecord(
+            Seq(_PackedSequenceData(arrays, header["seq_length"])),
+            id=header["id"],
+            name=header["name"],
+            description=header["description"],
+        )
+        table = FeatureTable(
+            starts=arrays["starts"],
+            ends=arrays["ends"],
+            first_ends=arrays["first_ends"],
+            last_starts=arrays["last_starts"],
+            strands=arrays["strands"],
+            part_nums=arrays["part_nums"],
+            type_codes=arrays["type_codes"],
+            label_codes={k: arrays[f"label_codes.{k}"] for k in header["label_types"]},
+            ids=arrays["ids"],
+            type_pool=header["type_pool"],
+            label_pool=header["label_pool"],
+        )
+        feature_index = FeatureIndex.from_arrays(
+            {
+                feature_type: tuple(arrays[f"index.{idx}.{i}"] for i in range(4))
+                for idx, feature_type in enumerate(header["index_types"])
+            }
+        )
+        qualifiers = FeatureQualifiers(
+            arrays["qualifier_buffer"], arrays["qualifier_offsets"]
+        )
+        # Genbank is set up from loaded data without parsing record
+        gbk = Genbank.__new__(Genbank)
+        gbk.name, gbk.compact = name, True
+        gbk._data = _GenbankData(
+            record, table, feature_index, header["content_hash"], qualifiers
+        )
+        return gbk.view(name, min_range, max_range, reverse)
+
+    @staticmethod
+    def parse(
+        gbk_file: Union[str, Path, TextIO, BinaryIO],
+        record_names: Optional[List[str]] = None,
+    ) -> Iterator[Genbank]:
+        """Parse multi-record genbank file lazily as Genbank of each record (contig)
+
+        Only one record is kept in memory at a time while parsing.
+
+        Args:
+            gbk_file (Union[str, Path, TextIO, BinaryIO]): Genbank file
+            record_names (Optional[List[str]], optional): Target record (LOCUS) names.
+                If None, all records are target.
+
+        Yields:
+            Genbank: Genbank object named by record name
+        """
+        with _open_gbk_file(gbk_file) as handle:
+            for record in SeqIO.parse(handle, "genbank"):
+                if record_names is None or record.name in record_names:
+                    yield Genbank(record, record.name)
+
+    @staticmethod
+    def get_record_names(gbk_file: Union[str, Path, TextIO, BinaryIO]) -> List[str]:
+        """Get record (LOCUS) names in genbank file without parsing records
+
+        File & binary handle are scanned for 'LOCUS' lines in raw byte chunks
+        without decoding other lines.
+
+        Args:
+            gbk_file (Union[str, Path, TextIO, BinaryIO]): Genbank file
+
+        Returns:
+            List[str]: Record names
+        """
+        record_names = []
+        if isinstance(gbk_file, io.TextIOBase):
+            for line in gbk_file:
+                if line.startswith("LOCUS"):
+                    record_names.append(_get_locus_name(line))
+        else:
+            with _open_gbk_binary_file(gbk_file) as handle:
+                for locus_line in _iter_locus_lines(handle):
+                    record_names.append(_get_locus_name(locus_line))
+        if not isinstance(gbk_file, (str, Path)):
+            gbk_file.seek(0)
+        return record_names
+
+    @staticmethod
+    def _read_record(
+        gbk_file: Union[str, Path, TextIO, BinaryIO],
+        record_name: Optional[str] = None,
+    ) -> SeqRecord:
+        """Read one genbank record without parsing other records
+
+        Args:
+            gbk_file (Union[str, Path, TextIO, BinaryIO]): Genbank file
+            record_name (Optional[str], optional): Target record (LOCUS) name
+
+        Returns:
+            SeqRecord: Genbank record
+        """
+        with _open_gbk_file(gbk_file) as handle:
+            if record_name is not None and not _seek_record(handle, record_name):
+                raise ValueError(f"Record '{record_name}' is not found!!")
+            try:
+                return next(SeqIO.parse(handle, "genbank"))
+            except StopIteration:
+                raise ValueError("No genbank record is found!!")
+
+
+class _PackedSequenceData(SequenceDataAbstractBaseClass):
+    """Packed genome sequence data provider of Seq object
+
+    Sequence is unpacked from memory-mapped 2-bit bases, lowercase & non-ACGT
+    runs only for sliced region.
+    """
+
+    __slots__ = ("_arrays", "_length")
+
+    def __init__(self, arrays: Dict[str, np.ndarray], length: int):
+        """_PackedSequenceData constructor
+
+        Args:
+            arrays (Dict[str, np.ndarray]): Packed sequence arrays of `_pack_seq()`
+            length (int): Sequence length
+        """
+        self._arrays = arrays
+        self._length = length
+        super().__init__()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, bytes]:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self._length))
+            if len(positions) == 0:
+                return b""
+            if positions.step == 1:
+                return _unpack_seq(self._arrays, positions[0], positions[-1] + 1)
+            lo, hi = min(positions[0], positions[-1]), max(positions[0], positions[-1])
+            seq = _unpack_seq(self._arrays, lo, hi + 1)
+            return seq[positions[0] - lo :: positions.step][: len(positions)]
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("sequence index out of range")
+        return _unpack_seq(self._arrays, key, key + 1)[0]
+
+
+def _pack_seq(seq: bytes) -> Dict[str, np.ndarray]:
+    """Pack sequence bytes into 2-bit bases, lowercase runs & non-ACGT runs
+
+    Args:
+        seq (bytes): Sequence bytes
+
+    Returns:
+        Dict[str, np.ndarray]: Packed sequence arrays (2-bit bases, start-end of
+            lowercase runs, start-end & uppercase byte of same non-ACGT byte runs)
+    """
+    array = np.frombuffer(seq, dtype=np.uint8)
+    is_lower = (array >= ord("a")) & (array <= ord("z"))
+    upper = np.where(is_lower, array - 32, array).astype(np.uint8)
+    base2code = np.full(256, 255, dtype=np.uint8)
+    base2code[np.frombuffer(PACKED_BASES, dtype=np.uint8)] = np.arange(4)
+    codes = base2code[upper]
+    is_other = codes == 255
+
+    # Four 2-bit codes are packed into one byte (Non-ACGT bases are packed as 'A')
+    padded_codes = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded_codes[: len(codes)] = np.where(is_other, 0, codes)
+    packed = padded_codes[0::4] | padded_codes[1::4] << 2
+    packed |= padded_codes[2::4] << 4 | padded_codes[3::4] << 6
+
+    lower_starts, lower_ends = _get_runs(is_lower, is_lower)
+    other_starts, other_ends = _get_runs(is_other, upper)
+    return {
+        "seq_packed": packed,
+        "seq_lower_starts": lower_starts,
+        "seq_lower_ends": lower_ends,
+        "seq_other_starts": other_starts,
+        "seq_other_ends": other_ends,
+        "seq_other_bytes": upper[other_starts],
+    }
+
+
+def _get_runs(flags: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get start-end of flagged runs of same value"""
+    is_run_start = np.ones(len(flags), dtype=bool)
+    is_run_start[1:] = (flags[1:] != flags[:-1]) | (values[1:] != values[:-1])
+    starts = np.flatnonzero(is_run_start)
+    ends = np.append(starts[1:], len(flags))
+    is_flagged = flags[starts]
+    return starts[is_flagged], ends[is_flagged]
+
+
+def _unpack_seq(arrays: Dict[str, np.ndarray], start: int, end: int) -> bytes:
+    """Unpack sequence region bytes from packed sequence arrays of `_pack_seq()`
+
+    Args:
+        arrays (Dict[str, np.ndarray]): Packed sequence arrays
+        start (int): Region start (0-based)
+        end (int): Region end
+
+    Returns:
+        bytes: Sequence bytes of region
+    """
+    packed = arrays["seq_packed"][start // 4 : -(-end // 4)]
+    codes = (packed[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+    codes = codes.ravel()[start % 4 : start % 4 + end - start]
+    seq = np.frombuffer(PACKED_BASES, dtype=np.uint8)[codes]
+
+    other_starts, other_ends = arrays["seq_other_starts"], arrays["seq_other_ends"]
+    positions, run_idx = _get_run_positions(other_starts, other_ends, start, end)
+    seq[positions] = arrays["seq_other_bytes"][run_idx]
+    lower_starts, lower_ends = arrays["seq_lower_starts"], arrays["seq_lower_ends"]
+    positions, _ = _get_run_positions(lower_starts, lower_ends, start, end)
+    seq[positions] += 32
+    return seq.tobytes()
+
+
+def _get_run_positions(
+    starts: np.ndarray, ends: np.ndarray, region_start: int, region_end: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get region relative positions & run indices of sorted runs in region"""
+    lo = np.searchsorted(ends, region_start, side="right")
+    hi = np.searchsorted(starts, region_end, side="left")
+    run_starts = np.maximum(starts[lo:hi], region_start) - region_start
+    run_ends = np.minimum(ends[lo:hi], region_end) - region_start
+    lengths = run_ends - run_starts
+    run_offsets = np.cumsum(lengths) - lengths - run_starts
+    positions = np.arange(lengths.sum()) - np.repeat(run_offsets, lengths)
+    return positions, np.repeat(np.arange(lo, hi), lengths)
+
+
+def _get_binary_data_start(header_size: int) -> int:
+    """Get 8 bytes aligned data section start position of binary genbank file"""
+    return -(-(len(BINARY_MAGIC) + 8 + header_size) // 8) * 8
+
+
+@dataclass
+class _GenbankData:
+    """Parsed Genbank Data Shared among Genbank Views
+
+    Reverse strand data & content hash are computed lazily only when required.
+    """
+
+    record: SeqRecord
+    feature_table: FeatureTable
+    feature_index: FeatureIndex
+    content_hash: Optional[str] = None
+    qualifiers: Optional[FeatureQualifiers] = None
+    reverse_record: Optional[SeqRecord] = None
+    reverse_features: Optional[List[SeqFeature]] = None
+    reverse_feature_table: Optional[FeatureTable] = None
+    reverse_feature_index: Optional[FeatureIndex] = None
+
+
+@contextmanager
+def _open_gbk_file(gbk_file: Union[str, Path, TextIO, BinaryIO]) -> Iterator[TextIO]:
+    """Open genbank file as text handle
+
+    File & binary handle are decoded incrementally without reading whole contents,
+    and decompressed on the fly if gzip compressed. Text handle (e.g. StringIO)
+    is used as it is. Binary handle is not closed (must be seekable).
+    """
+    if isinstance(gbk_file, io.TextIOBase):
+        yield gbk_file
+        return
+    with _open_gbk_binary_file(gbk_file) as binary_handle:
+        handle = io.TextIOWrapper(binary_handle, encoding="utf-8")
+        try:
+            yield handle
+        finally:
+            # Detach text handle not to close binary handle
+            handle.detach()
+
+
+@contextmanager
+def _open_gbk_binary_file(gbk_file: Union[str, Path, BinaryIO]) -> Iterator[BinaryIO]:
+    """Open genbank file as binary handle
+
+    Gzip compressed file is decompressed on the fly.
+    Binary handle is not closed (must be seekable).
+    """
+    if isinstance(gbk_file, (str, Path)):
+        with open(gbk_file, "rb") as f, _open_gbk_binary_file(f) as handle:
+            yield handle
+        return
+    magic = gbk_file.read(len(GZIP_MAGIC))
+    gbk_file.seek(-len(magic), io.SEEK_CUR)
+    if magic == GZIP_MAGIC:
+        with gzip.GzipFile(fileobj=gbk_file, mode="rb") as gzip_handle:
+            yield gzip_handle
+    else:
+        yield gbk_file
+
+
+def _iter_locus_lines(handle: BinaryIO, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+    """Iterate 'LOCUS' lines of genbank binary handle scanned in byte chunks"""
+    rest = b""
+    for chunk in iter(lambda: handle.read(chunk_size), b""):
+        # Scan complete lines only, and carry over last incomplete line
+        lines_end = chunk.rfind(b"\n") + 1
+        if lines_end == 0:
+            rest += chunk
+            continue
+        yield from _find_locus_lines(rest + chunk[:lines_end])
+        rest = chunk[lines_end:]
+    yield from _find_locus_lines(rest)
+
+
+def _find_locus_lines(lines: bytes) -> Iterator[str]:
+    """Find 'LOCUS' lines in bytes of lines"""
+    lines = b"\n" + lines
+    pos = lines.find(b"\nLOCUS")
+    while pos != -1:
+        end = lines.find(b"\n", pos + 1)
+        yield lines[pos + 1 : len(lines) if end == -1 else end].decode()
+        pos = lines.find(b"\nLOCUS", pos + 1)
+
+
+def _get_locus_name(locus_line: str) -> str:
+    """Get record name from genbank 'LOCUS' line"""
+    fields = locus_line.split()
+    return fields[1] if len(fields) >= 2 else ""
+
+
+def _seek_record(handle: TextIO, record_name: str) -> bool:
+    """Seek genbank file handle to the start of target record
+
+    Args:
+        handle (TextIO): Genbank file handle
+        record_name (str): Target record (LOCUS) name
+
+    Returns:
+        bool: Target record is found or not
+    """
+    record_pos = handle.tell()
+    for line in iter(handle.readline, ""):
+        if line.startswith("LOCUS") and _get_locus_name(line) == record_name:
+            handle.seek(record_pos)
+            return True
+        elif line.startswith("//"):
+            record_pos = handle.tell()
+    return False
+
+
+def _iter_chunks(
+    start: int, end: int, chunk_size: int, reverse: bool = False
+) -> Iterator[Tuple[int, int]]:
+    """Iterate start-end of fixed size chunks (from end to start if reverse)"""
+    if reverse:
+        for chunk_end in range(end, start, -chunk_size):
+            yield max(chunk_end - chunk_size, start), chunk_end
+    else:
+        for chunk_start in range(start, end, chunk_size):
+            yield chunk_start, min(chunk_start + chunk_size, end)
+
+
+def _wrap_lines(seq: bytes, line_width: int) -> bytes:
+    """Wrap sequence bytes into lines of line width"""
+    lines = [seq[i : i + line_width] + b"\n" for i in range(0, len(seq), line_width)]
+    return b"".join(lines)
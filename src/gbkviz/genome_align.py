@@ -1,15 +1,46 @@
-import itertools
-import multiprocessing as mp
-import os
 import platform
 import shutil
 import subprocess as sp
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-import streamlit as st
+from gbkviz.align_cache import AlignCache
+from gbkviz.align_coord import AlignCoord, AlignCoordTable
+from gbkviz.worker_pool import get_max_job_num
 
-from gbkviz.align_coord import AlignCoord
+# Process-wide in-memory LRU cache of genome pair alignment results
+_PAIR_CACHE: "OrderedDict[str, AlignCoordTable]" = OrderedDict()
+_PAIR_CACHE_MAX_NUM = 256
+_PAIR_CACHE_LOCK = threading.Lock()
+
+
+# Process-wide MUMmer job executor shared by all GenomeAlign runs (sessions).
+# Each job runs MUMmer as subprocess, so threads are sufficient to run jobs in
+# parallel. Jobs over max job number wait in FIFO queue instead of running at once.
+# CPU count is split with process-wide worker pool (see `worker_pool`).
+_JOB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=get_max_job_num(), thread_name_prefix="gbkviz_mummer"
+)
+
+
+def set_max_job_num(max_job_num: int) -> None:
+    """Set max number of concurrent MUMmer jobs of process-wide job executor
+
+    Jobs already submitted to previous executor are run to completion.
+
+    Args:
+        max_job_num (int): Max number of concurrent MUMmer jobs
+    """
+    global _JOB_EXECUTOR
+    prev_executor = _JOB_EXECUTOR
+    _JOB_EXECUTOR = ThreadPoolExecutor(
+        max_workers=max_job_num, thread_name_prefix="gbkviz_mummer"
+    )
+    prev_executor.shutdown(wait=False)
 
 
 class GenomeAlign:
@@ -21,39 +52,109 @@ class GenomeAlign:
         outdir: Union[str, Path],
         seqtype: str = "nucleotide",
         maptype: str = "one-to-one",
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         """GenomeAlign constructor
 
         Args:
             genome_fasta_files (List[Union[str, Path]]): Genome fasta files
-            outdir (Union[str, Path]): Output directory
+            outdir (Union[str, Path]): Output directory of MUMmer temporary files
             seqtype (str, optional): "nucleotide" or "protein"
             maptype (str, optional): "one-to-one" or "many-to-many"
+            cache_dir (Optional[Union[str, Path]], optional): Persistent alignment
+                cache directory. If None, alignment results are not cached on disk.
         """
         self.genome_fasta_files: List[Path] = [Path(f) for f in genome_fasta_files]
         self.outdir = Path(outdir)
         self.seqtype = seqtype.lower()
         self.maptype = maptype.lower()
+        self.cache: Optional[AlignCache] = None
+        if cache_dir is not None:
+            self.cache = AlignCache(cache_dir)
 
-    @st.cache(allow_output_mutation=True, ttl=3600)
     def run(self) -> List[AlignCoord]:
         """Run MUMmer genome alignment
 
         Returns:
             List[AlignCoords]: Genome alignment coordinates
         """
-        # Prepare data for run MUMmer with multiprocessing
-        mp_data_list: List[Tuple[Path, Path, int]] = []
+        return self.run_table().to_align_coords()
+
+    def run_table(self) -> AlignCoordTable:
+        """Run MUMmer genome alignment and get results as align coord table
+
+        Each adjacent genome pair is cached independently by its fasta contents
+        and options, so only pairs whose inputs changed are realigned.
+        Cached results are kept as align coord table, so they can be sliced &
+        drawn without converting to AlignCoord objects.
+
+        Returns:
+            AlignCoordTable: Genome alignment coordinates table
+        """
+        # Reuse cached alignment results of unchanged genome pairs
+        idx2results: Dict[int, AlignCoordTable] = {}
+        idx2key: Dict[int, str] = {}
+        job_list: List[Tuple[Path, Path, int]] = []
         for idx in range(0, self.genome_num - 1):
             fa_file1 = self.genome_fasta_files[idx]
             fa_file2 = self.genome_fasta_files[idx + 1]
-            mp_data_list.append((fa_file1, fa_file2, idx))
+            key = AlignCache.make_key(fa_file1, fa_file2, self.seqtype, self.maptype)
+            cached_table = self._get_cached_table(key)
+            if cached_table is None:
+                idx2key[idx] = key
+                job_list.append((fa_file1, fa_file2, idx))
+            else:
+                idx2results[idx] = cached_table
+
+        # Run MUMmer jobs in shared executor for changed genome pairs only
+        futures = [_JOB_EXECUTOR.submit(self._run_mummer, *job) for job in job_list]
+        for (_, _, idx), future in zip(job_list, futures):
+            align_coords = future.result()
+            if self.cache is not None:
+                self.cache.set(idx2key[idx], align_coords, self.seqtype)
+            idx2results[idx] = self._set_cached_table(idx2key[idx], align_coords)
+
+        results = [idx2results[idx] for idx in sorted(idx2results.keys())]
+        return AlignCoordTable.concat(results)
+
+    def _get_cached_table(self, key: str) -> Optional[AlignCoordTable]:
+        """Get cached align coord table from memory or persistent cache
+
+        Args:
+            key (str): Genome pair cache key
 
-        # Run MUMmer with multiprocessing
-        with mp.Pool(processes=self._process_num) as p:
-            results = p.starmap(self._run_mummer, mp_data_list)
+        Returns:
+            Optional[AlignCoordTable]: Align coord table (None if not cached)
+        """
+        with _PAIR_CACHE_LOCK:
+            if key in _PAIR_CACHE:
+                _PAIR_CACHE.move_to_end(key)
+                return _PAIR_CACHE[key]
+        if self.cache is not None:
+            align_coords = self.cache.get(key, self.seqtype)
+            if align_coords is not None:
+                return self._set_cached_table(key, align_coords)
+        return None
+
+    def _set_cached_table(
+        self, key: str, align_coords: List[AlignCoord]
+    ) -> AlignCoordTable:
+        """Set align coords to memory cache as align coord table
 
-        return list(itertools.chain.from_iterable(results))
+        Args:
+            key (str): Genome pair cache key
+            align_coords (List[AlignCoord]): Align coords
+
+        Returns:
+            AlignCoordTable: Cached align coord table
+        """
+        table = AlignCoordTable.from_align_coords(align_coords)
+        with _PAIR_CACHE_LOCK:
+            _PAIR_CACHE[key] = table
+            _PAIR_CACHE.move_to_end(key)
+            while len(_PAIR_CACHE) > _PAIR_CACHE_MAX_NUM:
+                _PAIR_CACHE.popitem(last=False)
+        return table
 
     @property
     def genome_num(self) -> int:
@@ -80,43 +181,56 @@ class GenomeAlign:
         else:
             raise ValueError(f"Invalid maptype '{self.maptype}'")
 
-    @property
-    def _process_num(self) -> int:
-        cpu_num = os.cpu_count()
-        return 1 if cpu_num is None or cpu_num == 1 else cpu_num - 1
-
     def _run_mummer(self, fa_file1: Path, fa_file2: Path, idx: int) -> List[AlignCoord]:
-        """Run MUMmer function for multiprocessing
+        """Run MUMmer function for shared job executor
+
+        delta-filter output is parsed from stdout stream by native delta parser.
+        Only nucmer|promer delta file is written to temporary directory in output
+        directory, and it is removed after run.
 
         Args:
             fa_file1 (Path): Input genome fasta 1
             fa_file2 (Path): Input genome fasta 2
-            idx (int): Multiprocessing index
+            idx (int): Job index
 
         Returns:
             List[AlignCoord]: AlignCoord list
         """
-        # Run genome alignment using nucmer or promer
-        prefix = self.outdir / f"out{idx}"
-        delta_file = prefix.with_suffix(".delta")
-        cmd = f"{self._align_bin} {fa_file1} {fa_file2} --prefix={prefix}"
-        _ = sp.run(cmd, shell=True, capture_output=True, text=True)
-
-        # Run delta-filter to map 'one-to-one' or 'many-to-many' relation
-        filter_delta_file = self.outdir / f"filter_out{idx}.delta"
-        cmd = f"delta-filter {self._map_opt} {delta_file} > {filter_delta_file}"
-        _ = sp.run(cmd, shell=True, capture_output=True, text=True)
-
-        # Run show-coords to extract alingment coords
-        coords_file = self.outdir / f"coords{idx}.tsv"
-        cmd = f"show-coords -H -T {filter_delta_file} > {coords_file}"
-        _ = sp.run(cmd, shell=True, capture_output=True, text=True)
-
-        align_coords = AlignCoord.parse(coords_file, self.seqtype)
-
-        # Delete work files
-        for work_file in (delta_file, filter_delta_file, coords_file):
-            os.unlink(work_file)
+        with tempfile.TemporaryDirectory(dir=self.outdir) as tmpdir:
+            # Run genome alignment using nucmer or promer
+            prefix = Path(tmpdir) / f"out{idx}"
+            cmd = [self._align_bin, str(fa_file1), str(fa_file2), f"--prefix={prefix}"]
+            sp.run(cmd, capture_output=True, text=True, check=True)
+
+            # Run delta-filter to map 'one-to-one' or 'many-to-many' relation,
+            # and parse filtered delta from stdout to extract alignment coords.
+            # stderr is written to temporary file, so that delta-filter is not
+            # blocked by full stderr pipe while stdout is being parsed.
+            filter_cmd = ["delta-filter", self._map_opt, f"{prefix}.delta"]
+            parse_error: Optional[ValueError] = None
+            with tempfile.TemporaryFile("w+", dir=tmpdir) as filter_stderr_file:
+                with sp.Popen(
+                    filter_cmd, stdout=sp.PIPE, stderr=filter_stderr_file, text=True
+                ) as filter_proc:
+                    try:
+                        align_coords = AlignCoord.parse_delta_stream(
+                            filter_proc.stdout, "delta-filter stdout"
+                        )
+                    except ValueError as e:
+                        # Read rest of stdout to get return code of delta-filter
+                        parse_error = e
+                        for _ in filter_proc.stdout:
+                            pass
+                filter_stderr_file.seek(0)
+                filter_stderr = filter_stderr_file.read()
+
+        # Failed delta-filter (e.g. truncated output) takes precedence over parse error
+        if filter_proc.returncode != 0:
+            raise sp.CalledProcessError(
+                filter_proc.returncode, filter_cmd, stderr=filter_stderr
+            ) from parse_error
+        if parse_error is not None:
+            raise parse_error
 
         return align_coords
 
@@ -131,7 +245,7 @@ class GenomeAlign:
         if platform.system() not in ("Darwin", "Linux"):
             return False
         # Mummer binary installation check
-        required_bins = ["nucmer", "promer", "delta-filter", "show-coords"]
+        required_bins = ["nucmer", "promer", "delta-filter"]
         for required_bin in required_bins:
             if not shutil.which(required_bin):
                 return False
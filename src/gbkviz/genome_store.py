@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from gbkviz.genbank import Genbank
+from gbkviz.worker_pool import get_max_worker_num, get_worker_pool
+
+
+class GenomeStore:
+    """In-Memory LRU Parsed Genome Store Class
+
+    Parsed genbank is stored by SHA-256 of genbank file bytes & record name,
+    so same genome uploaded in different sessions is parsed & held only once.
+    Each caller gets its own lightweight view of stored genbank, so name,
+    min-max range & reverse can be changed without affecting stored genbank.
+    Least recently used genomes are evicted when total genome size exceeds
+    max size.
+
+    If cache directory is set, genbank first seen is also written as binary
+    pre-parsed file named by the content hash, and memory-mapped on later loads
+    instead of parsing (e.g. after eviction or in other processes).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_cache_size: int = 2 * 1024 * 1024 * 1024,
+    ):
+        """GenomeStore constructor
+
+        Args:
+            max_size (int, optional): Max total genome size (Default: 1GB)
+            cache_dir (Optional[Union[str, Path]], optional): Binary pre-parsed
+                genbank cache directory (None: No binary cache)
+            max_cache_size (int, optional): Max total binary cache file size
+                (Default: 2GB)
+        """
+        self.max_size = max_size
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.max_cache_size = max_cache_size
+        self._key2gbk: OrderedDict[Tuple[str, Optional[str]], Genbank] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._key2gbk)
+
+    @property
+    def size(self) -> int:
+        """Total stored genome size"""
+        return self._size
+
+    def get(
+        self,
+        gbk_file: Union[str, Path, BinaryIO],
+        name: str = "",
+        record_name: Optional[str] = None,
+    ) -> Genbank:
+        """Get view of stored genbank (Genbank is parsed & stored if not stored)
+
+        Genbank file is hashed & parsed in streaming without reading whole contents.
+
+        Args:
+            gbk_file (Union[str, Path, BinaryIO]): Genbank file or seekable binary
+                handle (gzip compressed file is also available)
+            name (str, optional): Name of genbank view
+            record_name (Optional[str], optional): Target record (LOCUS) name in
+                multi-record genbank file. If None, first record is read.
+
+        Returns:
+            Genbank: Genbank view
+        """
+        return self.get_all([gbk_file], [name], [record_name], process_num=1)[0]
+
+    def get_all(
+        self,
+        gbk_files: List[Union[str, Path, BinaryIO]],
+        names: Optional[List[str]] = None,
+        record_names: Optional[List[Optional[str]]] = None,
+        process_num: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Genbank]:
+        """Get views of stored genbanks (Genbanks not stored are parsed in parallel)
+
+        Genbanks not stored in memory nor binary cache are parsed in process-wide
+        worker pool,
+        and views are returned in the same order as genbank files.
+
+        Args:
+            gbk_files (List[Union[str, Path, BinaryIO]]): Genbank files or seekable
+                binary handles (gzip compressed file is also available)
+            names (Optional[List[str]], optional): Names of genbank views
+            record_names (Optional[List[Optional[str]]], optional): Target record
+                (LOCUS) names in multi-record genbank file of each genbank file
+            process_num (Optional[int], optional): Max number of genbanks parsed
+                concurrently in process-wide worker pool (Default: Max worker
+                number of the pool, 1: Parse in this process)
+            progress_callback (Optional[Callable[[int, int], None]], optional):
+                Function called with (done number, total number) of unique genomes
+                each time genome is loaded or parsed
+
+        Returns:
+            List[Genbank]: Genbank views
+        """
+        names = [""] * len(gbk_files) if names is None else names
+        record_names = [None] * len(gbk_files) if record_names is None else record_names
+        keys = [(_get_content_hash(f), r) for f, r in zip(gbk_files, record_names)]
+        total_num = len(set(keys))
+
+        # Get stored or binary cached genbanks (Load outside of lock)
+        key2gbk: Dict[Tuple[str, Optional[str]], Genbank] = {}
+        key2parse_args: Dict[Tuple[str, Optional[str]], Tuple[Any, ...]] = {}
+        for key, gbk_file in zip(keys, gbk_files):
+            if key in key2gbk or key in key2parse_args:
+                continue
+            with self._lock:
+                gbk = self._key2gbk.get(key)
+                if gbk is not None:
+                    self._key2gbk.move_to_end(key)
+            if gbk is None:
+                gbk = self._load_binary(key)
+                if gbk is not None:
+                    gbk = self._set(key, gbk)
+            if gbk is None:
+                key2parse_args[key] = (gbk_file, key[1])
+            else:
+                key2gbk[key] = gbk
+                if progress_callback is not None:
+                    progress_callback(len(key2gbk), total_num)
+
+        # Parse genbanks not stored (in worker pool if there are 2 or more)
+        process_num = get_max_worker_num() if process_num is None else process_num
+        process_num = min(process_num or 1, len(key2parse_args))
+        if process_num <= 1:
+            key2parsed_gbk = (
+                (key, _parse_genbank(*args)) for key, args in key2parse_args.items()
+            )
+        else:
+            key2parsed_gbk = _iter_parse_genbanks(key2parse_args, process_num)
+        self._add_parsed_genbanks(key2parsed_gbk, key2gbk, total_num, progress_callback)
+
+        return [key2gbk[key].view(name=name) for key, name in zip(keys, names)]
+
+    def _add_parsed_genbanks(
+        self,
+        key2parsed_gbk: Iterator[Tuple[Tuple[str, Optional[str]], Genbank]],
+        key2gbk: Dict[Tuple[str, Optional[str]], Genbank],
+        total_num: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Add parsed genbanks to store & binary cache as soon as parsed
+
+        Args:
+            key2parsed_gbk (Iterator[Tuple[Tuple[str, Optional[str]], Genbank]]):
+                Store key & parsed genbank iterator
+            key2gbk (Dict[Tuple[str, Optional[str]], Genbank]): Store key & genbank
+                dict to be updated
+            total_num (int): Total number of unique genomes
+            progress_callback (Optional[Callable[[int, int], None]], optional):
+                Function called with (done number, total number) of unique genomes
+        """
+        for key, gbk in key2parsed_gbk:
+            self._write_binary(key, gbk)
+            key2gbk[key] = self._set(key, gbk)
+            if progress_callback is not None:
+                progress_callback(len(key2gbk), total_num)
+
+    def _set(self, key: Tuple[str, Optional[str]], gbk: Genbank) -> Genbank:
+        """Set genbank to store (Already stored genbank is kept if exists)
+
+        Genbank larger than max size is not stored.
+
+        Args:
+            key (Tuple[str, Optional[str]]): Store key
+            gbk (Genbank): Genbank
+
+        Returns:
+            Genbank: Stored genbank
+        """
+        with self._lock:
+            if key in self._key2gbk:
+                # Same genome is parsed concurrently in other session
+                return self._key2gbk[key]
+            if gbk.nbytes > self.max_size:
+                return gbk
+            self._key2gbk[key] = gbk
+            self._size += gbk.nbytes
+            # Evict least recently used genomes
+            while self._size > self.max_size:
+                _, evicted_gbk = self._key2gbk.popitem(last=False)
+                self._size -= evicted_gbk.nbytes
+            return gbk
+
+    def clear(self) -> None:
+        """Clear all stored genomes (Binary cache files are kept)"""
+        with self._lock:
+            self._key2gbk.clear()
+            self._size = 0
+
+    def _binary_file(self, key: Tuple[str, Optional[str]]) -> Optional[Path]:
+        """Binary cache file path of key (None if cache directory is not set)"""
+        if self.cache_dir is None:
+            return None
+        content_hash, record_name = key
+        if record_name is None:
+            return self.cache_dir / f"{content_hash}.gbkbin"
+        return self.cache_dir / f"{content_hash}.{record_name}.gbkbin"
+
+    def _load_binary(self, key: Tuple[str, Optional[str]]) -> Optional[Genbank]:
+        """Load binary cache file of key (None if not cached)"""
+        binary_file = self._binary_file(key)
+        if binary_file is None:
+            return None
+        try:
+            # Update last access time for LRU eviction
+            os.utime(binary_file)
+            return Genbank.load_binary(binary_file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_binary(self, key: Tuple[str, Optional[str]], gbk: Genbank) -> None:
+        """Write binary cache file of key & evict least recently used files"""
+        binary_file = self._binary_file(key)
+        if binary_file is None:
+            return
+        # Write to temporary file & rename for concurrent access from processes
+        binary_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=binary_file.parent, suffix=".tmp")
+        os.close(fd)
+        gbk.write_binary(tmp_file)
+        os.replace(tmp_file, binary_file)
+
+        binary_files = []
+        for cache_file in binary_file.parent.glob("*.gbkbin"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            binary_files.append((stat.st_mtime, stat.st_size, cache_file))
+        total_size = sum(size for _, size, _ in binary_files)
+        for _, size, cache_file in sorted(binary_files):
+            if total_size <= self.max_cache_size:
+                break
+            try:
+                cache_file.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def _parse_genbank(
+    gbk_file: Union[str, Path, BinaryIO],
+    record_name: Optional[str] = None,
+) -> Genbank:
+    """Parse genbank file as compact genbank (Worker process function)
+
+    Args:
+        gbk_file (Union[str, Path, BinaryIO]): Genbank file or binary handle
+        record_name (Optional[str], optional): Target record (LOCUS) name
+
+    Returns:
+        Genbank: Compact genbank
+    """
+    return Genbank(gbk_file, record_name=record_name, compact=True)
+
+
+def _iter_parse_genbanks(
+    key2parse_args: Dict[Tuple[str, Optional[str]], Tuple[Any, ...]],
+    process_num: int,
+) -> Iterator[Tuple[Tuple[str, Optional[str]], Genbank]]:
+    """Parse genbanks in process-wide worker pool
+
+    At most `process_num` genbanks are submitted to the pool at once, and
+    parsed genbanks are yielded in order of completion.
+
+    Args:
+        key2parse_args (Dict[Tuple[str, Optional[str]], Tuple[Any, ...]]): Store
+            key & parse arguments dict
+        process_num (int): Max number of genbanks parsed concurrently
+
+    Yields:
+        Tuple[Tuple[str, Optional[str]], Genbank]: Store key & parsed genbank
+    """
+    executor = get_worker_pool()
+    parse_items = iter(key2parse_args.items())
+    future2key: Dict["Future[Genbank]", Tuple[str, Optional[str]]] = {}
+    for key, args in islice(parse_items, process_num):
+        future2key[executor.submit(_parse_genbank, *args)] = key
+    while len(future2key) > 0:
+        done, _ = wait(future2key, return_when=FIRST_COMPLETED)
+        for future in done:
+            key = future2key.pop(future)
+            for next_key, next_args in islice(parse_items, 1):
+                future2key[executor.submit(_parse_genbank, *next_args)] = next_key
+            yield key, future.result()
+
+
+def _get_content_hash(gbk_file: Union[str, Path, BinaryIO]) -> str:
+    """Get SHA-256 hex digest of file contents (Binary handle is rewound)"""
+    sha256 = hashlib.sha256()
+    if isinstance(gbk_file, (str, Path)):
+        with open(gbk_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+    else:
+        gbk_file.seek(0)
+        for chunk in iter(lambda: gbk_file.read(1024 * 1024), b""):
+            sha256.update(chunk)
+        gbk_file.seek(0)
+    return sha256.hexdigest()
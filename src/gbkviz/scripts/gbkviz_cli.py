@@ -0,0 +1,124 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from gbkviz.__version__ import __version__
+from gbkviz.batch import load_manifest, run_batch
+
+
+def main():
+    """GBKviz CLI main function for entrypoint"""
+    args = get_args()
+    if args.command == "batch":
+        try:
+            failed_num = batch(
+                args.manifest,
+                args.outdir,
+                None if args.no_cache else args.cache_dir,
+                args.process_num,
+                args.force,
+            )
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+        sys.exit(1 if failed_num > 0 else 0)
+
+
+def batch(
+    manifest_file: Path,
+    outdir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    process_num: Optional[int] = None,
+    force: bool = False,
+) -> int:
+    """Render all panels in manifest without Streamlit
+
+    Args:
+        manifest_file (Path): Manifest JSON file
+        outdir (Optional[Path], optional): Output directory
+        cache_dir (Optional[Path], optional): Alignment cache directory
+        process_num (Optional[int], optional): Number of processes
+        force (bool, optional): Render panels even if outputs are up to date
+
+    Returns:
+        int: Number of failed panels
+    """
+    panels = load_manifest(manifest_file, outdir)
+    failed_num = 0
+    for cnt, (panel, status) in enumerate(
+        run_batch(panels, cache_dir, process_num, force), 1
+    ):
+        print(f"[{cnt}/{len(panels)}] {panel.name}: {status}", flush=True)
+        if status.startswith("failed"):
+            failed_num += 1
+    return failed_num
+
+
+def get_args():
+    """Get arguments
+
+    Returns:
+        argparse.Namespace: Argument values
+    """
+    desc = "Simple web application to visualize and compare genomes in Genbank files"
+    parser = argparse.ArgumentParser(description=desc)
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"v{__version__}",
+        help="Print version information",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    batch_desc = "Render figures & comparison results of panels in manifest JSON file"
+    batch_parser = subparsers.add_parser(
+        "batch", description=batch_desc, help=batch_desc
+    )
+    batch_parser.add_argument(
+        "manifest",
+        type=Path,
+        help="Manifest JSON file of genbank panels & options",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--outdir",
+        type=Path,
+        help="Output directory (Default: 'outdir' in manifest)",
+        default=None,
+        metavar="",
+    )
+    default_cache_dir = Path.home() / ".gbkviz" / "align_cache"
+    batch_parser.add_argument(
+        "-c",
+        "--cache_dir",
+        type=Path,
+        help=f"Genome alignment cache directory (Default: {default_cache_dir})",
+        default=default_cache_dir,
+        metavar="",
+    )
+    batch_parser.add_argument(
+        "--no_cache",
+        help="Disable genome alignment cache",
+        action="store_true",
+    )
+    batch_parser.add_argument(
+        "-t",
+        "--process_num",
+        type=int,
+        help="Number of processes to render panels (Default: CPU count)",
+        default=None,
+        metavar="",
+    )
+    batch_parser.add_argument(
+        "-f",
+        "--force",
+        help="Render all panels even if outputs are up to date",
+        action="store_true",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
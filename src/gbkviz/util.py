@@ -1,36 +1,20 @@
 import os
 import shutil
 import time
-from io import StringIO
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Callable, List, Optional, Union
 
 import streamlit as st
 from streamlit.scriptrunner import get_script_run_ctx
-from streamlit.uploaded_file_manager import UploadedFile, UploadedFileRec
+from streamlit.uploaded_file_manager import UploadedFile
 
 from gbkviz.genbank import Genbank
+from gbkviz.genome_store import GenomeStore
 
-
-def load_files(files: List[Path]) -> List[UploadedFile]:
-    """Load files as uploaded files
-
-    Args:
-        files (List[Path]): files
-
-    Returns:
-        List[UploadedFile]: Uploaded files
-    """
-    uploaded_files: List[UploadedFile] = []
-    for id, file in enumerate(files, 1):
-        filename = Path(file).name
-        type = "application/octet-stream"
-        with open(file, "rb") as f:
-            filebytes = f.read()
-        record = UploadedFileRec(id, filename, type, filebytes)
-        uploaded_files.append(UploadedFile(record))
-
-    return uploaded_files
+# Process-wide parsed genome store shared by all sessions
+GENOME_CACHE_DIR = Path.home() / ".gbkviz" / "genome_cache"
+_GENOME_STORE = GenomeStore(cache_dir=GENOME_CACHE_DIR)
 
 
 def get_session_id() -> str:
@@ -72,17 +56,107 @@ def remove_olddir(target_dir: Path, ttl: int = 600) -> None:
         shutil.rmtree(target_dir, ignore_errors=True)
 
 
-@st.cache(allow_output_mutation=True, ttl=3600)
-def read_upload_gbk_file(upload_gbk_file: UploadedFile) -> Genbank:
+@st.cache(ttl=3600)
+def get_upload_gbk_record_names(
+    upload_gbk_file: Union[UploadedFile, Path]
+) -> List[str]:
+    """Get record names of uploaded genbank file from Streamlit app
+
+    Args:
+        upload_gbk_file (Union[UploadedFile, Path]): Uploaded genbank file or
+            local genbank file (e.g. example file)
+
+    Returns:
+        List[str]: Record (LOCUS) names
+    """
+    return Genbank.get_record_names(_open_upload_file(upload_gbk_file))
+
+
+def read_upload_gbk_file(
+    upload_gbk_file: Union[UploadedFile, Path],
+    record_name: Optional[str] = None,
+) -> Genbank:
     """Read uploaded genbank file from Streamlit app
 
+    Genbank is parsed only once among sessions by process-wide genome store,
+    and returned as session own view of stored genbank.
+    Gzip compressed genbank file (e.g. '*.gbk.gz') is decompressed on the fly.
+
     Args:
-        upload_gbk_file (UploadedFile): Uploaded genbank file
+        upload_gbk_file (Union[UploadedFile, Path]): Uploaded genbank file or
+            local genbank file (e.g. example file)
+        record_name (Optional[str], optional): Target record name of
+            multi-record genbank file. If None, first record is read.
 
     Returns:
         Genbank: Genbank class object
     """
-    return Genbank(
-        gbk_file=StringIO(upload_gbk_file.getvalue().decode("utf-8")),
-        name=Path(upload_gbk_file.name).stem,
+    name = get_upload_gbk_name(upload_gbk_file)
+    if record_name is not None:
+        name = f"{name}_{record_name}"
+    return _GENOME_STORE.get(_open_upload_file(upload_gbk_file), name, record_name)
+
+
+def read_upload_gbk_files(
+    upload_gbk_files: List[Union[UploadedFile, Path]],
+    record_names: Optional[List[Optional[str]]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[Genbank]:
+    """Read uploaded genbank files from Streamlit app
+
+    Genbank files not parsed yet are parsed in parallel by process pool,
+    and Genbank objects are returned in upload order.
+
+    Args:
+        upload_gbk_files (List[Union[UploadedFile, Path]]): Uploaded genbank files
+            or local genbank files (e.g. example files)
+        record_names (Optional[List[Optional[str]]], optional): Target record names
+            of each genbank file. If None, first record of each file is read.
+        progress_callback (Optional[Callable[[int, int], None]], optional):
+            Function called with (done number, total number) of genomes
+
+    Returns:
+        List[Genbank]: Genbank class objects
+    """
+    if record_names is None:
+        record_names = [None] * len(upload_gbk_files)
+    names = []
+    for upload_gbk_file, record_name in zip(upload_gbk_files, record_names):
+        name = get_upload_gbk_name(upload_gbk_file)
+        if record_name is not None:
+            name = f"{name}_{record_name}"
+        names.append(name)
+    return _GENOME_STORE.get_all(
+        [_open_upload_file(f) for f in upload_gbk_files],
+        names,
+        record_names,
+        progress_callback=progress_callback,
     )
+
+
+def get_upload_gbk_name(upload_gbk_file: Union[UploadedFile, Path]) -> str:
+    """Get genbank name from uploaded file name without '.gz' & file extension
+
+    Args:
+        upload_gbk_file (Union[UploadedFile, Path]): Uploaded genbank file
+
+    Returns:
+        str: Genbank name
+    """
+    filename = Path(upload_gbk_file.name)
+    if filename.suffix.lower() == ".gz":
+        filename = filename.with_suffix("")
+    return filename.stem
+
+
+def _open_upload_file(
+    upload_gbk_file: Union[UploadedFile, Path]
+) -> Union[Path, BinaryIO]:
+    """Open uploaded file as independent binary handle (Path is used as it is)
+
+    Binary handle shares uploaded bytes without copy, and its position is
+    independent of uploaded file.
+    """
+    if isinstance(upload_gbk_file, Path):
+        return upload_gbk_file
+    return BytesIO(upload_gbk_file.getvalue())
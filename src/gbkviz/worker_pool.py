@@ -0,0 +1,50 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Process-wide worker pool shared by genbank parsing & figure rendering
+# (Created on first use, so that worker processes start only once)
+_WORKER_POOL: Optional[ProcessPoolExecutor] = None
+_WORKER_POOL_LOCK = threading.Lock()
+
+
+def get_max_worker_num() -> int:
+    """Get max number of worker processes (Half of CPU count)
+
+    The other half of CPU count is left to MUMmer jobs, so that worker
+    processes & MUMmer jobs running at the same time do not oversubscribe CPU.
+
+    Returns:
+        int: Max number of worker processes
+    """
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def get_max_job_num() -> int:
+    """Get max number of concurrent MUMmer jobs (CPU count - max worker number)
+
+    Returns:
+        int: Max number of concurrent MUMmer jobs
+    """
+    return max(1, (os.cpu_count() or 1) - get_max_worker_num())
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """Get process-wide worker pool (Created on first use)
+
+    Worker processes are started by 'spawn', because forking multithreaded
+    process (e.g. Streamlit server) is unsafe.
+
+    Returns:
+        ProcessPoolExecutor: Worker pool
+    """
+    global _WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL is None:
+            _WORKER_POOL = ProcessPoolExecutor(
+                max_workers=get_max_worker_num(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _WORKER_POOL
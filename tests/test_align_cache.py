@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+from typing import List
+
+from gbkviz import align_cache as align_cache_module
+from gbkviz.align_cache import AlignCache
+from gbkviz.align_coord import AlignCoord
+
+
+def test_make_key(genome_fasta_files: List[Path]):
+    """test make key"""
+    fa_file1, fa_file2 = genome_fasta_files[0:2]
+    key = AlignCache.make_key(fa_file1, fa_file2, "nucleotide", "one-to-one")
+    assert key == AlignCache.make_key(fa_file1, fa_file2, "Nucleotide", "One-to-One")
+    assert key != AlignCache.make_key(fa_file2, fa_file1, "nucleotide", "one-to-one")
+    assert key != AlignCache.make_key(fa_file1, fa_file2, "protein", "one-to-one")
+    assert key != AlignCache.make_key(fa_file1, fa_file2, "nucleotide", "many-to-many")
+
+
+def test_make_key_memoized(genome_fasta_files: List[Path], tmp_path: Path, monkeypatch):
+    """test make key reads each unchanged fasta file only once"""
+    align_cache_module._FILE_DIGEST_CACHE.clear()
+    read_files = []
+
+    def _open(file, *args, **kwargs):
+        read_files.append(Path(file).name)
+        return open(file, *args, **kwargs)
+
+    monkeypatch.setattr(align_cache_module, "open", _open, raising=False)
+    fa_file1, fa_file2, fa_file3 = genome_fasta_files[0:3]
+    key1 = AlignCache.make_key(fa_file1, fa_file2, "nucleotide", "one-to-one")
+    key2 = AlignCache.make_key(fa_file2, fa_file3, "nucleotide", "one-to-one")
+    assert key1 == AlignCache.make_key(fa_file1, fa_file2, "nucleotide", "one-to-one")
+    assert key2 == AlignCache.make_key(fa_file2, fa_file3, "nucleotide", "one-to-one")
+    assert read_files == [fa_file1.name, fa_file2.name, fa_file3.name]
+
+    # Changed fasta file is read again
+    changed_fa_file = tmp_path / "changed.fa"
+    changed_fa_file.write_text(">changed\nATGC\n")
+    key3 = AlignCache.make_key(fa_file1, changed_fa_file, "nucleotide", "one-to-one")
+    changed_fa_file.write_text(">changed\nATGCATGC\n")
+    assert key3 != AlignCache.make_key(
+        fa_file1, changed_fa_file, "nucleotide", "one-to-one"
+    )
+    assert read_files.count(changed_fa_file.name) == 2
+
+
+def test_get_set(tmp_path: Path):
+    """test get & set"""
+    cache = AlignCache(tmp_path / "cache")
+    align_coords = [
+        AlignCoord(1, 100, 201, 300, 100, 100, 85.5, "ref", "query"),
+        AlignCoord(500, 401, 601, 700, 100, 100, 90.25, "ref", "query"),
+    ]
+    assert cache.get("key") is None
+    cache.set("key", align_coords)
+    assert cache.get("key") == align_coords
+    cache.set("empty", [])
+    assert cache.get("empty") == []
+
+
+def test_get_set_seqtype(tmp_path: Path):
+    """test get & set align coords with sequence type"""
+    cache = AlignCache(tmp_path / "cache")
+    align_coords = [AlignCoord(1, 100, 201, 300, 100, 100, 85.5, "ref", "query")]
+    cache.set("key", align_coords, "protein")
+    assert cache.get("key", "protein") == align_coords
+    assert cache.get("key", "nucleotide") is None
+
+    # Cache file without sequence type line is regarded as not cached
+    cache._cache_file("old").write_text(align_coords[0].as_tsv_format + "\n")
+    assert cache.get("old") is None
+
+
+def test_evict(tmp_path: Path):
+    """test evict least recently used cache"""
+    align_coords = [AlignCoord(1, 100, 201, 300, 100, 100, 85.5, "ref", "query")]
+    cache = AlignCache(tmp_path / "cache", max_size=10**6)
+    for idx, key in enumerate(("old", "used", "new")):
+        cache.set(key, align_coords)
+        os.utime(cache._cache_file(key), (idx, idx))
+    cache.get("used")
+
+    cache.max_size = os.path.getsize(cache._cache_file("new")) * 2
+    cache.evict()
+    assert cache.get("old") is None
+    assert cache.get("used") is not None and cache.get("new") is not None
+
+
+def test_evict_stale_tmp_files(tmp_path: Path):
+    """test evict removes stale temporary files only"""
+    cache = AlignCache(tmp_path / "cache")
+    stale_tmp_file = cache.cache_dir / "stale.tmp"
+    stale_tmp_file.write_text("")
+    os.utime(stale_tmp_file, (0, 0))
+    fresh_tmp_file = cache.cache_dir / "fresh.tmp"
+    fresh_tmp_file.write_text("")
+
+    cache.evict()
+    assert not stale_tmp_file.exists() and fresh_tmp_file.exists()
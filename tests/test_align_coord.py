@@ -1,4 +1,10 @@
-from gbkviz.align_coord import AlignCoord
+from pathlib import Path
+
+import pytest
+from Bio.Graphics.GenomeDiagram import Track
+
+from gbkviz.align_coord import TSV_COLUMNS, AlignCoord, AlignCoordTable
+from gbkviz.genbank import Genbank
 
 
 def test_is_inverted():
@@ -27,6 +33,101 @@ def test_add_offset():
     )
 
 
+def test_flip():
+    """test flip"""
+    align_coord = AlignCoord(11, 100, 501, 600, 90, 100, 80.0, "ref", "query")
+    flip_align_coord = align_coord.flip(1000, None)
+    assert (flip_align_coord.ref_start, flip_align_coord.ref_end) == (990, 901)
+    assert (flip_align_coord.query_start, flip_align_coord.query_end) == (501, 600)
+    assert flip_align_coord.is_inverted is True
+    assert flip_align_coord.flip(1000, None) == align_coord
+
+
+def test_clip():
+    """test clip"""
+    align_coord = AlignCoord(101, 200, 600, 501, 100, 100, 80.0, "ref", "query")
+    # Not clipped
+    assert align_coord.clip(1, 1000, 1, 1000) == align_coord
+    # Clipped by reference range
+    clip_align_coord = align_coord.clip(151, 1000, 1, 1000)
+    assert clip_align_coord == AlignCoord(
+        151, 200, 550, 501, 50, 50, 80.0, "ref", "query"
+    )
+    # Clipped by both reference & query range
+    clip_align_coord = align_coord.clip(151, 1000, 511, 530)
+    assert clip_align_coord == AlignCoord(
+        171, 190, 530, 511, 20, 20, 80.0, "ref", "query"
+    )
+    # Out of range
+    assert align_coord.clip(1, 100, 1, 1000) is None
+    assert align_coord.clip(101, 150, 501, 540) is None
+
+
+def test_slice_range(genbank_file: Path):
+    """test slice range"""
+    ref_gbk = Genbank(genbank_file, name="ref", min_range=101, max_range=200)
+    query_gbk = Genbank(genbank_file, name="query", reverse=True)
+    full_length = query_gbk.full_length
+    align_coords = [
+        AlignCoord(1, 150, 1, 150, 150, 150, 80.0, "ref", "query"),
+        AlignCoord(1001, 1100, 1001, 1100, 100, 100, 90.0, "ref", "query"),
+    ]
+    range_align_coords = AlignCoord.slice_range(align_coords, [ref_gbk, query_gbk])
+    assert range_align_coords == [
+        AlignCoord(
+            1, 50, full_length - 100, full_length - 149, 50, 50, 80.0, "ref", "query"
+        )
+    ]
+
+
+def test_parse_stream():
+    """test parse stream"""
+    coords_lines = [
+        "1\t100\t201\t300\t100\t100\t95.50\tref\tquery\n",
+        "501\t600\t800\t701\t100\t100\t80.00\tref\tquery\n",
+    ]
+    align_coords = AlignCoord.parse_stream(coords_lines, "nucleotide")
+    assert align_coords == [
+        AlignCoord(1, 100, 201, 300, 100, 100, 95.5, "ref", "query"),
+        AlignCoord(501, 600, 800, 701, 100, 100, 80.0, "ref", "query"),
+    ]
+    with pytest.raises(ValueError):
+        AlignCoord.parse_stream(coords_lines, "protein")
+
+
+def test_parse_delta_stream():
+    """test parse delta stream"""
+    nucmer_delta_lines = [
+        "/path/to/ref.fa /path/to/query.fa\n",
+        "NUCMER\n",
+        ">ref query 1000 1000\n",
+        "501 600 800 701 2 2 0\n",
+        "10\n",
+        "-5\n",
+        "0\n",
+        "1 100 1 100 0 0 0\n",
+        "0\n",
+    ]
+    align_coords = AlignCoord.parse_delta_stream(nucmer_delta_lines)
+    assert align_coords == [
+        AlignCoord(1, 100, 1, 100, 100, 100, 100.0, "ref", "query"),
+        AlignCoord(501, 600, 800, 701, 100, 100, 98.02, "ref", "query"),
+    ]
+
+    promer_delta_lines = [
+        "/path/to/ref.fa /path/to/query.fa\n",
+        "PROMER\n",
+        ">ref query 1000 1000\n",
+        "300 1 1 300 3 2 0\n",
+        "0\n",
+    ]
+    align_coords = AlignCoord.parse_delta_stream(promer_delta_lines)
+    assert align_coords == [AlignCoord(300, 1, 1, 300, 300, 300, 97.0, "ref", "query")]
+
+    with pytest.raises(ValueError):
+        AlignCoord.parse_delta_stream(["1\t100\t1\t100\t100\t100\t95.5\tref\tq\n"])
+
+
 def test_filter():
     """test filter"""
     align_coords = [
@@ -46,3 +147,160 @@ def test_filter():
     assert len(AlignCoord.filter(align_coords, min_identity=95)) == 0
     # Both setting
     assert len(AlignCoord.filter(align_coords, 200, 70)) == 0
+
+
+def test_align_coord_table():
+    """test align coord table conversion & vectorized operations"""
+    align_coords = [
+        AlignCoord(11, 100, 501, 600, 90, 100, 80.0, "ref", "query"),
+        AlignCoord(100, 11, 501, 600, 150, 250, 90.5, "ref", "query"),
+        AlignCoord(1, 300, 1, 300, 300, 300, 60.0, "query", "other"),
+    ]
+    table = AlignCoordTable.from_align_coords(align_coords)
+    assert len(table) == 3
+    assert table.to_align_coords() == align_coords
+    assert table.is_inverted.tolist() == [ac.is_inverted for ac in align_coords]
+    assert table.to_tsv() == "".join([ac.as_tsv_format + "\n" for ac in align_coords])
+    assert table.to_tsv(header=True).split("\n")[0].startswith("REF_START\t")
+
+    # Filter
+    for min_length, min_identity in ((0, 0), (130, 0), (0, 70), (200, 70)):
+        assert table.filter(min_length, min_identity).to_align_coords() == (
+            AlignCoord.filter(align_coords, min_length, min_identity)
+        )
+
+    # Add offset
+    offset_table = table.add_offset({"ref": 100, "query": 150})
+    assert offset_table.to_align_coords() == [
+        align_coords[0].add_offset(100, 150),
+        align_coords[1].add_offset(100, 150),
+        align_coords[2].add_offset(150, 0),
+    ]
+
+    # Empty table
+    assert len(AlignCoordTable.from_align_coords([])) == 0
+    assert AlignCoordTable.from_align_coords([]).to_tsv() == ""
+    assert AlignCoordTable.from_align_coords([]).to_tsv(header=True) == (
+        "\t".join(TSV_COLUMNS) + "\n"
+    )
+
+
+def test_align_coord_table_slice_range(genbank_file: Path):
+    """test align coord table slice range matches flip & clip of each row"""
+    ref_gbk = Genbank(genbank_file, name="ref", min_range=101, max_range=5000)
+    query_gbk = Genbank(genbank_file, name="query", min_range=1001, reverse=True)
+    align_coords = [
+        AlignCoord(1, 150, 1, 150, 150, 150, 80.0, "ref", "query"),
+        AlignCoord(4001, 6000, 65000, 63001, 2000, 2000, 90.0, "ref", "query"),
+        AlignCoord(3000, 3000, 1001, 1100, 1, 100, 70.0, "ref", "query"),
+        AlignCoord(6001, 7000, 1001, 2000, 1000, 1000, 99.0, "ref", "query"),
+    ]
+    expected_align_coords = []
+    for ac in align_coords:
+        clip_ac = ac.flip(None, query_gbk.full_length).clip(
+            101, 5000, 1001, query_gbk.max_range
+        )
+        if clip_ac is not None:
+            expected_align_coords.append(clip_ac.add_offset(-100, -1000))
+    table = AlignCoordTable.from_align_coords(align_coords)
+    range_table = table.slice_range([ref_gbk, query_gbk])
+    assert len(range_table) == 3
+    assert range_table.to_align_coords() == expected_align_coords
+    assert len(AlignCoordTable.from_align_coords([]).slice_range([ref_gbk])) == 0
+
+
+def test_align_coord_table_concat():
+    """test align coord table concat"""
+    align_coords1 = [AlignCoord(1, 100, 1, 100, 100, 100, 80.0, "g1", "g2")]
+    align_coords2 = [
+        AlignCoord(1, 50, 50, 1, 50, 50, 90.0, "g2", "g3"),
+        AlignCoord(51, 70, 51, 70, 20, 20, 95.0, "g2", "g3"),
+    ]
+    table = AlignCoordTable.concat(
+        [
+            AlignCoordTable.from_align_coords(align_coords1),
+            AlignCoordTable.from_align_coords([]),
+            AlignCoordTable.from_align_coords(align_coords2),
+        ]
+    )
+    assert table.name_pool == ["g1", "g2", "g3"]
+    assert table.to_align_coords() == align_coords1 + align_coords2
+    assert len(AlignCoordTable.concat([])) == 0
+
+
+def test_align_coord_table_get_cross_links():
+    """test align coord table get cross links"""
+    align_coords = [
+        AlignCoord(11, 100, 501, 600, 90, 100, 80.0, "ref", "query"),
+        AlignCoord(100, 11, 501, 600, 90, 90, 95.57, "ref", "query"),
+        AlignCoord(1, 300, 300, 1, 300, 300, 15.0, "query", "other"),
+    ]
+    tracks = [Track(name) for name in ("ref", "query", "other")]
+    table = AlignCoordTable.from_align_coords(align_coords)
+    cross_links = table.get_cross_links(tracks, "#0000FF", "#FF0000")
+    assert len(cross_links) == len(align_coords)
+    for cross_link, ac in zip(cross_links, align_coords):
+        expected = ac.get_cross_link(tracks, "#0000FF", "#FF0000")
+        assert cross_link.featureA == expected.featureA
+        assert cross_link.featureB == expected.featureB
+        assert cross_link.color == expected.color
+        assert cross_link.border == expected.border
+        assert cross_link.flip == expected.flip
+    assert AlignCoordTable.from_align_coords([]).get_cross_links(tracks) == []
+
+
+def test_align_coord_table_simplify():
+    """test align coord table simplify"""
+    align_coords = [
+        # Collinear adjacent normal alignments
+        AlignCoord(1, 100, 1001, 1100, 100, 100, 90.0, "ref", "query"),
+        AlignCoord(105, 200, 1104, 1200, 96, 97, 92.0, "ref", "query"),
+        # Collinear adjacent inverted alignments
+        AlignCoord(300, 400, 600, 500, 101, 101, 80.0, "ref", "query"),
+        AlignCoord(402, 500, 498, 400, 99, 99, 81.0, "ref", "query"),
+        # Narrow alignment
+        AlignCoord(900, 902, 1, 3, 3, 3, 99.0, "ref", "query"),
+        # Apart alignment with dissimilar identity
+        AlignCoord(1000, 1100, 1, 100, 101, 100, 50.0, "ref", "query"),
+    ]
+    table = AlignCoordTable.from_align_coords(align_coords)
+    simple_table, merged_num, dropped_num = table.simplify(min_width=10, max_gap=10)
+    assert (merged_num, dropped_num) == (2, 1)
+    assert simple_table.to_align_coords() == [
+        AlignCoord(1, 200, 1001, 1200, 200, 200, 90.98, "ref", "query"),
+        AlignCoord(300, 500, 600, 400, 201, 201, 80.5, "ref", "query"),
+        align_coords[5],
+    ]
+
+    # Cap alignment count by keeping longer alignments
+    simple_table, merged_num, dropped_num = table.simplify(
+        min_width=10, max_gap=10, max_num=1
+    )
+    assert (merged_num, dropped_num) == (2, 3)
+    assert simple_table.to_align_coords() == [
+        AlignCoord(300, 500, 600, 400, 201, 201, 80.5, "ref", "query")
+    ]
+
+    # No simplification
+    simple_table, merged_num, dropped_num = table.simplify(
+        min_width=0, max_gap=-1, max_identity_diff=0
+    )
+    assert (merged_num, dropped_num) == (0, 0)
+    assert simple_table.to_align_coords() == align_coords
+
+    # Simplify only while alignment count exceeds max num
+    simple_table, merged_num, dropped_num = table.simplify(
+        min_width=10, max_gap=10, max_num=6
+    )
+    assert (merged_num, dropped_num) == (0, 0)
+    assert simple_table.to_align_coords() == align_coords
+    simple_table, merged_num, dropped_num = table.simplify(
+        min_width=10, max_gap=10, max_num=4
+    )
+    assert (merged_num, dropped_num) == (2, 0)
+    assert simple_table.to_align_coords() == [
+        AlignCoord(1, 200, 1001, 1200, 200, 200, 90.98, "ref", "query"),
+        AlignCoord(300, 500, 600, 400, 201, 201, 80.5, "ref", "query"),
+        align_coords[4],
+        align_coords[5],
+    ]
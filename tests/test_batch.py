@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from gbkviz import batch as batch_module
+from gbkviz.align_coord import TSV_COLUMNS
+from gbkviz.batch import load_manifest, run_batch
+from gbkviz.genome_align import GenomeAlign
+
+
+def write_manifest(manifest_file: Path, genbank_files: List[Path], **options):
+    """Write manifest of one panel per genbank file & one panel of all files"""
+    panels = [{"name": f.stem, "genbanks": [str(f)]} for f in genbank_files]
+    panels.append(
+        {
+            "name": "all",
+            "genbanks": [{"file": str(f), "reverse": True} for f in genbank_files],
+            "options": {"formats": ["png", "SVG"]},
+        }
+    )
+    manifest = {"outdir": "out", "options": options, "panels": panels}
+    manifest_file.write_text(json.dumps(manifest))
+
+
+def test_load_manifest(genbank_files: List[Path], tmp_path: Path):
+    """test load manifest"""
+    manifest_file = tmp_path / "manifest.json"
+    write_manifest(manifest_file, genbank_files, show_label=True)
+    panels = load_manifest(manifest_file)
+    assert len(panels) == len(genbank_files) + 1
+    assert all(p.outdir == tmp_path / "out" for p in panels)
+    assert all(p.options["show_label"] for p in panels)
+    assert panels[0].genbanks[0]["name"] == genbank_files[0].stem
+    assert panels[-1].options["formats"] == ["png", "svg"]
+    assert [p.name for p in panels[-1].outfiles] == ["all.png", "all.svg"]
+    assert panels[-1].genbanks[0]["reverse"] is True
+
+    write_manifest(manifest_file, genbank_files, invalid_option=True)
+    with pytest.raises(ValueError):
+        load_manifest(manifest_file)
+
+
+def test_run_batch(genbank_files: List[Path], tmp_path: Path):
+    """test run batch renders panels & skips up to date panels"""
+    manifest_file = tmp_path / "manifest.json"
+    write_manifest(manifest_file, genbank_files)
+    panels = load_manifest(manifest_file)
+    results = list(run_batch(panels, process_num=2))
+    assert sorted(status for _, status in results) == ["rendered"] * len(panels)
+    assert all(f.exists() for p in panels for f in p.outfiles)
+
+    # Only panel of changed options is rendered again
+    assert all(p.is_up_to_date() for p in panels)
+    manifest = json.loads(manifest_file.read_text())
+    manifest["panels"][0]["options"] = {"fig_width": 30}
+    manifest_file.write_text(json.dumps(manifest))
+    panels = load_manifest(manifest_file)
+    results = list(run_batch(panels))
+    assert [p.name for p, status in results if status == "rendered"] == [
+        genbank_files[0].stem
+    ]
+    assert len(results) == len(panels)
+
+
+def test_run_batch_cpu_budget(genbank_files: List[Path], tmp_path: Path, monkeypatch):
+    """test CPU count is split between panel processes & MUMmer jobs"""
+    executor_kwargs = {}
+
+    class ProcessPoolExecutor(batch_module.ProcessPoolExecutor):
+        def __init__(self, **kwargs):
+            executor_kwargs.update(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(batch_module, "ProcessPoolExecutor", ProcessPoolExecutor)
+    monkeypatch.setattr(batch_module.os, "cpu_count", lambda: 8)
+    manifest_file = tmp_path / "manifest.json"
+    write_manifest(manifest_file, genbank_files)
+    panels = load_manifest(manifest_file)
+    list(run_batch(panels, process_num=2))
+    assert executor_kwargs["max_workers"] == 2
+    assert executor_kwargs["initargs"] == (4,)
+
+
+def test_run_batch_empty_comparison(
+    genbank_files: List[Path], tmp_path: Path, monkeypatch
+):
+    """test comparison TSV file of no alignment has header line only"""
+    monkeypatch.setattr(GenomeAlign, "check_requirements", lambda: True)
+    manifest_file = tmp_path / "manifest.json"
+    write_manifest(manifest_file, genbank_files[0:1], seqtype="nucleotide")
+    panel = load_manifest(manifest_file)[0]
+    results = list(run_batch([panel], process_num=1))
+    assert results == [(panel, "rendered")]
+    tsv_file = panel.outdir / f"{panel.name}.tsv"
+    assert tsv_file.read_text() == "\t".join(TSV_COLUMNS) + "\n"
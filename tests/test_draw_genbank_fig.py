@@ -1,10 +1,19 @@
 from pathlib import Path
 from typing import List
 
+import pytest
+from gbkviz import draw_genbank_fig as draw_genbank_fig_module
+from gbkviz.align_coord import AlignCoord
 from gbkviz.draw_genbank_fig import DrawGenbankFig
 from gbkviz.genbank import Genbank
 
 
+@pytest.fixture(autouse=True)
+def clear_figure_cache():
+    """Clear process-wide rendered figure cache"""
+    draw_genbank_fig_module._FIGURE_CACHE.clear()
+
+
 def test_draw_genbank_fig(genbank_files: List[Path], tmp_path: Path):
     """test draw_genbank_fig"""
     gbk_list = [Genbank(gf, gf.name) for gf in genbank_files]
@@ -14,3 +23,171 @@ def test_draw_genbank_fig(genbank_files: List[Path], tmp_path: Path):
     gdf.write_figure(fig_png_outfile)
     gdf.write_figure(fig_svg_outfile)
     assert fig_png_outfile.exists() and fig_svg_outfile.exists()
+
+
+def test_draw_genbank_fig_range_query_count(genbank_file: Path, monkeypatch):
+    """test range features are queried only once per track (regression benchmark)"""
+    query_count = 0
+    extract_range_table = Genbank.extract_range_table
+
+    def count_extract_range_table(self, *args, **kwargs):
+        nonlocal query_count
+        query_count += 1
+        return extract_range_table(self, *args, **kwargs)
+
+    monkeypatch.setattr(Genbank, "extract_range_table", count_extract_range_table)
+
+    track_num = 20
+    gbk_list = [Genbank(genbank_file, f"track{i}") for i in range(track_num)]
+    gdf = DrawGenbankFig(gbk_list, max_feature=10)
+    assert gdf.max_range_feature == 94
+    assert query_count == track_num
+
+
+def test_draw_genbank_fig_lod(genbank_files: List[Path]):
+    """test level-of-detail drawing of too many features"""
+    gbk_list = [Genbank(gf, gf.name) for gf in genbank_files]
+    gdf = DrawGenbankFig(gbk_list, max_feature=10, fig_width=10)
+    for track in gdf.gd.get_tracks():
+        feature_num = sum(len(s.get_features()) for s in track.get_sets())
+        assert 0 < feature_num < gdf.max_range_feature
+    assert gdf.get_figure("png")
+
+
+def test_draw_genbank_fig_simplify_cross_links(genbank_files: List[Path]):
+    """test dense cross links are simplified in pixel resolution"""
+    gbk_list = [Genbank(f, f.stem) for f in genbank_files[0:2]]
+    ref_name, query_name = gbk_list[0].name, gbk_list[1].name
+    align_coords = []
+    for i in range(2000):
+        start, end = i * 10 + 1, i * 10 + 10
+        align_coords.append(
+            AlignCoord(start, end, start, end, 10, 10, 90.0, ref_name, query_name)
+        )
+
+    dgf = DrawGenbankFig(gbk_list, align_coords, max_cross_link=100)
+    assert len(dgf.align_coord_table) <= 100
+    assert dgf.merged_cross_link_num + dgf.dropped_cross_link_num == 2000 - len(
+        dgf.align_coord_table
+    )
+    assert dgf.merged_cross_link_num > 0
+
+    dgf = DrawGenbankFig(gbk_list, align_coords, max_cross_link=5000)
+    assert len(dgf.align_coord_table) == 2000
+    assert dgf.merged_cross_link_num == dgf.dropped_cross_link_num == 0
+
+
+def test_draw_genbank_fig_get_figure_memoized(genbank_file: Path, monkeypatch):
+    """test figure of each format is rendered lazily only once"""
+    gdf = DrawGenbankFig([Genbank(genbank_file)])
+    render_formats = []
+    write_to_string = gdf.gd.write_to_string
+
+    def write_to_string_counter(format: str):
+        render_formats.append(format)
+        return write_to_string(format)
+
+    monkeypatch.setattr(gdf.gd, "write_to_string", write_to_string_counter)
+    assert render_formats == []
+    png_bytes = gdf.get_figure("png")
+    assert gdf.get_figure("PNG") is png_bytes
+    assert gdf.get_figure("pdf") != png_bytes
+    assert render_formats == ["png", "pdf"]
+    assert gdf.get_figure("svg") is gdf.get_figure("svg")
+
+
+def test_draw_genbank_fig_figure_cache(genbank_files: List[Path]):
+    """test figure of same genomes & draw parameters is returned from cache"""
+    gdf = DrawGenbankFig([Genbank(f, f.stem) for f in genbank_files])
+    png_bytes = gdf.get_figure("png")
+
+    # Same genome contents & draw parameters
+    cached_gdf = DrawGenbankFig([Genbank(f, f.stem) for f in genbank_files])
+    assert cached_gdf.fingerprint == gdf.fingerprint
+    assert cached_gdf.get_figure("png") is png_bytes
+    assert cached_gdf._gd is None
+
+    # Different draw parameters or genome range
+    changed_gdf = DrawGenbankFig(
+        [Genbank(f, f.stem) for f in genbank_files], cross_link_color="#00FF00"
+    )
+    assert changed_gdf.fingerprint != gdf.fingerprint
+    gbk_list = [Genbank(f, f.stem) for f in genbank_files]
+    gbk_list[0].max_range -= 1
+    assert DrawGenbankFig(gbk_list).fingerprint != gdf.fingerprint
+
+
+def test_draw_genbank_fig_iter_tile_figures(genbank_files: List[Path]):
+    """test figure tiles are rendered in genome axis order & cached"""
+    gdf = DrawGenbankFig([Genbank(f, f.stem) for f in genbank_files])
+    tiles = list(gdf.iter_tile_figures(20000, "png", max_workers=2))
+    tile_regions = [(start, end) for start, end, _ in tiles]
+    assert tile_regions[0][0] == 0 and tile_regions[-1][1] == gdf.max_range_length
+    assert all(
+        end == next_start
+        for (_, end), (next_start, _) in zip(tile_regions, tile_regions[1:])
+    )
+    assert all(end - start <= 20000 for start, end in tile_regions)
+    for start, end, tile_png_bytes in tiles:
+        assert gdf.get_tile_figure(start, end, "png") is tile_png_bytes
+    with pytest.raises(ValueError):
+        list(gdf.iter_tile_figures(0))
+
+
+def test_draw_genbank_fig_tile_reuse(genbank_file: Path):
+    """test figure tiles on fixed genome grid are reused after panning"""
+    gdf = DrawGenbankFig([Genbank(genbank_file, "gbk", 1001, 41000)])
+    tiles = list(gdf.iter_tile_figures(5000, "png", max_workers=1))
+    assert [(start, end) for start, end, _ in tiles][0:2] == [(0, 4000), (4000, 9000)]
+
+    # Interior tiles of same genome region are reused
+    panned_gdf = DrawGenbankFig([Genbank(genbank_file, "gbk", 3501, 43500)])
+    panned_tiles = list(panned_gdf.iter_tile_figures(5000, "png", max_workers=1))
+    assert panned_tiles[1][0:2] == (1500, 6500)
+    for (_, _, figure), (_, _, panned_figure) in zip(tiles[1:-1], panned_tiles[1:-1]):
+        assert panned_figure is figure
+
+    # Tile length is increased to cap tile number
+    assert len(gdf.get_tile_regions(100, max_tile_num=10)) <= 10
+
+
+def test_draw_genbank_fig_track_workers(genbank_files: List[Path], monkeypatch):
+    """test tracks drawn in worker processes are composited same as serial"""
+    gbk_list = [Genbank(f, f.stem) for f in genbank_files]
+    align_coords = []
+    for ref_gbk, query_gbk in zip(gbk_list, gbk_list[1:]):
+        for i in range(50):
+            start, end = i * 500 + 1, i * 500 + 400
+            align_coords.append(
+                AlignCoord(
+                    start, end, end, start, 400, 400, 80.0, ref_gbk.name, query_gbk.name
+                )
+            )
+
+    svg = DrawGenbankFig(gbk_list, align_coords, show_label=True).get_figure("svg")
+    draw_genbank_fig_module._FIGURE_CACHE.clear()
+    monkeypatch.setattr(draw_genbank_fig_module, "get_max_worker_num", lambda: 2)
+    parallel_dgf = DrawGenbankFig(
+        gbk_list, align_coords, show_label=True, track_workers=2
+    )
+    assert parallel_dgf.get_figure("svg") == svg
+
+    # Tracks are drawn serially in untested Biopython version
+    draw_genbank_fig_module._FIGURE_CACHE.clear()
+    monkeypatch.setattr(
+        draw_genbank_fig_module, "PARALLEL_DRAW_BIOPYTHON_VERSIONS", ((0, 0), (0, 1))
+    )
+    serial_dgf = DrawGenbankFig(
+        gbk_list, align_coords, show_label=True, track_workers=2
+    )
+    with pytest.warns(UserWarning):
+        assert serial_dgf.get_figure("svg") == svg
+
+    # Tracks are drawn serially if max worker number of pool is 1
+    draw_genbank_fig_module._FIGURE_CACHE.clear()
+    monkeypatch.setattr(draw_genbank_fig_module, "get_max_worker_num", lambda: 1)
+    monkeypatch.setattr(draw_genbank_fig_module, "get_worker_pool", None)
+    serial_dgf = DrawGenbankFig(
+        gbk_list, align_coords, show_label=True, track_workers=2
+    )
+    assert serial_dgf.get_figure("svg") == svg
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from gbkviz.feature_index import FeatureIndex
+from gbkviz.genbank import Genbank
+
+
+def test_query():
+    """test query"""
+    types = ["CDS", "CDS", "tRNA", "CDS", "gene"]
+    starts = [10, 500, 800, 1500, 10]
+    ends = [300, 900, 870, 1800, 300]
+    index = FeatureIndex(types, starts, ends)
+    assert index.query(["CDS"], 1, 100) == [0]
+    assert index.query(["CDS"], 400, 1000) == [1]
+    assert index.query(["CDS", "tRNA"], 850, 1600) == [1, 2, 3]
+    assert index.query(["CDS", "gene"], 1, 2000) == [0, 1, 3, 4]
+    assert index.query(["misc_feature"], 1, 2000) == []
+
+
+def test_query_invalid_input():
+    """test query invalid input"""
+    with pytest.raises(ValueError):
+        FeatureIndex(["CDS"], [1, 2], [3])
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_genbank_range_query(genbank_file: Path, reverse: bool):
+    """test genbank range query matches linear scan"""
+    feature_types = ["CDS", "gene"]
+    for min_range, max_range in ((1, 1300), (5000, 30000), (60000, 66854)):
+        gbk = Genbank(genbank_file, "test", min_range, max_range, reverse)
+        expected_features = []
+        for f in gbk.extract_all_features(feature_types):
+            start, end = f.location.parts[0].start, f.location.parts[-1].end
+            if min_range <= start <= max_range or min_range <= end <= max_range:
+                expected_features.append(f.location)
+        actual_features = gbk.extract_range_features(feature_types)
+        assert [f.location for f in actual_features] == expected_features
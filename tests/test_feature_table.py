@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pytest
+from Bio import SeqIO
+from Bio.SeqFeature import FeatureLocation, SeqFeature
+from gbkviz.feature_table import FeatureQualifiers, FeatureTable
+
+
+def test_from_features(genbank_file: Path):
+    """test from features"""
+    record = SeqIO.read(genbank_file, "genbank")
+    table = FeatureTable.from_features(record.features)
+    assert len(table) == len(record.features)
+    assert table.types == [f.type for f in record.features]
+    assert table.starts.tolist() == [f.location.start for f in record.features]
+    assert table.get_labels("locus_tag") == [
+        f.qualifiers.get("locus_tag", [""])[0] for f in record.features
+    ]
+    with pytest.raises(ValueError):
+        table.get_labels("note")
+
+
+def test_take(genbank_file: Path):
+    """test take"""
+    record = SeqIO.read(genbank_file, "genbank")
+    table = FeatureTable.from_features(record.features)
+    rows = [3, 5, 8]
+    sub_table = table.take(rows)
+    assert len(sub_table) == 3
+    assert sub_table.ids.tolist() == rows
+    assert sub_table.get_labels("gene") == [table.get_labels("gene")[r] for r in rows]
+
+
+def test_flip(genbank_file: Path):
+    """test flip"""
+    record = SeqIO.read(genbank_file, "genbank")
+    reverse_record = record.reverse_complement()
+    table = FeatureTable.from_features(record.features).flip(len(record.seq))
+    expected_table = FeatureTable.from_features(reverse_record.features)
+    assert table.starts.tolist() == expected_table.starts.tolist()
+    assert table.ends.tolist() == expected_table.ends.tolist()
+    assert table.strands.tolist() == expected_table.strands.tolist()
+    assert table.types == expected_table.types
+
+
+def test_to_features(genbank_file: Path):
+    """test to features"""
+    record = SeqIO.read(genbank_file, "genbank")
+    features = FeatureTable.from_features(record.features).to_features()
+    assert [f.location for f in features] == [f.location for f in record.features]
+    assert [f.qualifiers.get("gene") for f in features] == [
+        f.qualifiers.get("gene") for f in record.features
+    ]
+
+
+def test_to_features_with_qualifiers(genbank_file: Path):
+    """test to features with all qualifiers"""
+    record = SeqIO.read(genbank_file, "genbank")
+    table = FeatureTable.from_features(record.features)
+    qualifiers = FeatureQualifiers.from_features(record.features)
+    assert len(qualifiers) == len(record.features)
+    features = table.flip(len(record.seq)).to_features(qualifiers=qualifiers)
+    assert sorted(str(dict(f.qualifiers)) for f in features) == sorted(
+        str(dict(f.qualifiers)) for f in record.features
+    )
+    # Aggregated blocks have no source feature qualifiers
+    aggregated_table = table.aggregate(len(record.seq))
+    for feature in aggregated_table.to_features(qualifiers=qualifiers):
+        assert "translation" not in feature.qualifiers
+
+
+def test_aggregate():
+    """test aggregate"""
+    features = [
+        SeqFeature(FeatureLocation(0, 100, 1), "CDS", qualifiers={"gene": ["a"]}),
+        SeqFeature(FeatureLocation(150, 300, 1), "CDS", qualifiers={"gene": ["b"]}),
+        SeqFeature(FeatureLocation(120, 200, -1), "CDS", qualifiers={"gene": ["c"]}),
+        SeqFeature(FeatureLocation(5000, 5100, 1), "CDS", qualifiers={"gene": ["d"]}),
+        SeqFeature(FeatureLocation(130, 140, 1), "tRNA", qualifiers={"gene": ["e"]}),
+    ]
+    table = FeatureTable.from_features(features).aggregate(bin_size=100)
+    rows = sorted(
+        zip(table.types, table.strands.tolist(), table.starts.tolist(), table.ends)
+    )
+    assert rows == [
+        ("CDS", -1, 120, 200),
+        ("CDS", 1, 0, 300),
+        ("CDS", 1, 5000, 5100),
+        ("tRNA", 1, 130, 140),
+    ]
+    # Labels & ids are kept only for single feature blocks
+    assert sorted(table.get_labels("gene")) == ["", "c", "d", "e"]
+    assert sorted(table.ids.tolist()) == [-1, 2, 3, 4]
+
+
+def test_aggregate_bounded(genbank_file: Path):
+    """test aggregated rows are bounded by bucket number"""
+    record = SeqIO.read(genbank_file, "genbank")
+    table = FeatureTable.from_features(record.features)
+    bin_size = len(record.seq) / 50
+    aggregated_table = table.aggregate(bin_size)
+    group_num = len(set(zip(table.types, table.strands.tolist())))
+    assert len(aggregated_table) <= group_num * 50
+    assert aggregated_table.starts.min() == table.starts.min()
+    assert aggregated_table.ends.max() == table.ends.max()
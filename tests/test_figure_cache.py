@@ -0,0 +1,32 @@
+from gbkviz.figure_cache import FigureCache
+
+
+def test_get_set():
+    """test get & set"""
+    cache = FigureCache()
+    assert cache.get("png") is None
+    cache.set("png", b"png figure")
+    cache.set("svg", "svg figure")
+    assert cache.get("png") == b"png figure"
+    assert cache.get("svg") == "svg figure"
+    cache.set("svg", "new svg figure")
+    assert cache.get("svg") == "new svg figure"
+    assert len(cache) == 2 and cache.size == len(b"png figure" + b"new svg figure")
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_evict():
+    """test least recently used figures are evicted"""
+    cache = FigureCache(max_size=30)
+    cache.set("fig1", b"0" * 10)
+    cache.set("fig2", b"0" * 10)
+    cache.set("fig3", b"0" * 10)
+    # Access fig1 to make fig2 least recently used
+    assert cache.get("fig1") is not None
+    cache.set("fig4", b"0" * 10)
+    assert cache.get("fig2") is None
+    assert all(cache.get(key) is not None for key in ("fig1", "fig3", "fig4"))
+    # Figure larger than max size is not cached
+    cache.set("large", b"0" * 31)
+    assert cache.get("large") is None and cache.size == 30
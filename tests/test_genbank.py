@@ -1,6 +1,12 @@
+import gzip
+from io import BytesIO
 from pathlib import Path
+from typing import List
 
-from gbkviz.genbank import Genbank
+import pytest
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from gbkviz.genbank import Genbank, _iter_locus_lines
 
 
 def test_full_length(genbank_file: Path):
@@ -45,3 +51,178 @@ def test_write_genome_fasta_range(genbank_file: Path, tmp_path: Path):
     tmp_outfile = tmp_path / "tmp_genome_range.fna"
     gbk.write_genome_fasta(tmp_outfile, range=True)
     assert tmp_outfile.exists()
+
+
+@pytest.mark.parametrize("range", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_write_genome_fasta_chunk(
+    genbank_file: Path, tmp_path: Path, range: bool, reverse: bool
+):
+    """test write genome fasta in chunks"""
+    gbk = Genbank(genbank_file, "test", min_range=10000, max_range=20000)
+    seq = gbk.record.reverse_complement().seq if reverse else gbk.record.seq
+    if range:
+        seq = seq[9999:20000]
+    record = SeqRecord(seq, id="test", description="")
+    for chunk_size in (1, 1000, 3001, 1024 * 1024):
+        tmp_outfile = tmp_path / "tmp_genome_chunk.fna"
+        gbk.write_genome_fasta(tmp_outfile, range, reverse, chunk_size)
+        assert tmp_outfile.read_text() == record.format("fasta")
+
+
+def test_reverse(genbank_file: Path, tmp_path: Path):
+    """test reverse strand record, features and genome fasta"""
+    gbk = Genbank(genbank_file, "test", min_range=10000, max_range=20000)
+    forward_range_features = gbk.extract_range_features()
+    reverse_record = gbk.record.reverse_complement()
+
+    gbk.reverse = True
+    assert gbk.record is gbk.record
+    assert str(gbk.record.seq) == str(reverse_record.seq)
+    assert [f.location for f in gbk.extract_all_features()] == [
+        f.location for f in reverse_record.features if f.type == "CDS"
+    ]
+    tmp_outfile = tmp_path / "tmp_genome_range_reverse.fna"
+    gbk.write_genome_fasta(tmp_outfile, range=True)
+    with open(tmp_outfile) as f:
+        assert "".join(f.read().splitlines()[1:]) == reverse_record.seq[9999:20000]
+
+    gbk.reverse = False
+    assert gbk.extract_range_features() == forward_range_features
+
+
+def test_multi_record(genbank_files: List[Path], tmp_path: Path):
+    """test multi-record genbank file"""
+    multi_record_file = tmp_path / "multi_record.gbk"
+    with open(multi_record_file, "w") as f:
+        for genbank_file in sorted(genbank_files):
+            f.write(genbank_file.read_text())
+
+    record_names = Genbank.get_record_names(multi_record_file)
+    assert record_names == ["JX128258", "MH051335", "MH816966", "MK373776"]
+    # LOCUS lines split across byte chunks are scanned
+    for chunk_size in (7, 100, 4096):
+        handle = BytesIO(multi_record_file.read_bytes())
+        locus_lines = list(_iter_locus_lines(handle, chunk_size))
+        assert [line.split()[1] for line in locus_lines] == record_names
+    with open(multi_record_file) as f:
+        assert Genbank.get_record_names(f) == record_names
+
+    assert Genbank(multi_record_file)._record.name == "JX128258"
+    gbk = Genbank(multi_record_file, record_name="MH816966")
+    assert gbk._record.name == "MH816966" and gbk.full_length == 68472
+    with pytest.raises(ValueError):
+        Genbank(multi_record_file, record_name="NOT_EXISTS")
+
+    gbk_list = list(Genbank.parse(multi_record_file, ["MH051335", "MK373776"]))
+    assert [gbk.name for gbk in gbk_list] == ["MH051335", "MK373776"]
+    assert [gbk.full_length for gbk in gbk_list] == [72179, 71283]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_compact(genbank_file: Path, reverse: bool):
+    """test compact feature table genbank"""
+    gbk = Genbank(genbank_file, "test", 5000, 30000, reverse)
+    compact_gbk = Genbank(genbank_file, "test", 5000, 30000, reverse, compact=True)
+    assert compact_gbk._record.features == []
+    assert compact_gbk.count_range_features() == gbk.count_range_features()
+    assert [f.location for f in compact_gbk.extract_range_features()] == [
+        f.location for f in gbk.extract_range_features()
+    ]
+    assert [f.qualifiers for f in compact_gbk.extract_range_features()] == [
+        f.qualifiers for f in gbk.extract_range_features()
+    ]
+    range_table = compact_gbk.extract_range_table(["CDS", "gene"])
+    assert range_table.starts.tolist() == [
+        f.location.parts[0].start for f in gbk.extract_range_features(["CDS", "gene"])
+    ]
+
+
+def test_content_hash(genbank_files: List[Path]):
+    """test content hash"""
+    gbk_file1, gbk_file2 = genbank_files[0:2]
+    content_hash = Genbank(gbk_file1).content_hash
+    assert content_hash == Genbank(gbk_file1, "other", 1, 100, True).content_hash
+    assert content_hash == Genbank(gbk_file1, compact=True).content_hash
+    assert content_hash != Genbank(gbk_file2).content_hash
+
+
+def test_view(genbank_file: Path):
+    """test view shares parsed data & has its own name, range, reverse"""
+    gbk = Genbank(genbank_file, "test", 100, 10000, compact=True)
+    gbk_view = gbk.view("view", 5000, 30000, True)
+    assert (gbk.name, gbk.min_range, gbk.max_range, gbk.reverse) == (
+        "test",
+        100,
+        10000,
+        False,
+    )
+    assert (gbk_view.name, gbk_view.range_length, gbk_view.reverse) == (
+        "view",
+        25001,
+        True,
+    )
+    assert gbk_view.view().max_range == gbk.full_length
+    assert (
+        gbk_view.count_range_features()
+        == Genbank(genbank_file, "", 5000, 30000, True).count_range_features()
+    )
+    # Reverse strand data computed in view is shared
+    assert gbk.view(reverse=True)._table is gbk_view._table
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_binary(genbank_file: Path, tmp_path: Path, reverse: bool):
+    """test binary pre-parsed genbank write & load"""
+    gbk = Genbank(genbank_file, "test", 5000, 30000, reverse, compact=True)
+    binary_file = tmp_path / "test.gbkbin"
+    gbk.write_binary(binary_file)
+    loaded_gbk = Genbank.load_binary(binary_file, "test", 5000, 30000, reverse)
+    assert (loaded_gbk.name, loaded_gbk.range_length) == ("test", 25001)
+    assert loaded_gbk.content_hash == gbk.content_hash
+    assert str(loaded_gbk.record.seq) == str(gbk.record.seq)
+    # Sequence is packed into 2-bit bases
+    assert binary_file.stat().st_size < gbk.full_length
+    # All qualifiers are restored same as parsed genbank
+    full_gbk = Genbank(genbank_file, "test", 5000, 30000, reverse)
+    assert [(f.location, f.qualifiers) for f in loaded_gbk.extract_all_features()] == [
+        (f.location, f.qualifiers) for f in full_gbk.extract_all_features()
+    ]
+    assert loaded_gbk.extract_range_table().types == gbk.extract_range_table().types
+    # Feature index is loaded without building again
+    feature_types = ["CDS", "gene", "tRNA"]
+    assert loaded_gbk.count_range_features(feature_types) == (
+        gbk.count_range_features(feature_types)
+    )
+
+    (tmp_path / "invalid.gbkbin").write_bytes(b"invalid")
+    with pytest.raises(ValueError):
+        Genbank.load_binary(tmp_path / "invalid.gbkbin")
+
+
+def test_binary_packed_sequence(tmp_path: Path):
+    """test binary genbank sequence with lowercase & non-ACGT bases"""
+    seq = "ACGTNNNNNacgtnnRYKMacGTACGTA" * 3 + "T"
+    gbk = Genbank(SeqRecord(Seq(seq), id="test", name="test"), compact=True)
+    binary_file = tmp_path / "test.gbkbin"
+    gbk.write_binary(binary_file)
+    loaded_seq = Genbank.load_binary(binary_file).record.seq
+    assert str(loaded_seq) == seq
+    for key in (slice(3, 18), slice(5, 6), slice(10, 2), slice(1, 40, 3)):
+        assert str(loaded_seq[key]) == seq[key]
+    assert str(loaded_seq[::-2]) == seq[::-2]
+    assert loaded_seq[9] == seq[9] and loaded_seq[-1] == seq[-1]
+    assert str(loaded_seq.reverse_complement()) == str(Seq(seq).reverse_complement())
+
+
+def test_gzip_and_binary_handle(genbank_file: Path, tmp_path: Path):
+    """test gzip compressed genbank file & binary handle are parsed in streaming"""
+    gz_genbank_file = tmp_path / "test.gbk.gz"
+    gz_genbank_file.write_bytes(gzip.compress(genbank_file.read_bytes()))
+    content_hash = Genbank(genbank_file).content_hash
+    assert Genbank(gz_genbank_file).content_hash == content_hash
+    for gbk_bytes in (genbank_file.read_bytes(), gz_genbank_file.read_bytes()):
+        handle = BytesIO(gbk_bytes)
+        assert Genbank.get_record_names(handle) == ["JX128258"]
+        assert Genbank(handle).content_hash == content_hash
+        assert not handle.closed
@@ -1,9 +1,24 @@
+import os
+import subprocess as sp
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+import pytest
+from gbkviz import genome_align as genome_align_module
+from gbkviz.align_cache import AlignCache
+from gbkviz.align_coord import AlignCoord
 from gbkviz.genome_align import GenomeAlign
 
 
+@pytest.fixture(autouse=True)
+def clear_pair_cache():
+    """Clear process-wide genome pair alignment cache"""
+    genome_align_module._PAIR_CACHE.clear()
+
+
 def test_genome_align_run_nucleotide(genome_fasta_files: List[Path], tmp_path: Path):
     """Test GenomeAlign run ('nucleotide' and 'one-to-one')"""
     genome_align = GenomeAlign(
@@ -14,9 +29,137 @@ def test_genome_align_run_nucleotide(genome_fasta_files: List[Path], tmp_path: P
 
 
 def test_genome_align_run_protein(genome_fasta_files: List[Path], tmp_path: Path):
-    """Test GenomeAlign run ('nucleotide' and 'one-to-one')"""
+    """Test GenomeAlign run ('protein' and 'many-to-many')"""
     genome_align = GenomeAlign(
         genome_fasta_files, tmp_path, seqtype="protein", maptype="many-to-many"
     )
     align_coords = genome_align.run()
     assert len(align_coords) != 0
+
+
+def _write_fake_mummer_bins(bin_dir: Path, delta_filter_script: str) -> None:
+    """Write fake nucmer & delta-filter scripts to bin directory"""
+    bin_dir.mkdir()
+    nucmer_script = (
+        "#!/bin/sh\n"
+        'for a in "$@"; do case $a in --prefix=*) p=${a#--prefix=};; esac; done\n'
+        "printf '%s %s\\nNUCMER\\n>r q 1000 1000\\n1 100 1 100 0 0 0\\n0\\n' "
+        '"$1" "$2" > $p.delta\n'
+    )
+    for name, script in (
+        ("nucmer", nucmer_script),
+        ("delta-filter", delta_filter_script),
+    ):
+        bin_file = bin_dir / name
+        bin_file.write_text(script)
+        bin_file.chmod(0o755)
+
+
+def test_genome_align_run_mummer_large_stderr(
+    genome_fasta_files: List[Path], tmp_path: Path, monkeypatch
+):
+    """Test GenomeAlign run is not blocked by large delta-filter stderr"""
+    delta_filter_script = (
+        "#!/bin/sh\n" "head -c 1000000 /dev/zero | tr '\\0' 'w' >&2\n" 'cat "$2"\n'
+    )
+    _write_fake_mummer_bins(tmp_path / "bin", delta_filter_script)
+    monkeypatch.setenv("PATH", f"{tmp_path / 'bin'}{os.pathsep}{os.environ['PATH']}")
+    genome_align = GenomeAlign(genome_fasta_files[0:2], tmp_path)
+    align_coords = genome_align._run_mummer(*genome_fasta_files[0:2], 0)
+    assert align_coords == [AlignCoord(1, 100, 1, 100, 100, 100, 100.0, "r", "q")]
+
+
+def test_genome_align_run_mummer_failed(
+    genome_fasta_files: List[Path], tmp_path: Path, monkeypatch
+):
+    """Test GenomeAlign run raises delta-filter error rather than parse error"""
+    delta_filter_script = (
+        "#!/bin/sh\n" 'head -n 1 "$2"\n' "echo 'delta-filter failed' >&2\n" "exit 1\n"
+    )
+    _write_fake_mummer_bins(tmp_path / "bin", delta_filter_script)
+    monkeypatch.setenv("PATH", f"{tmp_path / 'bin'}{os.pathsep}{os.environ['PATH']}")
+    genome_align = GenomeAlign(genome_fasta_files[0:2], tmp_path)
+    with pytest.raises(sp.CalledProcessError) as e:
+        genome_align._run_mummer(*genome_fasta_files[0:2], 0)
+    assert e.value.stderr == "delta-filter failed\n"
+
+
+def test_genome_align_run_cached(genome_fasta_files: List[Path], tmp_path: Path):
+    """Test GenomeAlign run with persistent alignment cache"""
+    cache_dir = tmp_path / "cache"
+    genome_align = GenomeAlign(genome_fasta_files, tmp_path, cache_dir=cache_dir)
+    expected_align_coords = []
+    for idx in range(genome_align.genome_num - 1):
+        fa_file1, fa_file2 = genome_fasta_files[idx], genome_fasta_files[idx + 1]
+        align_coord = AlignCoord(1, 100, 1, 100, 100, 100, 90.0, fa_file1.stem, "q")
+        key = AlignCache.make_key(fa_file1, fa_file2, "nucleotide", "one-to-one")
+        genome_align.cache.set(key, [align_coord])
+        expected_align_coords.append(align_coord)
+
+    assert genome_align.run() == expected_align_coords
+
+
+def test_genome_align_run_changed_pairs_only(
+    genome_fasta_files: List[Path], tmp_path: Path, monkeypatch
+):
+    """Test GenomeAlign run realigns changed genome pairs only"""
+
+    def _run_mummer(self, fa_file1: Path, fa_file2: Path, idx: int):
+        return [AlignCoord(1, 100, 1, 100, 100, 100, 90.0, fa_file1.name, "run")]
+
+    monkeypatch.setattr(GenomeAlign, "_run_mummer", _run_mummer)
+    align_coords = GenomeAlign(genome_fasta_files, tmp_path).run()
+    assert [ac.query_name for ac in align_coords] == ["run"] * 3
+
+    # Cached results are reused for unchanged genome pairs
+    def _run_mummer(self, fa_file1: Path, fa_file2: Path, idx: int):
+        return [AlignCoord(1, 100, 1, 100, 100, 100, 90.0, fa_file1.name, "rerun")]
+
+    monkeypatch.setattr(GenomeAlign, "_run_mummer", _run_mummer)
+    changed_fasta_file = tmp_path / "changed.fa"
+    changed_fasta_file.write_text(">changed\nATGC\n")
+    changed_genome_fasta_files = list(genome_fasta_files)
+    changed_genome_fasta_files[-1] = changed_fasta_file
+    align_coords = GenomeAlign(changed_genome_fasta_files, tmp_path).run()
+    assert [ac.query_name for ac in align_coords] == ["run", "run", "rerun"]
+
+
+def test_genome_align_run_bounded_jobs(
+    genome_fasta_files: List[Path], tmp_path: Path, monkeypatch
+):
+    """Test GenomeAlign runs MUMmer jobs in parallel up to max job number"""
+    # Replace module executor, so that original one is restored after test
+    monkeypatch.setattr(genome_align_module, "_JOB_EXECUTOR", ThreadPoolExecutor(1))
+    max_job_num = 2
+    genome_align_module.set_max_job_num(max_job_num)
+
+    lock = threading.Lock()
+    all_running = threading.Event()
+    job_counter = {"running": 0, "max_running": 0}
+
+    def _run_mummer(self, fa_file1: Path, fa_file2: Path, idx: int):
+        with lock:
+            job_counter["running"] += 1
+            job_counter["max_running"] = max(
+                job_counter["max_running"], job_counter["running"]
+            )
+            if job_counter["running"] == max_job_num:
+                all_running.set()
+        # Hold each job until max number of jobs run at once
+        all_running.wait(timeout=5)
+        time.sleep(0.05)
+        with lock:
+            job_counter["running"] -= 1
+        return [AlignCoord(1, 100, 1, 100, 100, 100, 90.0, fa_file1.name, "run")]
+
+    monkeypatch.setattr(GenomeAlign, "_run_mummer", _run_mummer)
+
+    # Submit more genome pairs than max job number
+    fasta_files = genome_fasta_files + genome_fasta_files
+    try:
+        align_coords = GenomeAlign(fasta_files, tmp_path).run()
+    finally:
+        genome_align_module._JOB_EXECUTOR.shutdown(wait=True)
+    assert len(align_coords) == len(fasta_files) - 1 > max_job_num
+    assert all_running.is_set()
+    assert job_counter["max_running"] == max_job_num
@@ -0,0 +1,68 @@
+from io import BytesIO
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from gbkviz.genome_store import GenomeStore
+
+
+def test_get(genbank_file: Path):
+    """test same genome is parsed once & returned as independent views"""
+    store = GenomeStore()
+    gbk1 = store.get(genbank_file, "gbk1")
+    # Same genome contents from binary handle
+    gbk2 = store.get(BytesIO(genbank_file.read_bytes()), "gbk2")
+    assert len(store) == 1 and store.size == gbk1.nbytes
+    assert gbk1 is not gbk2 and gbk1._data is gbk2._data
+    gbk1.min_range, gbk1.max_range, gbk1.reverse = 100, 1000, True
+    gbk2 = store.get(genbank_file, "gbk2")
+    assert (gbk2.name, gbk2.min_range, gbk2.max_range, gbk2.reverse) == (
+        "gbk2",
+        1,
+        gbk2.full_length,
+        False,
+    )
+    store.clear()
+    assert len(store) == 0 and store.size == 0
+
+
+def test_evict(genbank_files: List[Path]):
+    """test least recently used genomes are evicted"""
+    gbk_bytes_list = [BytesIO(f.read_bytes()) for f in genbank_files[0:3]]
+    max_size = GenomeStore().get(gbk_bytes_list[0]).nbytes * 2.5
+    store = GenomeStore(max_size=int(max_size))
+    gbk1 = store.get(gbk_bytes_list[0])
+    store.get(gbk_bytes_list[1])
+    # Access genome 1 to make genome 2 least recently used
+    assert store.get(gbk_bytes_list[0])._data is gbk1._data
+    store.get(gbk_bytes_list[2])
+    assert len(store) == 2 and store.size <= max_size
+    assert store.get(gbk_bytes_list[0])._data is gbk1._data
+
+
+def test_binary_cache(genbank_file: Path, tmp_path: Path):
+    """test genbank first seen is written as binary & loaded on later"""
+    gbk = GenomeStore(cache_dir=tmp_path).get(genbank_file, "gbk")
+    assert len(list(tmp_path.glob("*.gbkbin"))) == 1
+
+    loaded_gbk = GenomeStore(cache_dir=tmp_path).get(genbank_file, "gbk")
+    assert isinstance(loaded_gbk._data.feature_table.starts, np.memmap)
+    assert loaded_gbk.content_hash == gbk.content_hash
+    assert loaded_gbk.count_range_features() == gbk.count_range_features()
+
+
+def test_get_all(genbank_files: List[Path]):
+    """test genomes are parsed in parallel & returned in input order"""
+    gbk_files = [genbank_files[0], genbank_files[1], genbank_files[0], genbank_files[2]]
+    progress = []
+    store = GenomeStore()
+    gbk_list = store.get_all(
+        gbk_files,
+        names=["gbk1", "gbk2", "gbk3", "gbk4"],
+        process_num=2,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+    assert [gbk.name for gbk in gbk_list] == ["gbk1", "gbk2", "gbk3", "gbk4"]
+    assert len(store) == 3 and gbk_list[0]._data is gbk_list[2]._data
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert store.get(genbank_files[1]).content_hash == gbk_list[1].content_hash
@@ -0,0 +1,19 @@
+import os
+
+from gbkviz import worker_pool
+
+
+def test_cpu_budget(monkeypatch):
+    """test CPU count is split between worker pool & MUMmer jobs"""
+    for cpu_num, max_worker_num, max_job_num in ((1, 1, 1), (2, 1, 1), (8, 4, 4)):
+        monkeypatch.setattr(os, "cpu_count", lambda: cpu_num)
+        assert worker_pool.get_max_worker_num() == max_worker_num
+        assert worker_pool.get_max_job_num() == max_job_num
+
+
+def test_get_worker_pool():
+    """test get shared worker pool started by spawn"""
+    pool = worker_pool.get_worker_pool()
+    assert pool is worker_pool.get_worker_pool()
+    assert pool._mp_context.get_start_method() == "spawn"
+    assert pool.submit(os.getpid).result() != os.getpid()